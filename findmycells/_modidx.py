@@ -139,6 +139,8 @@ d = { 'settings': { 'branch': 'main',
             'findmycells.database': { 'findmycells.database.Database': ('api/database.html#database', 'findmycells/database.py'),
                                       'findmycells.database.Database.__init__': ( 'api/database.html#database.__init__',
                                                                                   'findmycells/database.py'),
+                                      'findmycells.database.Database.__setstate__': ( 'api/database.html#database.__setstate__',
+                                                                                      'findmycells/database.py'),
                                       'findmycells.database.Database._add_new_file_history_tracker': ( 'api/database.html#database._add_new_file_history_tracker',
                                                                                                        'findmycells/database.py'),
                                       'findmycells.database.Database._add_new_files_to_database': ( 'api/database.html#database._add_new_files_to_database',
@@ -161,12 +163,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'findmycells/database.py'),
                                       'findmycells.database.Database._find_or_create_subdir': ( 'api/database.html#database._find_or_create_subdir',
                                                                                                 'findmycells/database.py'),
+                                      'findmycells.database.Database._get_file_ids_by_source_file': ( 'api/database.html#database._get_file_ids_by_source_file',
+                                                                                                      'findmycells/database.py'),
                                       'findmycells.database.Database._get_file_ids_with_quantification_results_in_area_id': ( 'api/database.html#database._get_file_ids_with_quantification_results_in_area_id',
                                                                                                                               'findmycells/database.py'),
                                       'findmycells.database.Database._get_next_available_file_id': ( 'api/database.html#database._get_next_available_file_id',
                                                                                                      'findmycells/database.py'),
+                                      'findmycells.database.Database._get_postprocessed_segmentations_dir_path': ( 'api/database.html#database._get_postprocessed_segmentations_dir_path',
+                                                                                                                   'findmycells/database.py'),
                                       'findmycells.database.Database._get_results_overview_dataframe_for_export': ( 'api/database.html#database._get_results_overview_dataframe_for_export',
                                                                                                                     'findmycells/database.py'),
+                                      'findmycells.database.Database._get_source_file_key': ( 'api/database.html#database._get_source_file_key',
+                                                                                              'findmycells/database.py'),
+                                      'findmycells.database.Database._identify_changed_subject_dirs': ( 'api/database.html#database._identify_changed_subject_dirs',
+                                                                                                        'findmycells/database.py'),
                                       'findmycells.database.Database._identify_removed_files': ( 'api/database.html#database._identify_removed_files',
                                                                                                  'findmycells/database.py'),
                                       'findmycells.database.Database._initialize_all_top_level_subdirectories': ( 'api/database.html#database._initialize_all_top_level_subdirectories',
@@ -189,8 +199,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                          'findmycells/database.py'),
                                       'findmycells.database.Database._remove_file_id_from_quantification_results': ( 'api/database.html#database._remove_file_id_from_quantification_results',
                                                                                                                      'findmycells/database.py'),
+                                      'findmycells.database.Database._take_microscopy_images_snapshot': ( 'api/database.html#database._take_microscopy_images_snapshot',
+                                                                                                          'findmycells/database.py'),
                                       'findmycells.database.Database.compute_file_infos': ( 'api/database.html#database.compute_file_infos',
                                                                                             'findmycells/database.py'),
+                                      'findmycells.database.Database.create_file_specific_copy': ( 'api/database.html#database.create_file_specific_copy',
+                                                                                                   'findmycells/database.py'),
                                       'findmycells.database.Database.export_quantification_results': ( 'api/database.html#database.export_quantification_results',
                                                                                                        'findmycells/database.py'),
                                       'findmycells.database.Database.get_file_ids_to_process': ( 'api/database.html#database.get_file_ids_to_process',
@@ -199,8 +213,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'findmycells/database.py'),
                                       'findmycells.database.Database.import_rois_dict': ( 'api/database.html#database.import_rois_dict',
                                                                                           'findmycells/database.py'),
+                                      'findmycells.database.Database.load_postprocessed_segmentations': ( 'api/database.html#database.load_postprocessed_segmentations',
+                                                                                                          'findmycells/database.py'),
+                                      'findmycells.database.Database.merge_file_specific_copy': ( 'api/database.html#database.merge_file_specific_copy',
+                                                                                                  'findmycells/database.py'),
                                       'findmycells.database.Database.remove_file_id_from_project': ( 'api/database.html#database.remove_file_id_from_project',
                                                                                                      'findmycells/database.py'),
+                                      'findmycells.database.Database.save_postprocessed_segmentations': ( 'api/database.html#database.save_postprocessed_segmentations',
+                                                                                                          'findmycells/database.py'),
                                       'findmycells.database.Database.update_file_infos': ( 'api/database.html#database.update_file_infos',
                                                                                            'findmycells/database.py'),
                                       'findmycells.database.FileHistory': ('api/database.html#filehistory', 'findmycells/database.py'),
@@ -215,7 +235,22 @@ d = { 'settings': { 'branch': 'main',
                                       'findmycells.database.FileHistory.mark_processing_step_as_completed': ( 'api/database.html#filehistory.mark_processing_step_as_completed',
                                                                                                               'findmycells/database.py'),
                                       'findmycells.database.FileHistory.track_processing_strat': ( 'api/database.html#filehistory.track_processing_strat',
-                                                                                                   'findmycells/database.py')},
+                                                                                                   'findmycells/database.py'),
+                                      'findmycells.database.FileInfos': ('api/database.html#fileinfos', 'findmycells/database.py'),
+                                      'findmycells.database.FileInfos.__init__': ( 'api/database.html#fileinfos.__init__',
+                                                                                   'findmycells/database.py'),
+                                      'findmycells.database.FileInfos._rebuild_row_index': ( 'api/database.html#fileinfos._rebuild_row_index',
+                                                                                             'findmycells/database.py'),
+                                      'findmycells.database.FileInfos.append_row': ( 'api/database.html#fileinfos.append_row',
+                                                                                     'findmycells/database.py'),
+                                      'findmycells.database.FileInfos.contains_file_id': ( 'api/database.html#fileinfos.contains_file_id',
+                                                                                           'findmycells/database.py'),
+                                      'findmycells.database.FileInfos.get_row': ( 'api/database.html#fileinfos.get_row',
+                                                                                  'findmycells/database.py'),
+                                      'findmycells.database.FileInfos.get_row_index': ( 'api/database.html#fileinfos.get_row_index',
+                                                                                        'findmycells/database.py'),
+                                      'findmycells.database.FileInfos.remove_row': ( 'api/database.html#fileinfos.remove_row',
+                                                                                     'findmycells/database.py')},
             'findmycells.inspection.methods': { 'findmycells.inspection.methods.InspectSinglePlane': ( 'api/inspection_00_methods.html#inspectsingleplane',
                                                                                                        'findmycells/inspection/methods.py'),
                                                 'findmycells.inspection.methods.InspectSinglePlane._convert_image_and_mask_to_correct_2d_format': ( 'api/inspection_00_methods.html#inspectsingleplane._convert_image_and_mask_to_correct_2d_format',
@@ -305,24 +340,32 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._assert_and_update_input': ( 'api/interfaces.html#api._assert_and_update_input',
                                                                                                  'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._assert_and_update_pickled_status_filepaths': ( 'api/interfaces.html#api._assert_and_update_pickled_status_filepaths',
+                                                                                                                    'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._assert_and_update_reader_configs_input': ( 'api/interfaces.html#api._assert_and_update_reader_configs_input',
                                                                                                                 'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._assert_processing_step_input': ( 'api/interfaces.html#api._assert_processing_step_input',
                                                                                                       'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._assert_reader_configs_are_present': ( 'api/interfaces.html#api._assert_reader_configs_are_present',
                                                                                                            'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._assert_streaming_of_segmentations_is_possible': ( 'api/interfaces.html#api._assert_streaming_of_segmentations_is_possible',
+                                                                                                                       'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._check_if_all_files_have_finished_current_processing_step': ( 'api/interfaces.html#api._check_if_all_files_have_finished_current_processing_step',
                                                                                                                                   'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._fill_processing_configs_with_defaults_where_needed': ( 'api/interfaces.html#api._fill_processing_configs_with_defaults_where_needed',
                                                                                                                             'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._fill_strategy_configs_with_defaults_where_needed': ( 'api/interfaces.html#api._fill_strategy_configs_with_defaults_where_needed',
                                                                                                                           'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._get_project_store': ( 'api/interfaces.html#api._get_project_store',
+                                                                                           'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._load_object_from_filepath': ( 'api/interfaces.html#api._load_object_from_filepath',
                                                                                                    'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._look_for_latest_status_file_in_dir': ( 'api/interfaces.html#api._look_for_latest_status_file_in_dir',
                                                                                                             'findmycells/interfaces.py'),
-                                        'findmycells.interfaces.API._save_attr_to_disk': ( 'api/interfaces.html#api._save_attr_to_disk',
-                                                                                           'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._prepare_project_wide_preprocessing_strategies': ( 'api/interfaces.html#api._prepare_project_wide_preprocessing_strategies',
+                                                                                                                       'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API._run_file_wise_processing': ( 'api/interfaces.html#api._run_file_wise_processing',
+                                                                                                  'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._segment_running_strategies_consecutively': ( 'api/interfaces.html#api._segment_running_strategies_consecutively',
                                                                                                                   'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API._segment_running_strategies_individually': ( 'api/interfaces.html#api._segment_running_strategies_individually',
@@ -343,6 +386,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.quantify': ( 'api/interfaces.html#api.quantify',
                                                                                  'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API.save_checkpoint': ( 'api/interfaces.html#api.save_checkpoint',
+                                                                                        'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.save_status': ( 'api/interfaces.html#api.save_status',
                                                                                     'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.segment': ( 'api/interfaces.html#api.segment',
@@ -351,6 +396,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.set_roi_reader_configs': ( 'api/interfaces.html#api.set_roi_reader_configs',
                                                                                                'findmycells/interfaces.py'),
+                                        'findmycells.interfaces.API.set_stack_storage_configs': ( 'api/interfaces.html#api.set_stack_storage_configs',
+                                                                                                  'findmycells/interfaces.py'),
                                         'findmycells.interfaces.API.update_database_with_current_source_files': ( 'api/interfaces.html#api.update_database_with_current_source_files',
                                                                                                                   'findmycells/interfaces.py'),
                                         'findmycells.interfaces.GUI': ('api/interfaces.html#gui', 'findmycells/interfaces.py'),
@@ -528,6 +575,22 @@ d = { 'settings': { 'branch': 'main',
                                                                                                          'findmycells/interfaces.py'),
                                         'findmycells.interfaces.StrategyConfigurator._remove_own_tab_from_parent_accordion': ( 'api/interfaces.html#strategyconfigurator._remove_own_tab_from_parent_accordion',
                                                                                                                                'findmycells/interfaces.py'),
+                                        'findmycells.interfaces._AutosaveScheduler': ( 'api/interfaces.html#_autosavescheduler',
+                                                                                       'findmycells/interfaces.py'),
+                                        'findmycells.interfaces._AutosaveScheduler.__init__': ( 'api/interfaces.html#_autosavescheduler.__init__',
+                                                                                                'findmycells/interfaces.py'),
+                                        'findmycells.interfaces._AutosaveScheduler.add_processed_file_ids': ( 'api/interfaces.html#_autosavescheduler.add_processed_file_ids',
+                                                                                                              'findmycells/interfaces.py'),
+                                        'findmycells.interfaces._AutosaveScheduler.save_pending_checkpoint': ( 'api/interfaces.html#_autosavescheduler.save_pending_checkpoint',
+                                                                                                               'findmycells/interfaces.py'),
+                                        'findmycells.interfaces._collect_file_specific_preprocessing_data': ( 'api/interfaces.html#_collect_file_specific_preprocessing_data',
+                                                                                                              'findmycells/interfaces.py'),
+                                        'findmycells.interfaces._postprocess_single_file': ( 'api/interfaces.html#_postprocess_single_file',
+                                                                                             'findmycells/interfaces.py'),
+                                        'findmycells.interfaces._preprocess_single_file': ( 'api/interfaces.html#_preprocess_single_file',
+                                                                                            'findmycells/interfaces.py'),
+                                        'findmycells.interfaces._quantify_single_file': ( 'api/interfaces.html#_quantify_single_file',
+                                                                                          'findmycells/interfaces.py'),
                                         'findmycells.interfaces.launch_gui': ( 'api/interfaces.html#launch_gui',
                                                                                'findmycells/interfaces.py')},
             'findmycells.postprocessing.specs': { 'findmycells.postprocessing.specs.PostprocessingObject': ( 'api/postprocessing_00_specs.html#postprocessingobject',
@@ -544,6 +607,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                          'findmycells/postprocessing/specs.py'),
                                                   'findmycells.postprocessing.specs.PostprocessingObject.processing_type': ( 'api/postprocessing_00_specs.html#postprocessingobject.processing_type',
                                                                                                                              'findmycells/postprocessing/specs.py'),
+                                                  'findmycells.postprocessing.specs.PostprocessingObject.run_all_strategies': ( 'api/postprocessing_00_specs.html#postprocessingobject.run_all_strategies',
+                                                                                                                                'findmycells/postprocessing/specs.py'),
                                                   'findmycells.postprocessing.specs.PostprocessingObject.save_postprocessed_segmentations': ( 'api/postprocessing_00_specs.html#postprocessingobject.save_postprocessed_segmentations',
                                                                                                                                               'findmycells/postprocessing/specs.py'),
                                                   'findmycells.postprocessing.specs.PostprocessingObject.tooltips': ( 'api/postprocessing_00_specs.html#postprocessingobject.tooltips',
@@ -574,14 +639,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                 'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat._get_max_z_expansion': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat._get_max_z_expansion',
                                                                                                                                                    'findmycells/postprocessing/strategies.py'),
-                                                       'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat._get_relative_position': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat._get_relative_position',
-                                                                                                                                                     'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat._get_plane_indices_per_label_id': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat._get_plane_indices_per_label_id',
+                                                                                                                                                              'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat._get_relative_positions': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat._get_relative_positions',
+                                                                                                                                                      'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat.default_configs': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat.default_configs',
                                                                                                                                               'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat.descriptions': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat.descriptions',
                                                                                                                                            'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat.dropdown_option_value_for_gui': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat.dropdown_option_value_for_gui',
                                                                                                                                                             'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat.relative_positions_in_order_of_proximity': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat.relative_positions_in_order_of_proximity',
+                                                                                                                                                                       'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat.run': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat.run',
                                                                                                                                   'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ApplyExclusionCriteriaStrat.tooltips': ( 'api/postprocessing_01_strategies.html#applyexclusioncriteriastrat.tooltips',
@@ -594,6 +663,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                          'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.FillHolesStrat._fill_holes_in_all_planes_of_mask_stack': ( 'api/postprocessing_01_strategies.html#fillholesstrat._fill_holes_in_all_planes_of_mask_stack',
                                                                                                                                                          'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.FillHolesStrat._fill_holes_in_single_plane': ( 'api/postprocessing_01_strategies.html#fillholesstrat._fill_holes_in_single_plane',
+                                                                                                                                             'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.FillHolesStrat.default_configs': ( 'api/postprocessing_01_strategies.html#fillholesstrat.default_configs',
                                                                                                                                  'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.FillHolesStrat.descriptions': ( 'api/postprocessing_01_strategies.html#fillholesstrat.descriptions',
@@ -614,6 +685,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                                    'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_final_id_assignments': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_final_id_assignments',
                                                                                                                                                                           'findmycells/postprocessing/strategies.py'),
+                                                       'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_overlapping_label_ids': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_overlapping_label_ids',
+                                                                                                                                                                           'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._get_plane_to_plane_roi_matching_results': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._get_plane_to_plane_roi_matching_results',
                                                                                                                                                                                          'findmycells/postprocessing/strategies.py'),
                                                        'findmycells.postprocessing.strategies.ReconstructCellsIn3DFrom2DInstanceLabelsStrat._roi_matching': ( 'api/postprocessing_01_strategies.html#reconstructcellsin3dfrom2dinstancelabelsstrat._roi_matching',
@@ -644,6 +717,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                     'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject._load_microscopy_image': ( 'api/preprocessing_00_specs.html#preprocessingobject._load_microscopy_image',
                                                                                                                                  'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingObject._load_microscopy_image_metadata': ( 'api/preprocessing_00_specs.html#preprocessingobject._load_microscopy_image_metadata',
+                                                                                                                                          'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject._load_rois': ( 'api/preprocessing_00_specs.html#preprocessingobject._load_rois',
                                                                                                                      'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingObject._processing_specific_preparations': ( 'api/preprocessing_00_specs.html#preprocessingobject._processing_specific_preparations',
@@ -670,20 +745,48 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                        'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingStrategy': ( 'api/preprocessing_00_specs.html#preprocessingstrategy',
                                                                                                             'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.add_project_wide_data_to_configs': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.add_project_wide_data_to_configs',
+                                                                                                                                             'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.collect_file_specific_data': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.collect_file_specific_data',
+                                                                                                                                       'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.determine_region_to_read': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.determine_region_to_read',
+                                                                                                                                     'findmycells/preprocessing/specs.py'),
                                                  'findmycells.preprocessing.specs.PreprocessingStrategy.processing_type': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.processing_type',
-                                                                                                                            'findmycells/preprocessing/specs.py')},
+                                                                                                                            'findmycells/preprocessing/specs.py'),
+                                                 'findmycells.preprocessing.specs.PreprocessingStrategy.requires_project_wide_preparation': ( 'api/preprocessing_00_specs.html#preprocessingstrategy.requires_project_wide_preparation',
+                                                                                                                                              'findmycells/preprocessing/specs.py')},
             'findmycells.preprocessing.strategies': { 'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat',
                                                                                                                                  'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._add_strategy_specific_infos_to_updates': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._add_strategy_specific_infos_to_updates',
                                                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._adjust_brightness_and_contrast': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._adjust_brightness_and_contrast',
                                                                                                                                                                  'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._compute_histogram': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._compute_histogram',
+                                                                                                                                                    'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._compute_in_range': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._compute_in_range',
+                                                                                                                                                   'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._compute_in_range_from_histogram': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._compute_in_range_from_histogram',
+                                                                                                                                                                  'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._compute_percentile_from_cumulative_counts': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._compute_percentile_from_cumulative_counts',
+                                                                                                                                                                            'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._create_lookup_table': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._create_lookup_table',
+                                                                                                                                                      'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._get_channel_slices': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._get_channel_slices',
+                                                                                                                                                     'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat._uses_histograms': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat._uses_histograms',
+                                                                                                                                                  'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.add_project_wide_data_to_configs': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.add_project_wide_data_to_configs',
+                                                                                                                                                                  'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.collect_file_specific_data': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.collect_file_specific_data',
+                                                                                                                                                            'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.default_configs': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.default_configs',
                                                                                                                                                  'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.descriptions': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.descriptions',
                                                                                                                                               'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.dropdown_option_value_for_gui',
                                                                                                                                                                'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.requires_project_wide_preparation': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.requires_project_wide_preparation',
+                                                                                                                                                                   'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.run': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.run',
                                                                                                                                      'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.AdjustBrightnessAndContrastStrat.tooltips': ( 'api/preprocessing_01_strategies.html#adjustbrightnessandcontraststrat.tooltips',
@@ -694,14 +797,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                    'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat._add_strategy_specific_infos_to_updates': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat._add_strategy_specific_infos_to_updates',
                                                                                                                                                            'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat._convert_chunk_to_8bit': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat._convert_chunk_to_8bit',
+                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat._convert_to_8bit': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat._convert_to_8bit',
                                                                                                                                     'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat._determine_bit_depth': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat._determine_bit_depth',
+                                                                                                                                        'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.default_configs': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.default_configs',
                                                                                                                                    'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.descriptions': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.descriptions',
                                                                                                                                 'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.dropdown_option_value_for_gui',
                                                                                                                                                  'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.ConvertTo8BitStrat.max_elements_per_chunk': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.max_elements_per_chunk',
+                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.run': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.run',
                                                                                                                        'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.ConvertTo8BitStrat.tooltips': ( 'api/preprocessing_01_strategies.html#convertto8bitstrat.tooltips',
@@ -712,8 +821,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._add_strategy_specific_infos_to_updates': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._add_strategy_specific_infos_to_updates',
                                                                                                                                                                        'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._count_artefact_pixels_per_row_and_column': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._count_artefact_pixels_per_row_and_column',
+                                                                                                                                                                         'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._determine_cropping_indices_for_entire_zstack': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._determine_cropping_indices_for_entire_zstack',
                                                                                                                                                                              'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._get_artefact_value_per_plane': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._get_artefact_value_per_plane',
+                                                                                                                                                             'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat._get_cropping_indices': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat._get_cropping_indices',
                                                                                                                                                      'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.default_configs': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.default_configs',
@@ -722,6 +835,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                             'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.dropdown_option_value_for_gui',
                                                                                                                                                              'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.max_elements_per_chunk': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.max_elements_per_chunk',
+                                                                                                                                                      'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.run': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.run',
                                                                                                                                    'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropStitchingArtefactsRGBStrat.tooltips': ( 'api/preprocessing_01_strategies.html#cropstitchingartefactsrgbstrat.tooltips',
@@ -738,6 +853,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                            'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.descriptions': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.descriptions',
                                                                                                                                         'findmycells/preprocessing/strategies.py'),
+                                                      'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.determine_region_to_read': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.determine_region_to_read',
+                                                                                                                                                    'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.dropdown_option_value_for_gui': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.dropdown_option_value_for_gui',
                                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.CropToROIsBoundingBoxStrat.run': ( 'api/preprocessing_01_strategies.html#croptoroisboundingboxstrat.run',
@@ -786,12 +903,66 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                          'findmycells/preprocessing/strategies.py'),
                                                       'findmycells.preprocessing.strategies.MinimumIntensityProjectionStrat.widget_names': ( 'api/preprocessing_01_strategies.html#minimumintensityprojectionstrat.widget_names',
                                                                                                                                              'findmycells/preprocessing/strategies.py')},
+            'findmycells.project_store': { 'findmycells.project_store.LazyFileRecords': ( 'api/project_store.html#lazyfilerecords',
+                                                                                          'findmycells/project_store.py'),
+                                           'findmycells.project_store.LazyFileRecords.__contains__': ( 'api/project_store.html#lazyfilerecords.__contains__',
+                                                                                                       'findmycells/project_store.py'),
+                                           'findmycells.project_store.LazyFileRecords.__delitem__': ( 'api/project_store.html#lazyfilerecords.__delitem__',
+                                                                                                      'findmycells/project_store.py'),
+                                           'findmycells.project_store.LazyFileRecords.__getitem__': ( 'api/project_store.html#lazyfilerecords.__getitem__',
+                                                                                                      'findmycells/project_store.py'),
+                                           'findmycells.project_store.LazyFileRecords.__init__': ( 'api/project_store.html#lazyfilerecords.__init__',
+                                                                                                   'findmycells/project_store.py'),
+                                           'findmycells.project_store.LazyFileRecords.__iter__': ( 'api/project_store.html#lazyfilerecords.__iter__',
+                                                                                                   'findmycells/project_store.py'),
+                                           'findmycells.project_store.LazyFileRecords.__len__': ( 'api/project_store.html#lazyfilerecords.__len__',
+                                                                                                  'findmycells/project_store.py'),
+                                           'findmycells.project_store.LazyFileRecords.__setitem__': ( 'api/project_store.html#lazyfilerecords.__setitem__',
+                                                                                                      'findmycells/project_store.py'),
+                                           'findmycells.project_store.LazyFileRecords.is_loaded': ( 'api/project_store.html#lazyfilerecords.is_loaded',
+                                                                                                    'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore': ( 'api/project_store.html#sqliteprojectstore',
+                                                                                             'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.__init__': ( 'api/project_store.html#sqliteprojectstore.__init__',
+                                                                                                      'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore._create_tables_if_needed': ( 'api/project_store.html#sqliteprojectstore._create_tables_if_needed',
+                                                                                                                      'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore._delete_file_records': ( 'api/project_store.html#sqliteprojectstore._delete_file_records',
+                                                                                                                  'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore._insert_file_history': ( 'api/project_store.html#sqliteprojectstore._insert_file_history',
+                                                                                                                  'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore._load_file_infos': ( 'api/project_store.html#sqliteprojectstore._load_file_infos',
+                                                                                                              'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore._load_quantification_results': ( 'api/project_store.html#sqliteprojectstore._load_quantification_results',
+                                                                                                                          'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore._transaction': ( 'api/project_store.html#sqliteprojectstore._transaction',
+                                                                                                          'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore._write_file_records': ( 'api/project_store.html#sqliteprojectstore._write_file_records',
+                                                                                                                 'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore._write_project_level_records': ( 'api/project_store.html#sqliteprojectstore._write_project_level_records',
+                                                                                                                          'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.exists': ( 'api/project_store.html#sqliteprojectstore.exists',
+                                                                                                    'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.file_specific_table_names': ( 'api/project_store.html#sqliteprojectstore.file_specific_table_names',
+                                                                                                                       'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.lazily_loaded_attr_ids': ( 'api/project_store.html#sqliteprojectstore.lazily_loaded_attr_ids',
+                                                                                                                    'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.load_area_rois': ( 'api/project_store.html#sqliteprojectstore.load_area_rois',
+                                                                                                            'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.load_file_history': ( 'api/project_store.html#sqliteprojectstore.load_file_history',
+                                                                                                               'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.load_multi_matches_traceback': ( 'api/project_store.html#sqliteprojectstore.load_multi_matches_traceback',
+                                                                                                                          'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.load_project': ( 'api/project_store.html#sqliteprojectstore.load_project',
+                                                                                                          'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.save_file_records': ( 'api/project_store.html#sqliteprojectstore.save_file_records',
+                                                                                                               'findmycells/project_store.py'),
+                                           'findmycells.project_store.SQLiteProjectStore.save_project': ( 'api/project_store.html#sqliteprojectstore.save_project',
+                                                                                                          'findmycells/project_store.py')},
             'findmycells.quantification.specs': { 'findmycells.quantification.specs.QuantificationObject': ( 'api/quantification_00_specs.html#quantificationobject',
                                                                                                              'findmycells/quantification/specs.py'),
                                                   'findmycells.quantification.specs.QuantificationObject._add_processing_specific_infos_to_updates': ( 'api/quantification_00_specs.html#quantificationobject._add_processing_specific_infos_to_updates',
                                                                                                                                                        'findmycells/quantification/specs.py'),
-                                                  'findmycells.quantification.specs.QuantificationObject._load_postprocessed_segmentations': ( 'api/quantification_00_specs.html#quantificationobject._load_postprocessed_segmentations',
-                                                                                                                                               'findmycells/quantification/specs.py'),
                                                   'findmycells.quantification.specs.QuantificationObject._processing_specific_preparations': ( 'api/quantification_00_specs.html#quantificationobject._processing_specific_preparations',
                                                                                                                                                'findmycells/quantification/specs.py'),
                                                   'findmycells.quantification.specs.QuantificationObject.default_configs': ( 'api/quantification_00_specs.html#quantificationobject.default_configs',
@@ -844,24 +1015,40 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                    'findmycells/quantification/strategies.py')},
             'findmycells.readers.microscopy_images': { 'findmycells.readers.microscopy_images.CZIReader': ( 'api/readers_01_microscopy_images.html#czireader',
                                                                                                             'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.CZIReader._read_image_using_configs': ( 'api/readers_01_microscopy_images.html#czireader._read_image_using_configs',
+                                                                                                                                      'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.CZIReader.read': ( 'api/readers_01_microscopy_images.html#czireader.read',
                                                                                                                  'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.CZIReader.read_metadata': ( 'api/readers_01_microscopy_images.html#czireader.read_metadata',
+                                                                                                                          'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.CZIReader.read_region': ( 'api/readers_01_microscopy_images.html#czireader.read_region',
+                                                                                                                        'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.CZIReader.readable_filetype_extensions': ( 'api/readers_01_microscopy_images.html#czireader.readable_filetype_extensions',
                                                                                                                                          'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.FromExcelReader': ( 'api/readers_01_microscopy_images.html#fromexcelreader',
                                                                                                                   'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.FromExcelReader._read_all_planes': ( 'api/readers_01_microscopy_images.html#fromexcelreader._read_all_planes',
+                                                                                                                                   'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.FromExcelReader.read': ( 'api/readers_01_microscopy_images.html#fromexcelreader.read',
                                                                                                                        'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.FromExcelReader.read_region': ( 'api/readers_01_microscopy_images.html#fromexcelreader.read_region',
+                                                                                                                              'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.FromExcelReader.readable_filetype_extensions': ( 'api/readers_01_microscopy_images.html#fromexcelreader.readable_filetype_extensions',
                                                                                                                                                'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.MicroscopyImageReaders': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders',
                                                                                                                          'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.MicroscopyImageReaders._crop_to_region': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders._crop_to_region',
+                                                                                                                                         'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.MicroscopyImageReaders._get_color_channel_slice': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders._get_color_channel_slice',
                                                                                                                                                   'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.MicroscopyImageReaders._get_plane_idx_slice': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders._get_plane_idx_slice',
                                                                                                                                               'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.MicroscopyImageReaders.assert_correct_output_format': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders.assert_correct_output_format',
                                                                                                                                                       'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.MicroscopyImageReaders.read_metadata': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders.read_metadata',
+                                                                                                                                       'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.MicroscopyImageReaders.read_region': ( 'api/readers_01_microscopy_images.html#microscopyimagereaders.read_region',
+                                                                                                                                     'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.RegularImageFiletypeReader': ( 'api/readers_01_microscopy_images.html#regularimagefiletypereader',
                                                                                                                              'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.RegularImageFiletypeReader._attempt_to_load_image_at_correct_format': ( 'api/readers_01_microscopy_images.html#regularimagefiletypereader._attempt_to_load_image_at_correct_format',
@@ -869,7 +1056,35 @@ d = { 'settings': { 'branch': 'main',
                                                        'findmycells.readers.microscopy_images.RegularImageFiletypeReader.read': ( 'api/readers_01_microscopy_images.html#regularimagefiletypereader.read',
                                                                                                                                   'findmycells/readers/microscopy_images.py'),
                                                        'findmycells.readers.microscopy_images.RegularImageFiletypeReader.readable_filetype_extensions': ( 'api/readers_01_microscopy_images.html#regularimagefiletypereader.readable_filetype_extensions',
-                                                                                                                                                          'findmycells/readers/microscopy_images.py')},
+                                                                                                                                                          'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader': ( 'api/readers_01_microscopy_images.html#tiffreader',
+                                                                                                             'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader._decode_page_region': ( 'api/readers_01_microscopy_images.html#tiffreader._decode_page_region',
+                                                                                                                                 'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader._get_layout': ( 'api/readers_01_microscopy_images.html#tiffreader._get_layout',
+                                                                                                                         'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader._get_page_idx': ( 'api/readers_01_microscopy_images.html#tiffreader._get_page_idx',
+                                                                                                                           'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader._memory_map_series': ( 'api/readers_01_microscopy_images.html#tiffreader._memory_map_series',
+                                                                                                                                'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader._read_image_using_configs': ( 'api/readers_01_microscopy_images.html#tiffreader._read_image_using_configs',
+                                                                                                                                       'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader.read': ( 'api/readers_01_microscopy_images.html#tiffreader.read',
+                                                                                                                  'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader.read_metadata': ( 'api/readers_01_microscopy_images.html#tiffreader.read_metadata',
+                                                                                                                           'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader.read_region': ( 'api/readers_01_microscopy_images.html#tiffreader.read_region',
+                                                                                                                         'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images.TIFFReader.readable_filetype_extensions': ( 'api/readers_01_microscopy_images.html#tiffreader.readable_filetype_extensions',
+                                                                                                                                          'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images._LazyCZISubblockArray': ( 'api/readers_01_microscopy_images.html#_lazyczisubblockarray',
+                                                                                                                        'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images._LazyCZISubblockArray.__getitem__': ( 'api/readers_01_microscopy_images.html#_lazyczisubblockarray.__getitem__',
+                                                                                                                                    'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images._LazyCZISubblockArray.__init__': ( 'api/readers_01_microscopy_images.html#_lazyczisubblockarray.__init__',
+                                                                                                                                 'findmycells/readers/microscopy_images.py'),
+                                                       'findmycells.readers.microscopy_images._LazyCZISubblockArray._decode_overlapping_subblocks': ( 'api/readers_01_microscopy_images.html#_lazyczisubblockarray._decode_overlapping_subblocks',
+                                                                                                                                                      'findmycells/readers/microscopy_images.py')},
             'findmycells.readers.rois': { 'findmycells.readers.rois.ImageJROIReader': ( 'api/readers_02_rois.html#imagejroireader',
                                                                                         'findmycells/readers/rois.py'),
                                           'findmycells.readers.rois.ImageJROIReader.read': ( 'api/readers_02_rois.html#imagejroireader.read',
@@ -940,32 +1155,66 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                     'findmycells/segmentation/specs.py'),
                                                 'findmycells.segmentation.specs.SegmentationObject.processing_type': ( 'api/segmentation_00_specs.html#segmentationobject.processing_type',
                                                                                                                        'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SegmentationObject.run_all_strategies': ( 'api/segmentation_00_specs.html#segmentationobject.run_all_strategies',
+                                                                                                                          'findmycells/segmentation/specs.py'),
                                                 'findmycells.segmentation.specs.SegmentationObject.tooltips': ( 'api/segmentation_00_specs.html#segmentationobject.tooltips',
                                                                                                                 'findmycells/segmentation/specs.py'),
                                                 'findmycells.segmentation.specs.SegmentationObject.widget_names': ( 'api/segmentation_00_specs.html#segmentationobject.widget_names',
                                                                                                                     'findmycells/segmentation/specs.py'),
                                                 'findmycells.segmentation.specs.SegmentationStrategy': ( 'api/segmentation_00_specs.html#segmentationstrategy',
                                                                                                          'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SegmentationStrategy.can_consume_streamed_results': ( 'api/segmentation_00_specs.html#segmentationstrategy.can_consume_streamed_results',
+                                                                                                                                      'findmycells/segmentation/specs.py'),
                                                 'findmycells.segmentation.specs.SegmentationStrategy.processing_type': ( 'api/segmentation_00_specs.html#segmentationstrategy.processing_type',
                                                                                                                          'findmycells/segmentation/specs.py'),
                                                 'findmycells.segmentation.specs.SegmentationStrategy.segmentation_type': ( 'api/segmentation_00_specs.html#segmentationstrategy.segmentation_type',
-                                                                                                                           'findmycells/segmentation/specs.py')},
+                                                                                                                           'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SegmentationStrategy.streams_results': ( 'api/segmentation_00_specs.html#segmentationstrategy.streams_results',
+                                                                                                                         'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SoftmaxStream': ( 'api/segmentation_00_specs.html#softmaxstream',
+                                                                                                  'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SoftmaxStream.__init__': ( 'api/segmentation_00_specs.html#softmaxstream.__init__',
+                                                                                                           'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SoftmaxStream.__iter__': ( 'api/segmentation_00_specs.html#softmaxstream.__iter__',
+                                                                                                           'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SoftmaxStream._put': ( 'api/segmentation_00_specs.html#softmaxstream._put',
+                                                                                                       'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SoftmaxStream._run_producer': ( 'api/segmentation_00_specs.html#softmaxstream._run_producer',
+                                                                                                                'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SoftmaxStream.close': ( 'api/segmentation_00_specs.html#softmaxstream.close',
+                                                                                                        'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SoftmaxStream.put': ( 'api/segmentation_00_specs.html#softmaxstream.put',
+                                                                                                      'findmycells/segmentation/specs.py'),
+                                                'findmycells.segmentation.specs.SoftmaxStream.start_producer': ( 'api/segmentation_00_specs.html#softmaxstream.start_producer',
+                                                                                                                 'findmycells/segmentation/specs.py')},
             'findmycells.segmentation.strategies': { 'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat',
                                                                                                                                   'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._add_deepflash2_as_segmentation_tool': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._add_deepflash2_as_segmentation_tool',
                                                                                                                                                                        'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._add_strategy_specific_infos_to_updates': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._add_strategy_specific_infos_to_updates',
                                                                                                                                                                           'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._compute_mean_and_variance_of_plane': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._compute_mean_and_variance_of_plane',
+                                                                                                                                                                      'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._compute_stats': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._compute_stats',
                                                                                                                                                  'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._copy_all_files_of_current_batch_to_temp_dir': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._copy_all_files_of_current_batch_to_temp_dir',
                                                                                                                                                                                'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._delete_temp_files_in_sys_tmp_dir': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._delete_temp_files_in_sys_tmp_dir',
                                                                                                                                                                     'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._get_file_ids_with_preprocessed_images': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._get_file_ids_with_preprocessed_images',
+                                                                                                                                                                         'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._get_stats_fingerprint': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._get_stats_fingerprint',
+                                                                                                                                                         'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._group_file_ids_by_plane_count': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._group_file_ids_by_plane_count',
+                                                                                                                                                                 'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._import_semantic_masks': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._import_semantic_masks',
+                                                                                                                                                         'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._move_files': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._move_files',
                                                                                                                                               'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._run_semantic_segmentations': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._run_semantic_segmentations',
                                                                                                                                                               'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat._run_streamed_semantic_segmentations': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat._run_streamed_semantic_segmentations',
+                                                                                                                                                                       'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat.default_configs': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat.default_configs',
                                                                                                                                                   'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat.descriptions': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat.descriptions',
@@ -976,6 +1225,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                       'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat.segmentation_type': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat.segmentation_type',
                                                                                                                                                     'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat.streams_results': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat.streams_results',
+                                                                                                                                                  'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat.tooltips': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat.tooltips',
                                                                                                                                            'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.Deepflash2SemanticSegmentationStrat.widget_names': ( 'api/segmentation_01_strategies.html#deepflash2semanticsegmentationstrat.widget_names',
@@ -990,18 +1241,32 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                                                                      'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._calculate_median_equivalent_diameter_of_features_in_mask': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._calculate_median_equivalent_diameter_of_features_in_mask',
                                                                                                                                                                                                                    'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._calculate_median_equivalent_diameters_of_all_planes': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._calculate_median_equivalent_diameters_of_all_planes',
+                                                                                                                                                                                                              'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._check_if_df2_label_is_fully_covered_in_cp_mask': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._check_if_df2_label_is_fully_covered_in_cp_mask',
                                                                                                                                                                                                          'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._compute_cellpose_diameter': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._compute_cellpose_diameter',
                                                                                                                                                                                     'findmycells/segmentation/strategies.py'),
-                                                     'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._compute_cellpose_mask': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._compute_cellpose_mask',
-                                                                                                                                                                                'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._compute_cellpose_masks': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._compute_cellpose_masks',
+                                                                                                                                                                                 'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._expand_cp_labels_stepwise_in_entire_mask': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._expand_cp_labels_stepwise_in_entire_mask',
+                                                                                                                                                                                                   'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._fill_entire_df2_label_area_with_instance_label': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._fill_entire_df2_label_area_with_instance_label',
                                                                                                                                                                                                          'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._get_cellpose_model': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._get_cellpose_model',
+                                                                                                                                                                             'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._iterate_over_df2_softmaxes': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._iterate_over_df2_softmaxes',
+                                                                                                                                                                                     'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._lossless_conversion_of_df2_semantic_to_instance_seg_using_cp': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._lossless_conversion_of_df2_semantic_to_instance_seg_using_cp',
                                                                                                                                                                                                                        'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._release_cellpose_model': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._release_cellpose_model',
+                                                                                                                                                                                 'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._run_instance_segmentations': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._run_instance_segmentations',
                                                                                                                                                                                      'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat._segment_batch_of_planes': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat._segment_batch_of_planes',
+                                                                                                                                                                                  'findmycells/segmentation/strategies.py'),
+                                                     'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat.can_consume_streamed_results': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat.can_consume_streamed_results',
+                                                                                                                                                                                      'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat.default_configs': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat.default_configs',
                                                                                                                                                                          'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat.descriptions': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat.descriptions',
@@ -1016,12 +1281,100 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                                   'findmycells/segmentation/strategies.py'),
                                                      'findmycells.segmentation.strategies.LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat.widget_names': ( 'api/segmentation_01_strategies.html#losslessconversionofdf2semanticsegtoinstancesegwithcpstrat.widget_names',
                                                                                                                                                                       'findmycells/segmentation/strategies.py')},
-            'findmycells.utils': { 'findmycells.utils.download_sample_data': ( 'api/utils.html#download_sample_data',
+            'findmycells.storage': { 'findmycells.storage.PNGStackStorage': ('api/storage.html#pngstackstorage', 'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage._get_matching_png_filepaths': ( 'api/storage.html#pngstackstorage._get_matching_png_filepaths',
+                                                                                                          'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage._link_or_copy_file': ( 'api/storage.html#pngstackstorage._link_or_copy_file',
+                                                                                                 'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage.delete_stack': ( 'api/storage.html#pngstackstorage.delete_stack',
+                                                                                           'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage.export_stack_as_png_files': ( 'api/storage.html#pngstackstorage.export_stack_as_png_files',
+                                                                                                        'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage.get_fingerprint': ( 'api/storage.html#pngstackstorage.get_fingerprint',
+                                                                                              'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage.get_plane_count': ( 'api/storage.html#pngstackstorage.get_plane_count',
+                                                                                              'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage.has_stack': ( 'api/storage.html#pngstackstorage.has_stack',
+                                                                                        'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage.import_png_files': ( 'api/storage.html#pngstackstorage.import_png_files',
+                                                                                               'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage.load_stack': ( 'api/storage.html#pngstackstorage.load_stack',
+                                                                                         'findmycells/storage.py'),
+                                     'findmycells.storage.PNGStackStorage.save_stack': ( 'api/storage.html#pngstackstorage.save_stack',
+                                                                                         'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage': ('api/storage.html#stackstorage', 'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage._compute_fingerprint_of_filepaths': ( 'api/storage.html#stackstorage._compute_fingerprint_of_filepaths',
+                                                                                                             'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage.delete_stack': ( 'api/storage.html#stackstorage.delete_stack',
+                                                                                        'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage.export_stack_as_png_files': ( 'api/storage.html#stackstorage.export_stack_as_png_files',
+                                                                                                     'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage.get_fingerprint': ( 'api/storage.html#stackstorage.get_fingerprint',
+                                                                                           'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage.get_plane_count': ( 'api/storage.html#stackstorage.get_plane_count',
+                                                                                           'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage.has_stack': ( 'api/storage.html#stackstorage.has_stack',
+                                                                                     'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage.import_png_files': ( 'api/storage.html#stackstorage.import_png_files',
+                                                                                            'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage.load_stack': ( 'api/storage.html#stackstorage.load_stack',
+                                                                                      'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorage.save_stack': ( 'api/storage.html#stackstorage.save_stack',
+                                                                                      'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorageSpecs': ( 'api/storage.html#stackstoragespecs',
+                                                                                'findmycells/storage.py'),
+                                     'findmycells.storage.StackStorageSpecs.default_configs': ( 'api/storage.html#stackstoragespecs.default_configs',
+                                                                                                'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage': ( 'api/storage.html#zarrstackstorage',
+                                                                               'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage.__init__': ( 'api/storage.html#zarrstackstorage.__init__',
+                                                                                        'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage._get_zarr_path': ( 'api/storage.html#zarrstackstorage._get_zarr_path',
+                                                                                              'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage.delete_stack': ( 'api/storage.html#zarrstackstorage.delete_stack',
+                                                                                            'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage.export_stack_as_png_files': ( 'api/storage.html#zarrstackstorage.export_stack_as_png_files',
+                                                                                                         'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage.get_fingerprint': ( 'api/storage.html#zarrstackstorage.get_fingerprint',
+                                                                                               'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage.get_plane_count': ( 'api/storage.html#zarrstackstorage.get_plane_count',
+                                                                                               'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage.has_stack': ( 'api/storage.html#zarrstackstorage.has_stack',
+                                                                                         'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage.load_stack': ( 'api/storage.html#zarrstackstorage.load_stack',
+                                                                                          'findmycells/storage.py'),
+                                     'findmycells.storage.ZarrStackStorage.save_stack': ( 'api/storage.html#zarrstackstorage.save_stack',
+                                                                                          'findmycells/storage.py'),
+                                     'findmycells.storage.get_stack_storage': ( 'api/storage.html#get_stack_storage',
+                                                                                'findmycells/storage.py')},
+            'findmycells.utils': { 'findmycells.utils.MaskedLabelStacks': ('api/utils.html#maskedlabelstacks', 'findmycells/utils.py'),
+                                   'findmycells.utils.MaskedLabelStacks.__getitem__': ( 'api/utils.html#maskedlabelstacks.__getitem__',
+                                                                                        'findmycells/utils.py'),
+                                   'findmycells.utils.MaskedLabelStacks.__init__': ( 'api/utils.html#maskedlabelstacks.__init__',
+                                                                                     'findmycells/utils.py'),
+                                   'findmycells.utils.MaskedLabelStacks.__iter__': ( 'api/utils.html#maskedlabelstacks.__iter__',
+                                                                                     'findmycells/utils.py'),
+                                   'findmycells.utils.MaskedLabelStacks.__len__': ( 'api/utils.html#maskedlabelstacks.__len__',
+                                                                                    'findmycells/utils.py'),
+                                   'findmycells.utils.PolygonCache': ('api/utils.html#polygoncache', 'findmycells/utils.py'),
+                                   'findmycells.utils.PolygonCache.__init__': ( 'api/utils.html#polygoncache.__init__',
+                                                                                'findmycells/utils.py'),
+                                   'findmycells.utils.PolygonCache.get_polygons': ( 'api/utils.html#polygoncache.get_polygons',
+                                                                                    'findmycells/utils.py'),
+                                   'findmycells.utils.PolygonCache.invalidate': ( 'api/utils.html#polygoncache.invalidate',
+                                                                                  'findmycells/utils.py'),
+                                   'findmycells.utils.PolygonCache.is_cached': ( 'api/utils.html#polygoncache.is_cached',
+                                                                                 'findmycells/utils.py'),
+                                   'findmycells.utils.download_sample_data': ( 'api/utils.html#download_sample_data',
                                                                                'findmycells/utils.py'),
                                    'findmycells.utils.get_polygon_from_instance_segmentation': ( 'api/utils.html#get_polygon_from_instance_segmentation',
                                                                                                  'findmycells/utils.py'),
+                                   'findmycells.utils.get_polygons_from_instance_segmentation': ( 'api/utils.html#get_polygons_from_instance_segmentation',
+                                                                                                  'findmycells/utils.py'),
                                    'findmycells.utils.list_dir_no_hidden': ('api/utils.html#list_dir_no_hidden', 'findmycells/utils.py'),
                                    'findmycells.utils.load_zstack_as_array_from_single_planes': ( 'api/utils.html#load_zstack_as_array_from_single_planes',
                                                                                                   'findmycells/utils.py'),
+                                   'findmycells.utils.relabel_instance_segmentation_in_place': ( 'api/utils.html#relabel_instance_segmentation_in_place',
+                                                                                                 'findmycells/utils.py'),
                                    'findmycells.utils.unpad_x_y_dims_in_3d_array': ( 'api/utils.html#unpad_x_y_dims_in_3d_array',
                                                                                      'findmycells/utils.py')}}}
@@ -301,7 +301,8 @@ class ProcessingStrategy(ABC):
     
     def update_tracking_histories(self, processing_object: ProcessingObject, strategy_configs: Dict) -> ProcessingObject:
         for file_id in processing_object.file_ids:
-            strategy_configs_with_updates = self._add_strategy_specific_infos_to_updates(updates = strategy_configs)
+            # pass a copy, as the same strategy_configs dict is re-used for all files:
+            strategy_configs_with_updates = self._add_strategy_specific_infos_to_updates(updates = strategy_configs.copy())
             tracking_history = processing_object.database.file_histories[file_id]
             tracking_history.track_processing_strat(processing_step_id = self.processing_type,
                                                     processing_strategy_name = self.strategy_name,
@@ -400,12 +401,20 @@ class DataLoader:
         return available_reader
     
     
-    def load(self, data_reader_class: DataReader, filepath: Union[PosixPath, WindowsPath], reader_configs: Dict) -> Any:
+    def load(self, 
+             data_reader_class: DataReader, 
+             filepath: Union[PosixPath, WindowsPath], 
+             reader_configs: Dict, 
+             region: Optional[Dict[str, int]]=None # only supported by readers that implement "read_region()" (e.g. `MicroscopyImageReaders`)
+            ) -> Any:
         """
         Uses the provided `DataReader` subclass to import the data.
         """
         data_reader = data_reader_class()
         # data_reader.set_optional_configs(database = database)
-        data = data_reader.read(filepath = filepath, reader_configs = reader_configs)
+        if region == None:
+            data = data_reader.read(filepath = filepath, reader_configs = reader_configs)
+        else:
+            data = data_reader.read_region(filepath = filepath, reader_configs = reader_configs, region = region)
         data_reader.assert_correct_output_format(output = data)
         return data                 
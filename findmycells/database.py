@@ -1,18 +1,22 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/02_database.ipynb.
 
 # %% auto 0
-__all__ = ['Database', 'FileHistory']
+__all__ = ['Database', 'FileHistory', 'FileInfos']
 
 # %% ../nbs/api/02_database.ipynb 2
 from pathlib import Path, PosixPath, WindowsPath
-from typing import Optional, Dict, List, Union
+from typing import Optional, Dict, List, Tuple, Union
 import pandas as pd
+import numpy as np
 from datetime import datetime
 from shapely.geometry import Polygon
 import pickle
+import copy
+import time
 
 
 from .configs import ProjectConfigs
+from .storage import get_stack_storage
 from . import utils
 
 # %% ../nbs/api/02_database.ipynb 4
@@ -25,6 +29,13 @@ class Database:
         self._create_file_histories_as_attr()
         
         
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        if ('file_infos' in state.keys()) and (isinstance(state['file_infos'], FileInfos) == False):
+            # databases that were pickled before file_infos were hash-indexed hold a plain dict:
+            self.file_infos = FileInfos(state['file_infos'])
+        
+        
     def _initialize_project_in_root_dir(self) -> None:
         self._initialize_all_top_level_subdirectories()
         self._initialize_segmentation_tool_subdirectories()
@@ -39,6 +50,7 @@ class Database:
         self._find_or_create_subdir(target_name = 'segmentation_tool', keywords = ['tool', 'Tool'])
         self._find_or_create_subdir(target_name = 'semantic_segmentations', keywords = ['semantic', 'Semantic'])
         self._find_or_create_subdir(target_name = 'instance_segmentations', keywords = ['instance', 'Instance'])
+        self._find_or_create_subdir(target_name = 'postprocessed_segmentations', keywords = ['postprocessed', 'Postprocessed'])
         self._find_or_create_subdir(target_name = 'quantified_segmentations', keywords = ['quantified', 'Quantified', 'quantification', 'Quantification'])
         self._find_or_create_subdir(target_name = 'results', keywords = ['results', 'Results'])
         self._find_or_create_subdir(target_name = 'inspection', keywords = ['inspect', 'Inspect'])
@@ -81,7 +93,7 @@ class Database:
                       'rois_present': [],
                       'rois_filepath': [],
                       'rois_filetype': []}
-        setattr(self, 'file_infos', file_infos)
+        setattr(self, 'file_infos', FileInfos(file_infos))
         
         
     def _create_file_histories_as_attr(self) -> None:
@@ -89,9 +101,19 @@ class Database:
         
         
     def compute_file_infos(self) -> None:
+        """
+        Adds all new files in the microscopy images subdirectory tree to the database and removes files 
+        that no longer exist. Only subject subdirectories that changed since the last call (based on a 
+        snapshot of their modification time and size) are scanned again.
+        """
         self._initialize_microscopy_images_subdirectory_tree()
-        self._add_new_files_to_database()
-        self._identify_removed_files() # ToDo: not implemented yet
+        current_snapshot = self._take_microscopy_images_snapshot()
+        if hasattr(self, 'microscopy_images_snapshot') == False:
+            self.microscopy_images_snapshot = {}
+        changed_subject_dir_ids = self._identify_changed_subject_dirs(current_snapshot = current_snapshot)
+        self._add_new_files_to_database(subject_dir_ids = [dir_ids for dir_ids in changed_subject_dir_ids if dir_ids in current_snapshot.keys()])
+        self._identify_removed_files(subject_dir_ids = changed_subject_dir_ids)
+        self.microscopy_images_snapshot = current_snapshot
         
         
     def _initialize_microscopy_images_subdirectory_tree(self) -> None:
@@ -133,36 +155,87 @@ class Database:
         microscopy_images_dir.joinpath(main_group_id, subgroup_id, subject_id).mkdir(exist_ok = True)
         
         
-    def _add_new_files_to_database(self) -> None:
+    def _take_microscopy_images_snapshot(self) -> Dict[Tuple[str, str, str], Optional[Tuple[int, int]]]:
+        """
+        Maps the IDs (main_group_id, subgroup_id, subject_id) of all subject subdirectories in the 
+        microscopy images subdirectory tree to their modification time (in ns) and size. Adding, 
+        removing, or renaming a file changes the modification time of its parent directory. Directories 
+        that were modified within the last two seconds are stored as None, such that they are always 
+        scanned again - otherwise, files that are added within the timestamp resolution of the file 
+        system could be missed.
+        """
         microscopy_images_dir_path = self.project_configs.root_dir.joinpath(self.microscopy_images_dir)
+        snapshot = {}
         for main_group_id_subdir_path in utils.list_dir_no_hidden(path = microscopy_images_dir_path, only_dirs = True):
             for subgroup_id_subdir_path in utils.list_dir_no_hidden(path = main_group_id_subdir_path, only_dirs = True):
                 for subject_id_subdir_path in utils.list_dir_no_hidden(path = subgroup_id_subdir_path, only_dirs = True):
-                    for filepath in utils.list_dir_no_hidden(path = subject_id_subdir_path, only_files = True):
-                        new_file_found = self._is_this_a_new_file(filepath = filepath)
-                        if new_file_found == True:
-                            file_id = self._get_next_available_file_id()
-                            self._append_details_to_file_infos(file_id = file_id, filepath = filepath)
-                            self._add_new_file_history_tracker(file_id = file_id, source_image_filepath = filepath)                                       
+                    subject_dir_ids = (main_group_id_subdir_path.name, subgroup_id_subdir_path.name, subject_id_subdir_path.name)
+                    stat_result = subject_id_subdir_path.stat()
+                    if time.time_ns() - stat_result.st_mtime_ns < 2_000_000_000:
+                        snapshot[subject_dir_ids] = None
+                    else:
+                        snapshot[subject_dir_ids] = (stat_result.st_mtime_ns, stat_result.st_size)
+        return snapshot
+    
+    
+    def _identify_changed_subject_dirs(self, current_snapshot: Dict[Tuple[str, str, str], Optional[Tuple[int, int]]]) -> List[Tuple[str, str, str]]:
+        changed_subject_dir_ids = []
+        for subject_dir_ids, stats in current_snapshot.items():
+            if (stats == None) or (self.microscopy_images_snapshot.get(subject_dir_ids) != stats):
+                changed_subject_dir_ids.append(subject_dir_ids)
+        for subject_dir_ids in self.microscopy_images_snapshot.keys():
+            if subject_dir_ids not in current_snapshot.keys():
+                changed_subject_dir_ids.append(subject_dir_ids)
+        return changed_subject_dir_ids
+        
         
+    def _add_new_files_to_database(self, subject_dir_ids: List[Tuple[str, str, str]]) -> None:
+        microscopy_images_dir_path = self.project_configs.root_dir.joinpath(self.microscopy_images_dir)
+        known_source_files = self._get_file_ids_by_source_file()
+        next_file_id = int(self._get_next_available_file_id())
+        for main_group_id, subgroup_id, subject_id in subject_dir_ids:
+            subject_id_subdir_path = microscopy_images_dir_path.joinpath(main_group_id, subgroup_id, subject_id)
+            for filepath in utils.list_dir_no_hidden(path = subject_id_subdir_path, only_files = True):
+                new_file_found = self._is_this_a_new_file(filepath = filepath, known_source_files = known_source_files)
+                if new_file_found == True:
+                    file_id = str(next_file_id).zfill(4)
+                    next_file_id += 1
+                    self._append_details_to_file_infos(file_id = file_id, filepath = filepath)
+                    self._add_new_file_history_tracker(file_id = file_id, source_image_filepath = filepath)
+                    known_source_files[self._get_source_file_key(filepath = filepath)] = [file_id]
+    
     
-    def _is_this_a_new_file(self, filepath: Path) -> bool:
+    def _get_source_file_key(self, filepath: Path) -> Tuple[str, str, str, str]:
         subject_subdir_path = filepath.parent
         subgroup_subdir_path = subject_subdir_path.parent
         main_group_id = subgroup_subdir_path.parent.name
         original_filename = filepath.name[:filepath.name.find('.')]
-        file_infos_as_df = pd.DataFrame(data = self.file_infos)
-        matching_entries_df = file_infos_as_df.loc[(file_infos_as_df['main_group_id'] == main_group_id) &
-                                                   (file_infos_as_df['subgroup_id'] == subgroup_subdir_path.name) &
-                                                   (file_infos_as_df['subject_id'] == subject_subdir_path.name) &
-                                                   (file_infos_as_df['original_filename'] == original_filename)]
-        matching_entries_count = matching_entries_df.shape[0]
+        return (main_group_id, subgroup_subdir_path.name, subject_subdir_path.name, original_filename)
+    
+    
+    def _get_file_ids_by_source_file(self) -> Dict[Tuple[str, str, str, str], List[str]]:
+        file_ids_by_source_file = {}
+        for file_id, main_group_id, subgroup_id, subject_id, original_filename in zip(self.file_infos['file_id'],
+                                                                                     self.file_infos['main_group_id'],
+                                                                                     self.file_infos['subgroup_id'],
+                                                                                     self.file_infos['subject_id'],
+                                                                                     self.file_infos['original_filename']):
+            source_file_key = (main_group_id, subgroup_id, subject_id, original_filename)
+            if source_file_key not in file_ids_by_source_file.keys():
+                file_ids_by_source_file[source_file_key] = []
+            file_ids_by_source_file[source_file_key].append(file_id)
+        return file_ids_by_source_file
+        
+    
+    def _is_this_a_new_file(self, filepath: Path, known_source_files: Dict[Tuple[str, str, str, str], List[str]]) -> bool:
+        matching_file_ids = known_source_files.get(self._get_source_file_key(filepath = filepath), [])
+        matching_entries_count = len(matching_file_ids)
         if matching_entries_count == 0:
             is_new_file = True
         elif matching_entries_count == 1:
             is_new_file = False
         else:
-            conflicting_file_ids = matching_entries_df['file_id'].values
+            conflicting_file_ids = matching_file_ids
             raise ValueError((f'Found multiple entries in file_infos for {filepath}.'
                               'This is an unexpected behavior and needs to be resolved. Please '
                               'Try to remove the file that was '
@@ -188,35 +261,35 @@ class Database:
         subject_subdir_path = filepath.parent
         subgroup_subdir_path = subject_subdir_path.parent
         main_group_subdir_path = subgroup_subdir_path.parent
-        self.file_infos['file_id'].append(str(file_id).zfill(4))
         original_filename = filepath.name[:filepath.name.find('.')]
-        self.file_infos['original_filename'].append(original_filename)
-        self.file_infos['main_group_id'].append(main_group_subdir_path.name)
-        self.file_infos['subgroup_id'].append(subgroup_subdir_path.name)
-        self.file_infos['subject_id'].append(subject_subdir_path.name)
-        self.file_infos['microscopy_filepath'].append(filepath)
-        self.file_infos['microscopy_filetype'].append(filepath.suffix)
+        row_values = {'file_id': str(file_id).zfill(4),
+                      'original_filename': original_filename,
+                      'main_group_id': main_group_subdir_path.name,
+                      'subgroup_id': subgroup_subdir_path.name,
+                      'subject_id': subject_subdir_path.name,
+                      'microscopy_filepath': filepath,
+                      'microscopy_filetype': filepath.suffix}
         corresponding_dir_in_rois_to_analyze_dir = self.project_configs.root_dir.joinpath(self.rois_to_analyze_dir,
                                                                                           main_group_subdir_path.name,
                                                                                           subgroup_subdir_path.name,
                                                                                           subject_subdir_path.name)
         if corresponding_dir_in_rois_to_analyze_dir.is_dir() == False:
-            self.file_infos['rois_present'].append(False)
-            self.file_infos['rois_filepath'].append('not_available')
-            self.file_infos['rois_filetype'].append('not_available')
+            row_values['rois_present'] = False
+            row_values['rois_filepath'] = 'not_available'
+            row_values['rois_filetype'] = 'not_available'
         else:
             matching_roi_filepaths = []
             for roi_filepath in utils.list_dir_no_hidden(path = corresponding_dir_in_rois_to_analyze_dir, only_files = True):
                 if roi_filepath.name[:roi_filepath.name.find('.')] == original_filename:
                     matching_roi_filepaths.append(roi_filepath)
             if len(matching_roi_filepaths) == 0:
-                self.file_infos['rois_present'].append(False)
-                self.file_infos['rois_filepath'].append('not_available')
-                self.file_infos['rois_filetype'].append('not_available')
+                row_values['rois_present'] = False
+                row_values['rois_filepath'] = 'not_available'
+                row_values['rois_filetype'] = 'not_available'
             elif len(matching_roi_filepaths) == 1:
-                self.file_infos['rois_present'].append(True)
-                self.file_infos['rois_filepath'].append(matching_roi_filepaths[0])
-                self.file_infos['rois_filetype'].append(matching_roi_filepaths[0].suffix)
+                row_values['rois_present'] = True
+                row_values['rois_filepath'] = matching_roi_filepaths[0]
+                row_values['rois_filetype'] = matching_roi_filepaths[0].suffix
             else:
                 raise ValueError('It seems like you provided more than a single ROI file in '
                                  f'{corresponding_dir_in_rois_to_analyze_dir} that matches the microscopy '
@@ -224,6 +297,7 @@ class Database:
                                  'within multiple ROIs per image, please use RoiSets created with ImageJ as '
                                  'described here: [Documentation link not provided yet - please raise an issue on '
                                  'https://github.com/Defense-Circuits-Lab/findmycells - thank you!')
+        self.file_infos.append_row(row_values = row_values)
 
         
     def _add_new_file_history_tracker(self, file_id: int, source_image_filepath: Union[PosixPath, WindowsPath]) -> None:
@@ -231,18 +305,21 @@ class Database:
         self.file_histories[file_id] = FileHistory(file_id = file_id, source_image_filepath = source_image_filepath)
                                                
         
-    def _identify_removed_files(self) -> None:
+    def _identify_removed_files(self, subject_dir_ids: List[Tuple[str, str, str]]) -> None:
+        subject_dir_ids = set(subject_dir_ids)
         file_ids_to_remove = []
         for index, microscopy_filepath in enumerate(self.file_infos['microscopy_filepath']):
-            if microscopy_filepath.is_file() == False:
-                file_ids_to_remove.append(self.file_infos['file_id'][index])
+            row_subject_dir_ids = (self.file_infos['main_group_id'][index], self.file_infos['subgroup_id'][index], self.file_infos['subject_id'][index])
+            if row_subject_dir_ids in subject_dir_ids:
+                if microscopy_filepath.is_file() == False:
+                    file_ids_to_remove.append(self.file_infos['file_id'][index])
         for file_id in file_ids_to_remove:
             self.remove_file_id_from_project(file_id = file_id)
                 
 
     def get_file_infos(self, file_id: str) -> Dict:
-        assert file_id in self.file_infos['file_id'], f'The file_id you passed ({file_id}) is not a valid file_id!'
-        index = self.file_infos['file_id'].index(file_id)
+        assert self.file_infos.contains_file_id(file_id = file_id), f'The file_id you passed ({file_id}) is not a valid file_id!'
+        index = self.file_infos.get_row_index(file_id = file_id)
         file_infos = {}    
         for key, list_of_values in self.file_infos.items():
             if len(list_of_values) > 0:
@@ -251,7 +328,8 @@ class Database:
     
     
     def update_file_infos(self, file_id: str, updates: Dict, preferred_empty_value: Union[bool, str, None]=None) -> None: 
-        index = self.file_infos['file_id'].index(file_id)
+        index = self.file_infos.get_row_index(file_id = file_id)
+        assert index != None, f'The file_id you passed ({file_id}) is not a valid file_id!'
         for key, value in updates.items():
             if key not in self.file_infos.keys():
                 self._add_new_key_to_file_infos(key, preferred_empty_value = preferred_empty_value)
@@ -287,7 +365,7 @@ class Database:
         else:
             assert type(input_file_ids) == list, '"input_file_ids" has to be list of file_ids (given as strings)!'
             for elem in input_file_ids:
-                assert elem in self.file_infos['file_id'], f'"input_file_ids" has to be list of file_ids (given as strings)! {elem} not a valid file_id!'
+                assert self.file_infos.contains_file_id(file_id = elem), f'"input_file_ids" has to be list of file_ids (given as strings)! {elem} not a valid file_id!'
         if overwrite == True:
             file_ids_to_process = input_file_ids
         else:
@@ -301,6 +379,61 @@ class Database:
         return file_ids_to_process
 
 
+    def create_file_specific_copy(self, file_id: str) -> 'Database':
+        """
+        Creates a lightweight copy of the database that holds only the records of the specified file_id.
+        It can be pickled and sent to a worker process, which enables processing of several files in parallel
+        (see "n_workers" in the processing configs). Use "merge_file_specific_copy()" to integrate the
+        changes that were made to the copy back into the database.
+        """
+        assert self.file_infos.contains_file_id(file_id = file_id), f'The file_id you passed ({file_id}) is not a valid file_id!'
+        index = self.file_infos.get_row_index(file_id = file_id)
+        file_specific_database = copy.copy(self)
+        file_specific_database.project_configs = copy.copy(self.project_configs)
+        if hasattr(file_specific_database.project_configs, 'available_processing_modules'):
+            # modules can´t be pickled (same reason why they are removed in API.save_status()):
+            delattr(file_specific_database.project_configs, 'available_processing_modules')
+        file_specific_database.file_infos = FileInfos({key: copy.deepcopy(list_of_values[index:index+1]) for key, list_of_values in self.file_infos.items()})
+        for attr_id in ['file_histories', 'area_rois_for_quantification', 'multi_matches_traceback']:
+            if hasattr(self, attr_id):
+                records = getattr(self, attr_id)
+                file_specific_records = {file_id: copy.deepcopy(records[file_id])} if file_id in records.keys() else {}
+                setattr(file_specific_database, attr_id, file_specific_records)
+        if hasattr(self, 'quantification_results'):
+            file_specific_database.quantification_results = {}
+            for quantification_strategy_class_name, results in self.quantification_results.items():
+                file_specific_database.quantification_results[quantification_strategy_class_name] = {}
+                if file_id in results.keys():
+                    file_specific_database.quantification_results[quantification_strategy_class_name][file_id] = copy.deepcopy(results[file_id])
+        return file_specific_database
+
+
+    def merge_file_specific_copy(self, file_id: str, file_specific_database: 'Database') -> None:
+        """
+        Integrates all changes that were made to a copy created with "create_file_specific_copy()"
+        (e.g. by a worker process) back into the database.
+        """
+        updates = {}
+        for key, list_of_values in file_specific_database.file_infos.items():
+            if len(list_of_values) > 0:
+                updates[key] = list_of_values[0]
+        self.update_file_infos(file_id = file_id, updates = updates)
+        for attr_id in ['file_histories', 'area_rois_for_quantification', 'multi_matches_traceback']:
+            if hasattr(file_specific_database, attr_id):
+                if file_id in getattr(file_specific_database, attr_id).keys():
+                    if hasattr(self, attr_id) == False:
+                        setattr(self, attr_id, {})
+                    getattr(self, attr_id)[file_id] = getattr(file_specific_database, attr_id)[file_id]
+        if hasattr(file_specific_database, 'quantification_results'):
+            if hasattr(self, 'quantification_results') == False:
+                self.quantification_results = {}
+            for quantification_strategy_class_name, results in file_specific_database.quantification_results.items():
+                if file_id in results.keys():
+                    if quantification_strategy_class_name not in self.quantification_results.keys():
+                        self.quantification_results[quantification_strategy_class_name] = {}
+                    self.quantification_results[quantification_strategy_class_name][file_id] = results[file_id]
+
+
     def import_rois_dict(self, file_id: str, rois_dict: Dict[str, Dict[str, Polygon]]) -> None:
         if hasattr(self, 'area_rois_for_quantification') == False:
             self.area_rois_for_quantification = {}
@@ -316,9 +449,13 @@ class Database:
 
         
     def _remove_file_id_from_file_infos(self, file_id: str) -> None:
-        index = self.file_infos['file_id'].index(file_id)
-        for key in self.file_infos.keys():
-            self.file_infos[key].pop(index)
+        if hasattr(self, 'microscopy_images_snapshot') == True:
+            # ensures that the subject subdirectory is scanned again, in case the source file still exists:
+            file_infos = self.file_infos.get_row(file_id = file_id)
+            subject_dir_ids = (file_infos['main_group_id'], file_infos['subgroup_id'], file_infos['subject_id'])
+            if subject_dir_ids in self.microscopy_images_snapshot.keys():
+                self.microscopy_images_snapshot.pop(subject_dir_ids)
+        self.file_infos.remove_row(file_id = file_id)
     
     
     def _remove_file_id_from_file_histories(self, file_id: str) -> None:
@@ -344,6 +481,7 @@ class Database:
             processing_subdir_name = getattr(self, f'{processing_subdir_attr_id}_dir')
             processing_subdir_path = self.project_configs.root_dir.joinpath(processing_subdir_name)
             self._delete_matching_files_from_subdir(subdir_path = processing_subdir_path, file_id = file_id)
+        self._delete_matching_files_from_subdir(subdir_path = self._get_postprocessed_segmentations_dir_path(), file_id = file_id)
         quantified_segmentations_subdir_path = self.project_configs.root_dir.joinpath(self.quantified_segmentations_dir)
         all_area_id_subdir_paths = utils.list_dir_no_hidden(path = quantified_segmentations_subdir_path, only_dirs = True)
         for area_id_subdir_path in all_area_id_subdir_paths:
@@ -351,10 +489,60 @@ class Database:
             
             
     def _delete_matching_files_from_subdir(self, subdir_path: Union[PosixPath, WindowsPath], file_id: str) -> None:
+        get_stack_storage(project_configs = self.project_configs).delete_stack(dir_path = subdir_path, file_id = file_id)
         all_filepaths_in_subdir = utils.list_dir_no_hidden(path = subdir_path, only_files = True)
         associated_filepaths = [filepath for filepath in all_filepaths_in_subdir if filepath.name.startswith(file_id)]
         for filepath_to_delete in associated_filepaths:
-            filepath_to_delete.delete()
+            filepath_to_delete.unlink()
+
+            
+    def _get_postprocessed_segmentations_dir_path(self) -> Path:
+        # projects that were created with earlier versions don´t have this subdirectory yet:
+        if hasattr(self, 'postprocessed_segmentations_dir') == False:
+            self._find_or_create_subdir(target_name = 'postprocessed_segmentations', keywords = ['postprocessed', 'Postprocessed'])
+        return self.project_configs.root_dir.joinpath(self.postprocessed_segmentations_dir)
+
+
+    def save_postprocessed_segmentations(self, file_id: str, masked_label_stacks: utils.MaskedLabelStacks) -> None:
+        """
+        Saves the label stack of the file only once (in the postprocessed segmentations subdirectory), while 
+        only the ids of the labels that are kept for each area ROI are saved in the corresponding subdirectory 
+        of the quantified segmentations subdirectory (as "{file_id}_kept_label_ids.npy").
+        """
+        stack_storage = get_stack_storage(project_configs = self.project_configs)
+        stack_storage.save_stack(dir_path = self._get_postprocessed_segmentations_dir_path(), 
+                                 file_id = file_id, 
+                                 stack = masked_label_stacks.label_stack)
+        for area_roi_id, kept_label_ids in masked_label_stacks.kept_label_ids_per_area_roi_id.items():
+            target_dir_path = self.project_configs.root_dir.joinpath(self.quantified_segmentations_dir, area_roi_id)
+            if target_dir_path.is_dir() == False:
+                target_dir_path.mkdir()
+            # remove masked stacks that were saved by earlier versions:
+            stack_storage.delete_stack(dir_path = target_dir_path, file_id = file_id)
+            np.save(target_dir_path.joinpath(f'{file_id}_kept_label_ids.npy'), kept_label_ids)
+
+
+    def load_postprocessed_segmentations(self, file_id: str) -> Dict[str, np.ndarray]:
+        """
+        Returns the postprocessed segmentations of the file per area ROI id, as lazily masked views of its 
+        label stack (see `utils.MaskedLabelStacks`). Segmentations that were saved by earlier versions 
+        (i.e. an individual stack per area ROI) are loaded as they are.
+        """
+        quantified_segmentations_dir_path = self.project_configs.root_dir.joinpath(self.quantified_segmentations_dir)
+        stack_storage = get_stack_storage(project_configs = self.project_configs)
+        kept_label_ids_per_area_roi_id = {}
+        segmentations_per_area_roi_id = {}
+        for area_roi_id_dir_path in utils.list_dir_no_hidden(path = quantified_segmentations_dir_path, only_dirs = True):
+            kept_label_ids_filepath = area_roi_id_dir_path.joinpath(f'{file_id}_kept_label_ids.npy')
+            if kept_label_ids_filepath.is_file() == True:
+                kept_label_ids_per_area_roi_id[area_roi_id_dir_path.name] = np.load(kept_label_ids_filepath)
+            elif stack_storage.has_stack(dir_path = area_roi_id_dir_path, file_id = file_id) == True:
+                segmentations_per_area_roi_id[area_roi_id_dir_path.name] = stack_storage.load_stack(dir_path = area_roi_id_dir_path, file_id = file_id)
+        if len(kept_label_ids_per_area_roi_id) > 0:
+            label_stack = stack_storage.load_stack(dir_path = self._get_postprocessed_segmentations_dir_path(), file_id = file_id)
+            segmentations_per_area_roi_id = utils.MaskedLabelStacks(label_stack = label_stack, 
+                                                                    kept_label_ids_per_area_roi_id = kept_label_ids_per_area_roi_id)
+        return segmentations_per_area_roi_id
 
             
     def export_quantification_results(self,
@@ -449,3 +637,71 @@ class FileHistory:
     def mark_processing_step_as_completed(self, processing_step_id: str) -> None:
         assert processing_step_id in self.completed_processing_steps.keys(), 'This processing step has not been started yet!'
         self.completed_processing_steps[processing_step_id] = True
+
+# %% ../nbs/api/02_database.ipynb 6
+class FileInfos(dict):
+    """
+    Holds the file infos of a `Database` in the same layout as before (i.e. a dictionary with the
+    info types as keys - e.g. "file_id" or "microscopy_filepath" - and lists with one entry per file
+    as values), but additionally maintains a hash index that maps each file_id to its row. This allows
+    to look up the infos of individual files without scanning the entire list of file_ids.
+    """
+    
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._rebuild_row_index()
+        
+        
+    def _rebuild_row_index(self) -> None:
+        self.row_index = {file_id: row for row, file_id in enumerate(self.get('file_id', []))}
+        
+        
+    def get_row_index(self, file_id: str) -> Optional[int]:
+        all_file_ids = self.get('file_id', [])
+        row = self.row_index.get(file_id)
+        if row == None:
+            index_is_outdated = len(self.row_index) != len(all_file_ids)
+        else:
+            index_is_outdated = (row >= len(all_file_ids)) or (all_file_ids[row] != file_id)
+        if index_is_outdated == True:
+            # the lists were modified directly (i.e. not via append_row() or remove_row()):
+            self._rebuild_row_index()
+            row = self.row_index.get(file_id)
+        return row
+    
+    
+    def contains_file_id(self, file_id: str) -> bool:
+        return self.get_row_index(file_id = file_id) != None
+    
+    
+    def get_row(self, file_id: str) -> Dict:
+        """
+        Returns the infos of the specified file_id for all keys that have a value for each file.
+        """
+        row = self.get_row_index(file_id = file_id)
+        assert row != None, f'The file_id you passed ({file_id}) is not a valid file_id!'
+        number_of_files = len(self['file_id'])
+        return {key: list_of_values[row] for key, list_of_values in self.items() if len(list_of_values) == number_of_files}
+    
+    
+    def append_row(self, row_values: Dict) -> None:
+        """
+        Adds the infos of a new file. Keys that are missing in "row_values" are filled with None,
+        such that all lists keep the same length as file_infos["file_id"].
+        """
+        assert 'file_id' in row_values.keys(), '"row_values" has to contain the file_id of the new file!'
+        assert self.contains_file_id(file_id = row_values['file_id']) == False, f'{row_values["file_id"]} is already in file_infos!'
+        number_of_files = len(self['file_id'])
+        for key, list_of_values in self.items():
+            if len(list_of_values) == number_of_files:
+                list_of_values.append(row_values.get(key))
+        self.row_index[row_values['file_id']] = number_of_files
+        
+        
+    def remove_row(self, file_id: str) -> None:
+        row = self.get_row_index(file_id = file_id)
+        assert row != None, f'The file_id you passed ({file_id}) is not a valid file_id!'
+        for list_of_values in self.values():
+            if len(list_of_values) > row:
+                list_of_values.pop(row)
+        self._rebuild_row_index()
@@ -13,6 +13,7 @@ import numpy as np
 from skimage import io, color
 
 from ..database import Database
+from ..storage import get_stack_storage
 from .. import utils
 from ..configs import DefaultConfigs, GUIConfigs
 
@@ -51,21 +52,22 @@ class InspectionMethod(ABC):
         self.postprocessed_segmentation_mask = self._load_postprocessed_segmentation_mask()
         self.rgb_color_coded_2d_overlay_of_image_and_mask = self._create_rgb_color_coded_2d_overlay_of_image_and_mask()
         self.area_roi_boundary_coords = self._load_area_roi_boundary_coords()
+        self.polygon_cache = utils.PolygonCache()
         self.default_configs = self._initialize_default_configs()
         self.gui_configs = self._initialize_gui_configs()
 
     
     def _load_preprocessed_image(self) -> np.ndarray:
         preprocessed_images_dir_path = self.database.project_configs.root_dir.joinpath(self.database.preprocessed_images_dir)
-        preprocessed_image = utils.load_zstack_as_array_from_single_planes(path = preprocessed_images_dir_path, file_id = self.file_id)
+        stack_storage = get_stack_storage(project_configs = self.database.project_configs)
+        preprocessed_image = stack_storage.load_stack(dir_path = preprocessed_images_dir_path, file_id = self.file_id)
         if type(self.plane_idx) == int:
             preprocessed_image = preprocessed_image[self.plane_idx]
         return preprocessed_image
 
 
     def _load_postprocessed_segmentation_mask(self) -> np.ndarray:
-        postprocessed_masks_dir_path = self.database.project_configs.root_dir.joinpath(self.database.quantified_segmentations_dir, self.area_roi_id)
-        postprocessed_mask = utils.load_zstack_as_array_from_single_planes(path = postprocessed_masks_dir_path, file_id = self.file_id)
+        postprocessed_mask = self.database.load_postprocessed_segmentations(file_id = self.file_id)[self.area_roi_id]
         if type(self.plane_idx) == int:
             postprocessed_mask = postprocessed_mask[self.plane_idx]
         return postprocessed_mask
@@ -106,7 +108,9 @@ class InspectionMethod(ABC):
     
     
     def get_center_coords_from_label_id(self, label_id: int) -> Tuple[int, int]:
-        if self.plane_idx == None: # means shape looks like: (planes, rows, cols, colors)
+        if self.polygon_cache.is_cached(file_id = self.file_id, plane_index = self.plane_idx, label_id = label_id) == True:
+            mask_as_single_plane = None # not required, since the polygon of the label is already cached
+        elif self.plane_idx == None: # means shape looks like: (planes, rows, cols, colors)
             if self.postprocessed_segmentation_mask.shape[0] > 1:
                 mask_cleared_of_all_other_label_ids = self.postprocessed_segmentation_mask.copy()
                 mask_cleared_of_all_other_label_ids[np.where(mask_cleared_of_all_other_label_ids != label_id)] = 0
@@ -115,7 +119,10 @@ class InspectionMethod(ABC):
                 mask_as_single_plane = self.postprocessed_segmentation_mask[0]
         else:
             mask_as_single_plane = self.postprocessed_segmentation_mask
-        feature_roi = utils.get_polygon_from_instance_segmentation(single_plane = mask_as_single_plane, label_id = label_id)
+        feature_roi = self.polygon_cache.get_polygons(file_id = self.file_id, 
+                                                      plane_index = self.plane_idx, 
+                                                      single_plane = mask_as_single_plane, 
+                                                      label_ids = [label_id])[label_id]
         return (feature_roi.centroid.y, feature_roi.centroid.x)
 
 
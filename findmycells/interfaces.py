@@ -8,12 +8,14 @@ __all__ = ['GUI_SPACER', 'API', 'StrategyConfigurator', 'PageButtonBundle', 'Set
 from abc import ABC, abstractmethod
 from pathlib import Path, PosixPath, WindowsPath
 import pathlib
-from typing import List, Dict, Tuple, Optional, Union, Any
+from typing import List, Dict, Tuple, Optional, Union, Any, Callable
 from traitlets.traitlets import MetaHasTraits as WidgetType
 
 import os
+import time
 import pickle
 import random
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 from datetime import datetime
 import ipywidgets as w
@@ -29,6 +31,8 @@ from .segmentation.specs import SegmentationStrategy, SegmentationObject
 from .postprocessing.specs import PostprocessingStrategy, PostprocessingObject
 from .quantification.specs import QuantificationStrategy, QuantificationObject
 from .inspection.methods import InspectionMethod
+from .storage import StackStorageSpecs, get_stack_storage
+from .project_store import SQLiteProjectStore
 from . import utils
 
 # %% ../nbs/api/03_interfaces.ipynb 6
@@ -77,19 +81,51 @@ class API:
         """
         roi_reader_configs = self._assert_and_update_reader_configs_input(reader_type = 'rois', reader_configs = roi_reader_configs)
         self.project_configs.add_reader_configs(reader_type = 'rois', reader_configs = roi_reader_configs)
+        
+        
+    def set_stack_storage_configs(self,
+                                  stack_storage_configs: Optional[Dict]=None # see `StackStorageSpecs` for all options
+                                 ) -> None:
+        """
+        Specifies how the image and segmentation mask stacks created during processing are saved 
+        in the project root directory: either each plane as individual PNG file (default; "backend" = "png"), 
+        or each stack as chunked & compressed Zarr array (set "backend" = "zarr", optionally with 
+        "export_png" = True to save PNG files in addition). Should be set before any processing is done.
+        """
+        if stack_storage_configs == None:
+            stack_storage_configs = {}
+        assert type(stack_storage_configs) == dict, '"stack_storage_configs" has to be a dictionary!'
+        default_configs = StackStorageSpecs().default_configs
+        default_configs.assert_user_input(user_input = stack_storage_configs)
+        stack_storage_configs = default_configs.fill_user_input_with_defaults_where_needed(user_input = stack_storage_configs)
+        valid_backends = default_configs.get_options_if_present(key = 'backend')
+        assert stack_storage_configs['backend'] in valid_backends, f'"backend" has to be one of {valid_backends}, not {stack_storage_configs["backend"]}!'
+        setattr(self.project_configs, 'stack_storage', stack_storage_configs)
     
     
     
     def save_status(self) -> None:
         """
-        Saves the current status of the *findmycells* project in the project root directory. 
-        The data will be split into two files and current date will be used as prefix.
+        Saves the current status of the *findmycells* project in the project store 
+        ("findmycells_project.sqlite") in the project root directory. 
         """
-        date = f'{datetime.now():%Y_%m_%d}'
-        dbase_filename = f'{date}_findmycells_database.dbase'
-        self._save_attr_to_disk(attr_id = 'database', filename = dbase_filename, child_attr_ids_to_del = ['project_configs'])
-        configs_filename = f'{date}_findmycells_project.configs'
-        self._save_attr_to_disk(attr_id = 'project_configs', filename = configs_filename, child_attr_ids_to_del = ['available_processing_modules'])
+        project_store = self._get_project_store()
+        project_store.save_project(project_configs = self.project_configs, database = self.database)
+        self._file_ids_in_saved_status = self.database.file_infos['file_id'].copy()
+        
+        
+    def save_checkpoint(self, file_ids: List[str]) -> None:
+        """
+        Saves the progress of the specified file IDs as incremental checkpoint. Instead of saving the 
+        entire project again (see save_status()), only the records of these files are updated in the 
+        project store. Falls back to save_status() if the project status was not saved or loaded yet, 
+        or if files were added to or removed from the project since then.
+        """
+        if getattr(self, '_file_ids_in_saved_status', None) != self.database.file_infos['file_id']:
+            self.save_status()
+        else:
+            project_store = self._get_project_store()
+            project_store.save_file_records(project_configs = self.project_configs, database = self.database, file_ids = file_ids)
         
         
     def load_status(self,
@@ -97,31 +133,35 @@ class API:
                     database_filepath: Optional[Union[PosixPath, WindowsPath]]=None
                    ) -> None:
         """
-        Loads the project status of a *findmycells* project from the two files (see save_status()) 
-        from the project root directory.
+        Loads the project status of a *findmycells* project from the project store in the project 
+        root directory (see save_status()). Projects that were saved with previous versions of 
+        *findmycells* (i.e. as ".configs" and ".dbase" files) will be migrated to the project store 
+        once. If no project store exists yet, or if you specify the filepaths of such files, they 
+        will be loaded & saved in the project store (the original files remain unchanged).
         """
         if type(Path("test")) == pathlib.PosixPath:
             pathlib.WindowsPath = pathlib.PosixPath
-        if project_configs_filepath != None:
-            assert type(project_configs_filepath) in [PosixPath, WindowsPath], '"project_configs_filepath" must be pathlib.Path object referring to a .configs file.'
-            assert project_configs_filepath.suffix == '.configs', '"project_configs_filepath" must be pathlib.Path object referring to a .configs file.'
-        else:
-            project_configs_filepath = self._look_for_latest_status_file_in_dir(suffix = '.configs', dir_path = self.project_configs.root_dir)
-        if database_filepath != None:
-            assert type(database_filepath) in [PosixPath, WindowsPath], '"database_filepath" must be pathlib.Path object referring to a .dbase file'
-            assert database_filepath.suffix == '.dbase', '"database_filepath" must be pathlib.Path object referring to a .dbase file'
-        else:
-            database_filepath = self._look_for_latest_status_file_in_dir(suffix = '.dbase', dir_path = self.project_configs.root_dir)
+        project_store = self._get_project_store()
+        migrate_pickled_status_files = (project_configs_filepath != None) | (database_filepath != None) | (project_store.exists() == False)
+        if migrate_pickled_status_files == True:
+            project_configs_filepath, database_filepath = self._assert_and_update_pickled_status_filepaths(project_configs_filepath = project_configs_filepath,
+                                                                                                            database_filepath = database_filepath)
         old_root_dir = self.project_configs.root_dir
         if hasattr(self, 'project_configs'):
             delattr(self, 'project_configs')
         if hasattr(self, 'database'):
             delattr(self, 'database')
-        self.project_configs = self._load_object_from_filepath(filepath = project_configs_filepath)
+        if migrate_pickled_status_files == True:
+            self.project_configs = self._load_object_from_filepath(filepath = project_configs_filepath)
+            self.database = self._load_object_from_filepath(filepath = database_filepath)
+        else:
+            self.project_configs, self.database = project_store.load_project()
         self.project_configs.load_available_processing_modules()
         self.project_configs.root_dir = old_root_dir
-        self.database = self._load_object_from_filepath(filepath = database_filepath)
         setattr(self.database, 'project_configs', self.project_configs)
+        if migrate_pickled_status_files == True:
+            self.save_status()
+        self._file_ids_in_saved_status = self.database.file_infos['file_id'].copy()
         
         
     def preprocess(self,
@@ -144,18 +184,19 @@ class API:
         self._assert_reader_configs_are_present()
         microscopy_reader_configs = getattr(self.project_configs, 'microscopy_images')
         roi_reader_configs = getattr(self.project_configs, 'rois')
-        for file_id in tqdm(file_ids, display = processing_configs['show_progress']):
-            preprocessing_object = PreprocessingObject()
-            preprocessing_object.prepare_for_processing(file_ids = [file_id], database = self.database)
-            preprocessing_object.load_image_and_rois(microscopy_reader_configs = microscopy_reader_configs, roi_reader_configs = roi_reader_configs)
-            preprocessing_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
-            preprocessing_object.save_preprocessed_images_on_disk()
-            preprocessing_object.save_preprocessed_rois_in_database()
-            preprocessing_object.update_database(mark_as_completed = True)
-            del preprocessing_object
-            if processing_configs['autosave'] == True:
-                self.save_status()
-                self.load_status()    
+        strategy_configs = self._prepare_project_wide_preprocessing_strategies(strategies = strategies,
+                                                                               strategy_configs = strategy_configs,
+                                                                               processing_configs = processing_configs,
+                                                                               file_ids = file_ids,
+                                                                               microscopy_reader_configs = microscopy_reader_configs,
+                                                                               roi_reader_configs = roi_reader_configs)
+        self._run_file_wise_processing(processing_function = _preprocess_single_file,
+                                       file_ids = file_ids,
+                                       processing_configs = processing_configs,
+                                       strategies = strategies,
+                                       strategy_configs = strategy_configs,
+                                       microscopy_reader_configs = microscopy_reader_configs,
+                                       roi_reader_configs = roi_reader_configs)
     
     
     def segment(self,
@@ -175,6 +216,9 @@ class API:
                                                                                        strategy_configs = strategy_configs,
                                                                                        processing_configs = processing_configs,
                                                                                        file_ids = file_ids)
+        self._assert_streaming_of_segmentations_is_possible(strategies = strategies,
+                                                            strategy_configs = strategy_configs,
+                                                            processing_configs = processing_configs)
         file_ids_per_batch = self._split_file_ids_into_batches(file_ids = file_ids, batch_size = processing_configs['batch_size'])
         if processing_configs['run_strategies_individually'] == True:
             self._segment_running_strategies_individually(strategies = strategies,
@@ -213,17 +257,12 @@ class API:
                                                                                        strategy_configs = strategy_configs,
                                                                                        processing_configs = processing_configs,
                                                                                        file_ids = file_ids)
-        for file_id in tqdm(file_ids, display = processing_configs['show_progress']):
-            postprocessing_object = PostprocessingObject()
-            postprocessing_object.prepare_for_processing(file_ids = [file_id], database = self.database)
-            postprocessing_object.load_segmentations_masks_for_postprocessing(segmentations_to_use = processing_configs['segmentations_to_use'])
-            postprocessing_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
-            postprocessing_object.save_postprocessed_segmentations()
-            postprocessing_object.update_database(mark_as_completed = True)
-            del postprocessing_object
-            if processing_configs['autosave'] == True:
-                self.save_status()
-                self.load_status()    
+        self._run_file_wise_processing(processing_function = _postprocess_single_file,
+                                       file_ids = file_ids,
+                                       processing_configs = processing_configs,
+                                       strategies = strategies,
+                                       strategy_configs = strategy_configs,
+                                       segmentations_to_use = processing_configs['segmentations_to_use'])
     
     
     def quantify(self,
@@ -243,15 +282,11 @@ class API:
                                                                                        strategy_configs = strategy_configs,
                                                                                        processing_configs = processing_configs,
                                                                                        file_ids = file_ids)
-        for file_id in tqdm(file_ids, display = processing_configs['show_progress']):
-            quantification_object = QuantificationObject()
-            quantification_object.prepare_for_processing(file_ids = [file_id], database = self.database)
-            quantification_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
-            quantification_object.update_database(mark_as_completed = True)
-            del quantification_object
-            if processing_configs['autosave'] == True:
-                self.save_status()
-                self.load_status()
+        self._run_file_wise_processing(processing_function = _quantify_single_file,
+                                       file_ids = file_ids,
+                                       processing_configs = processing_configs,
+                                       strategies = strategies,
+                                       strategy_configs = strategy_configs)
                 
                 
     def initialize_inspection(self,
@@ -291,6 +326,32 @@ class API:
         self.database.export_quantification_results(export_as = export_as)
 
 
+    def _assert_streaming_of_segmentations_is_possible(self,
+                                                       strategies: List[SegmentationStrategy],
+                                                       strategy_configs: List[Dict],
+                                                       processing_configs: Dict
+                                                      ) -> None:
+        """
+        Semantic segmentation strategies that stream their results (see `SoftmaxStream`) start processing right
+        away in the background. Hence, it has to be ensured upfront that their results can also be consumed.
+        """
+        for strategy_idx, strategy in enumerate(strategies):
+            if strategy().streams_results(strategy_configs = strategy_configs[strategy_idx]) == False:
+                continue
+            strategy_name = strategy.__name__
+            assert processing_configs['run_strategies_individually'] == False, (f'"{strategy_name}" can only stream its results, if the '
+                                                                                'strategies are not run individually. Please set '
+                                                                                '"run_strategies_individually" to False, or disable streaming.')
+            assert strategy_idx + 1 < len(strategies), (f'"{strategy_name}" can only stream its results to a subsequent instance segmentation '
+                                                        'strategy. Please add one right after it, or disable streaming.')
+            consuming_strategy = strategies[strategy_idx + 1]
+            consumption_not_possible_message = (f'"{consuming_strategy.__name__}" cannot consume the streamed results of "{strategy_name}" '
+                                                'with its current configs. Please check its description (e.g. the diameter has to be '
+                                                'specified for cellpose, since it cannot be computed while the semantic segmentations '
+                                                'are still running), or disable streaming.')
+            assert consuming_strategy().can_consume_streamed_results(strategy_configs = strategy_configs[strategy_idx + 1]), consumption_not_possible_message
+    
+    
     def _assert_reader_configs_are_present(self) -> None:
         assert_message = ('You have to specify your {} reader configs first before running ".preprocess()".'
                           'You can do this by running the ".set_{}_reader_configs()" method first!')
@@ -311,6 +372,96 @@ class API:
         return reader_configs
     
    
+    def _run_file_wise_processing(self,
+                                  processing_function: Callable,
+                                  file_ids: List[str],
+                                  processing_configs: Dict,
+                                  **kwargs
+                                 ) -> None:
+        """
+        Calls "processing_function" for each file_id. If "n_workers" in the processing configs is 
+        larger than 1, the files are distributed across a pool of worker processes. Each worker 
+        processes a file-specific copy of the database, which is merged back into the database of 
+        the project (in the order of "file_ids") as soon as the corresponding file is done. 
+        """
+        n_workers = min(processing_configs['n_workers'], len(file_ids))
+        autosave_scheduler = _AutosaveScheduler(api = self, processing_configs = processing_configs)
+        try:
+            if n_workers > 1:
+                with ProcessPoolExecutor(max_workers = n_workers) as executor:
+                    futures = []
+                    for file_id in file_ids:
+                        file_specific_database = self.database.create_file_specific_copy(file_id = file_id)
+                        futures.append(executor.submit(processing_function, file_id, file_specific_database, **kwargs))
+                    for file_id, future in tqdm(zip(file_ids, futures), total = len(file_ids), display = processing_configs['show_progress']):
+                        processed_file_specific_database = future.result()
+                        self.database.merge_file_specific_copy(file_id = file_id, file_specific_database = processed_file_specific_database)
+                        autosave_scheduler.add_processed_file_ids(file_ids = [file_id])
+            else:
+                for file_id in tqdm(file_ids, display = processing_configs['show_progress']):
+                    processing_function(file_id, self.database, **kwargs)
+                    autosave_scheduler.add_processed_file_ids(file_ids = [file_id])
+        finally:
+            autosave_scheduler.save_pending_checkpoint()
+
+
+    def _prepare_project_wide_preprocessing_strategies(self,
+                                                       strategies: List[PreprocessingStrategy],
+                                                       strategy_configs: List[Dict],
+                                                       processing_configs: Dict,
+                                                       file_ids: List[str],
+                                                       microscopy_reader_configs: Dict,
+                                                       roi_reader_configs: Dict
+                                                      ) -> List[Dict]:
+        """
+        Some preprocessing strategies need information from all files before any file can be processed
+        (e.g. `AdjustBrightnessAndContrastStrat` with project-wide limits). For each of them, all preceding
+        strategies are run on every file of the project (not only on the files that shall be processed now), 
+        using file-specific copies of the database that are discarded afterwards (i.e. nothing is saved or 
+        tracked), and the collected data is added to its configs. The resulting configs are stored in the
+        project configs and reused in later runs (e.g. for files that are added to the project later on), as
+        long as the strategies and their configs remain unchanged.
+        """
+        if len(file_ids) == 0:
+            return strategy_configs
+        if hasattr(self.project_configs, 'project_wide_preprocessing_configs') == False:
+            setattr(self.project_configs, 'project_wide_preprocessing_configs', {})
+        for strategy_idx, strategy in enumerate(strategies):
+            if strategy().requires_project_wide_preparation(strategy_configs = strategy_configs[strategy_idx]) == False:
+                continue
+            preparation_inputs = {'strategies': [preceding_strategy.__name__ for preceding_strategy in strategies[:strategy_idx + 1]],
+                                  'strategy_configs': strategy_configs[:strategy_idx + 1],
+                                  'microscopy_reader_configs': microscopy_reader_configs,
+                                  'roi_reader_configs': roi_reader_configs}
+            stored_preparation = self.project_configs.project_wide_preprocessing_configs.get(strategy.__name__)
+            if stored_preparation != None:
+                if stored_preparation['preparation_inputs'] == preparation_inputs:
+                    strategy_configs[strategy_idx] = stored_preparation['strategy_configs'].copy()
+                    continue
+            all_file_ids = self.database.file_infos['file_id'].copy()
+            kwargs = {'strategies': strategies[:strategy_idx + 1],
+                      'strategy_configs': strategy_configs[:strategy_idx + 1],
+                      'microscopy_reader_configs': microscopy_reader_configs,
+                      'roi_reader_configs': roi_reader_configs}
+            n_workers = min(processing_configs['n_workers'], len(all_file_ids))
+            if n_workers > 1:
+                with ProcessPoolExecutor(max_workers = n_workers) as executor:
+                    futures = [executor.submit(_collect_file_specific_preprocessing_data, 
+                                               file_id, 
+                                               self.database.create_file_specific_copy(file_id = file_id), 
+                                               **kwargs) for file_id in all_file_ids]
+                    file_specific_data = [future.result() for future in futures]
+            else:
+                file_specific_data = [_collect_file_specific_preprocessing_data(file_id, 
+                                                                                self.database.create_file_specific_copy(file_id = file_id),
+                                                                                **kwargs) for file_id in all_file_ids]
+            strategy_configs[strategy_idx] = strategy().add_project_wide_data_to_configs(file_specific_data = file_specific_data,
+                                                                                         strategy_configs = strategy_configs[strategy_idx])
+            self.project_configs.project_wide_preprocessing_configs[strategy.__name__] = {'preparation_inputs': preparation_inputs,
+                                                                                          'strategy_configs': strategy_configs[strategy_idx].copy()}
+        return strategy_configs
+
+
     def _segment_running_strategies_individually(self,
                                                  strategies: List[SegmentationStrategy],
                                                  strategy_configs: List[Dict],
@@ -318,24 +469,26 @@ class API:
                                                  file_ids_per_batch: List[List[str]]
                                                 ) -> None:
         total_strategy_count = len(strategies)
-        for i in tqdm(range(total_strategy_count), display = processing_configs['show_progress']):
-            if processing_configs['show_progress'] == True:
-                print(f'Starting with segmentation strategy #{i+1}')
-            strategy, config = strategies[i], strategy_configs[i]
-            for batch_file_ids in tqdm(file_ids_per_batch, display = processing_configs['show_progress']):
+        autosave_scheduler = _AutosaveScheduler(api = self, processing_configs = processing_configs)
+        try:
+            for i in tqdm(range(total_strategy_count), display = processing_configs['show_progress']):
                 if processing_configs['show_progress'] == True:
-                    print(f'Starting with batch #{file_ids_per_batch.index(batch_file_ids) + 1}')
-                segmentation_object = SegmentationObject()
-                segmentation_object.prepare_for_processing(file_ids = batch_file_ids, database = self.database)
-                segmentation_object.run_all_strategies(strategies = [strategy], strategy_configs = [config])
-                if i == total_strategy_count - 1: # if this is the last strategy that needs to be run
-                    segmentation_object.update_database(mark_as_completed = True)
-                else:
-                    segmentation_object.update_database(mark_as_completed = False)
-                del segmentation_object
-                if processing_configs['autosave'] == True:
-                    self.save_status()
-                    self.load_status()
+                    print(f'Starting with segmentation strategy #{i+1}')
+                strategy, config = strategies[i], strategy_configs[i]
+                for batch_file_ids in tqdm(file_ids_per_batch, display = processing_configs['show_progress']):
+                    if processing_configs['show_progress'] == True:
+                        print(f'Starting with batch #{file_ids_per_batch.index(batch_file_ids) + 1}')
+                    segmentation_object = SegmentationObject()
+                    segmentation_object.prepare_for_processing(file_ids = batch_file_ids, database = self.database)
+                    segmentation_object.run_all_strategies(strategies = [strategy], strategy_configs = [config])
+                    if i == total_strategy_count - 1: # if this is the last strategy that needs to be run
+                        segmentation_object.update_database(mark_as_completed = True)
+                    else:
+                        segmentation_object.update_database(mark_as_completed = False)
+                    del segmentation_object
+                    autosave_scheduler.add_processed_file_ids(file_ids = batch_file_ids)
+        finally:
+            autosave_scheduler.save_pending_checkpoint()
 
 
     def _segment_running_strategies_consecutively(self,
@@ -344,15 +497,17 @@ class API:
                                                   processing_configs: Dict,
                                                   file_ids_per_batch: List[List[str]]
                                                  ) -> None:
-        for batch_file_ids in tqdm(file_ids_per_batch, display = processing_configs['show_progress']):
-            segmentation_object = SegmentationObject()
-            segmentation_object.prepare_for_processing(file_ids = batch_file_ids, database = self.database)
-            segmentation_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
-            segmentation_object.update_database(mark_as_completed = True)
-            del segmentation_object
-            if processing_configs['autosave'] == True:
-                self.save_status()
-                self.load_status()
+        autosave_scheduler = _AutosaveScheduler(api = self, processing_configs = processing_configs)
+        try:
+            for batch_file_ids in tqdm(file_ids_per_batch, display = processing_configs['show_progress']):
+                segmentation_object = SegmentationObject()
+                segmentation_object.prepare_for_processing(file_ids = batch_file_ids, database = self.database)
+                segmentation_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
+                segmentation_object.update_database(mark_as_completed = True)
+                del segmentation_object
+                autosave_scheduler.add_processed_file_ids(file_ids = batch_file_ids)
+        finally:
+            autosave_scheduler.save_pending_checkpoint()
                 
 
     def _check_if_all_files_have_finished_current_processing_step(self, processing_step_id: str) -> bool:
@@ -368,21 +523,32 @@ class API:
 
         
     
-    def _save_attr_to_disk(self, attr_id: str, filename: str, child_attr_ids_to_del: List[str]) -> None:
-        filepath = self.project_configs.root_dir.joinpath(filename)
-        attribute_to_save = getattr(self, attr_id)
-        
-        for attr_id_to_del in child_attr_ids_to_del:
-            delattr(attribute_to_save, attr_id_to_del)
-        filehandler = open(filepath, 'wb')
-        pickle.dump(attribute_to_save, filehandler)
+    def _get_project_store(self) -> SQLiteProjectStore:
+        return SQLiteProjectStore(filepath = self.project_configs.root_dir.joinpath('findmycells_project.sqlite'))
+    
+    
+    def _assert_and_update_pickled_status_filepaths(self,
+                                                    project_configs_filepath: Optional[Union[PosixPath, WindowsPath]],
+                                                    database_filepath: Optional[Union[PosixPath, WindowsPath]]
+                                                   ) -> Tuple[Union[PosixPath, WindowsPath], Union[PosixPath, WindowsPath]]:
+        if project_configs_filepath != None:
+            assert type(project_configs_filepath) in [PosixPath, WindowsPath], '"project_configs_filepath" must be pathlib.Path object referring to a .configs file.'
+            assert project_configs_filepath.suffix == '.configs', '"project_configs_filepath" must be pathlib.Path object referring to a .configs file.'
+        else:
+            project_configs_filepath = self._look_for_latest_status_file_in_dir(suffix = '.configs', dir_path = self.project_configs.root_dir)
+        if database_filepath != None:
+            assert type(database_filepath) in [PosixPath, WindowsPath], '"database_filepath" must be pathlib.Path object referring to a .dbase file'
+            assert database_filepath.suffix == '.dbase', '"database_filepath" must be pathlib.Path object referring to a .dbase file'
+        else:
+            database_filepath = self._look_for_latest_status_file_in_dir(suffix = '.dbase', dir_path = self.project_configs.root_dir)
+        return project_configs_filepath, database_filepath
 
         
     def _load_object_from_filepath(self, filepath: Union[PosixPath, WindowsPath]) -> Union[Database, ProjectConfigs]:
-        filehandler = open(filepath, 'rb')
-        loaded_object = pickle.load(filehandler)
+        with open(filepath, 'rb') as filehandler:
+            loaded_object = pickle.load(filehandler)
         return loaded_object
-        
+
 
     def _split_file_ids_into_batches(self, file_ids: List[str], batch_size: int) -> List[List[str]]:
         """
@@ -473,7 +639,7 @@ class API:
         if file_ids != None:
             assert type(file_ids) == list, '"file_ids" has to be a list of strings referring to file_ids in the database!'
             for elem in file_ids:
-                assert elem in self.database.file_infos['file_id'], f'{elem} is not a valid file_id!'
+                assert self.database.file_infos.contains_file_id(file_id = elem), f'{elem} is not a valid file_id!'
         
         
     def _fill_processing_configs_with_defaults_where_needed(self,
@@ -499,10 +665,115 @@ class API:
                 all_final_configs.append(full_configs)
         return all_final_configs
 
-# %% ../nbs/api/03_interfaces.ipynb 23
+# %% ../nbs/api/03_interfaces.ipynb 7
+def _preprocess_single_file(file_id: str,
+                            database: Database,
+                            strategies: List[PreprocessingStrategy],
+                            strategy_configs: List[Dict],
+                            microscopy_reader_configs: Dict,
+                            roi_reader_configs: Dict
+                           ) -> Database:
+    preprocessing_object = PreprocessingObject()
+    preprocessing_object.prepare_for_processing(file_ids = [file_id], database = database)
+    preprocessing_object.load_image_and_rois(microscopy_reader_configs = microscopy_reader_configs, 
+                                             roi_reader_configs = roi_reader_configs,
+                                             strategies = strategies,
+                                             strategy_configs = strategy_configs)
+    preprocessing_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
+    preprocessing_object.save_preprocessed_images_on_disk()
+    preprocessing_object.save_preprocessed_rois_in_database()
+    preprocessing_object.update_database(mark_as_completed = True)
+    del preprocessing_object
+    return database
+
+
+def _collect_file_specific_preprocessing_data(file_id: str,
+                                              database: Database,
+                                              strategies: List[PreprocessingStrategy],
+                                              strategy_configs: List[Dict],
+                                              microscopy_reader_configs: Dict,
+                                              roi_reader_configs: Dict
+                                             ) -> Any:
+    # the last strategy is the one that collects the data, all preceding strategies are run as usual:
+    preprocessing_object = PreprocessingObject()
+    preprocessing_object.prepare_for_processing(file_ids = [file_id], database = database)
+    preprocessing_object.load_image_and_rois(microscopy_reader_configs = microscopy_reader_configs, 
+                                             roi_reader_configs = roi_reader_configs,
+                                             strategies = strategies[:-1],
+                                             strategy_configs = strategy_configs[:-1])
+    preprocessing_object.run_all_strategies(strategies = strategies[:-1], strategy_configs = strategy_configs[:-1])
+    file_specific_data = strategies[-1]().collect_file_specific_data(processing_object = preprocessing_object, strategy_configs = strategy_configs[-1])
+    del preprocessing_object
+    return file_specific_data
+
+
+def _postprocess_single_file(file_id: str,
+                             database: Database,
+                             strategies: List[PostprocessingStrategy],
+                             strategy_configs: List[Dict],
+                             segmentations_to_use: str
+                            ) -> Database:
+    postprocessing_object = PostprocessingObject()
+    postprocessing_object.prepare_for_processing(file_ids = [file_id], database = database)
+    postprocessing_object.load_segmentations_masks_for_postprocessing(segmentations_to_use = segmentations_to_use)
+    postprocessing_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
+    postprocessing_object.save_postprocessed_segmentations()
+    postprocessing_object.update_database(mark_as_completed = True)
+    del postprocessing_object
+    return database
+
+
+def _quantify_single_file(file_id: str,
+                          database: Database,
+                          strategies: List[QuantificationStrategy],
+                          strategy_configs: List[Dict]
+                         ) -> Database:
+    quantification_object = QuantificationObject()
+    quantification_object.prepare_for_processing(file_ids = [file_id], database = database)
+    quantification_object.run_all_strategies(strategies = strategies, strategy_configs = strategy_configs)
+    quantification_object.update_database(mark_as_completed = True)
+    del quantification_object
+    return database
+
+# %% ../nbs/api/03_interfaces.ipynb 8
+class _AutosaveScheduler:
+    
+    """
+    Collects the IDs of all files that were processed while autosave is enabled and saves them 
+    as incremental checkpoint (see API.save_checkpoint()) as soon as "autosave_every_n_files" 
+    files are pending, or "autosave_every_n_seconds" have passed since the last checkpoint. 
+    """
+    
+    def __init__(self, api: API, processing_configs: Dict) -> None:
+        self.api = api
+        self.autosave = processing_configs['autosave']
+        self.every_n_files = processing_configs['autosave_every_n_files']
+        self.every_n_seconds = processing_configs['autosave_every_n_seconds']
+        self.pending_file_ids = []
+        self.last_checkpoint_time = time.monotonic()
+        
+        
+    def add_processed_file_ids(self, file_ids: List[str]) -> None:
+        if self.autosave == True:
+            for file_id in file_ids:
+                if file_id not in self.pending_file_ids:
+                    self.pending_file_ids.append(file_id)
+            if len(self.pending_file_ids) >= self.every_n_files:
+                self.save_pending_checkpoint()
+            elif (self.every_n_seconds > 0) & (time.monotonic() - self.last_checkpoint_time >= self.every_n_seconds):
+                self.save_pending_checkpoint()
+                
+                
+    def save_pending_checkpoint(self) -> None:
+        if (self.autosave == True) & (len(self.pending_file_ids) > 0):
+            self.api.save_checkpoint(file_ids = self.pending_file_ids)
+            self.pending_file_ids = []
+            self.last_checkpoint_time = time.monotonic()
+
+# %% ../nbs/api/03_interfaces.ipynb 25
 GUI_SPACER = w.Label(value = '', layout = {'height': '30px'})
 
-# %% ../nbs/api/03_interfaces.ipynb 24
+# %% ../nbs/api/03_interfaces.ipynb 26
 class StrategyConfigurator:
     
     """
@@ -653,7 +924,7 @@ class StrategyConfigurator:
         new_selection = change.new
         self.displayed_strat_widget.children = (new_selection.widget, )
 
-# %% ../nbs/api/03_interfaces.ipynb 26
+# %% ../nbs/api/03_interfaces.ipynb 28
 class PageButtonBundle(ABC):
     
     
@@ -684,7 +955,7 @@ class PageButtonBundle(ABC):
         self.navigator_button.style.button_color = 'skyblue'
         self.gui_page_screen.children = (self.page_content, self.displayed_output)
 
-# %% ../nbs/api/03_interfaces.ipynb 28
+# %% ../nbs/api/03_interfaces.ipynb 30
 class SettingsPage(PageButtonBundle):
     
     """
@@ -1026,7 +1297,6 @@ class SettingsPage(PageButtonBundle):
             
     def _save_project_button_clicked(self, b) -> None:
         self.api.save_status()
-        self.api.load_status()
     
     
     def _load_project_button_clicked(self, b) -> None:
@@ -1089,7 +1359,7 @@ class SettingsPage(PageButtonBundle):
             self.processing_step_details_output.clear_output()
             display(processing_step_settings_df)
 
-# %% ../nbs/api/03_interfaces.ipynb 30
+# %% ../nbs/api/03_interfaces.ipynb 32
 class ProcessingStepPage(PageButtonBundle):
     
         
@@ -1241,7 +1511,7 @@ class ProcessingStepPage(PageButtonBundle):
             options = ['Please load files to your project first']
             value = ('Please load files to your project first', 'Please load files to your project first')
 
-# %% ../nbs/api/03_interfaces.ipynb 32
+# %% ../nbs/api/03_interfaces.ipynb 34
 class InspectionPage(PageButtonBundle):
     
     
@@ -1314,8 +1584,8 @@ class InspectionPage(PageButtonBundle):
             available_area_roi_ids = list(self.api.database.area_rois_for_quantification[selected_file_id]['all_planes'].keys())
             self.area_roi_id_dropdown.options = available_area_roi_ids
             preprocessed_images_dir = self.api.database.project_configs.root_dir.joinpath(self.api.database.preprocessed_images_dir)
-            all_preprocessed_image_filepaths = utils.list_dir_no_hidden(path = preprocessed_images_dir, only_files = True)
-            total_planes = len([filepath for filepath in all_preprocessed_image_filepaths if filepath.name.startswith(selected_file_id)])
+            stack_storage = get_stack_storage(project_configs = self.api.database.project_configs)
+            total_planes = stack_storage.get_plane_count(dir_path = preprocessed_images_dir, file_id = selected_file_id)
             available_plane_idxs = [('all planes', None)] + [(idx, idx) for idx in range(total_planes)]
             self.plane_idx_dropdown.options = available_plane_idxs
         
@@ -1420,7 +1690,7 @@ class InspectionPage(PageButtonBundle):
             self.output_multi_match.clear_output()
             print(f'x: {int(x_coord)}, and y: {int(y_coord)}')
 
-# %% ../nbs/api/03_interfaces.ipynb 34
+# %% ../nbs/api/03_interfaces.ipynb 36
 class GUI:
     
     @property
@@ -1528,7 +1798,7 @@ class GUI:
     def _refresh_displayed_widget(self, new_widget: WidgetType) -> None:
         self.displayed_widget.children = (new_widget, )
 
-# %% ../nbs/api/03_interfaces.ipynb 38
+# %% ../nbs/api/03_interfaces.ipynb 40
 def launch_gui(project_root_dir: Optional[Union[PosixPath, WindowsPath]]=None) -> GUI:
     """
     Function to launch the GUI of *findmycells*. Comes, however, 
@@ -6,10 +6,10 @@ __all__ = ['PostprocessingStrategy', 'PostprocessingObject']
 # %% ../../nbs/api/07_postprocessing_00_specs.ipynb 2
 from abc import abstractmethod
 from typing import Dict, List
-from skimage import io
 
 from ..core import ProcessingObject, ProcessingStrategy
 from ..configs import DefaultConfigs
+from ..storage import get_stack_storage
 from .. import utils
 
 # %% ../../nbs/api/07_postprocessing_00_specs.ipynb 4
@@ -39,15 +39,21 @@ class PostprocessingObject(ProcessingObject):
         widget_names = {'segmentations_to_use': 'Dropdown',
                         'overwrite': 'Checkbox',
                         'autosave': 'Checkbox',
-                        'show_progress': 'Checkbox'}
+                        'autosave_every_n_files': 'BoundedIntText',
+                        'autosave_every_n_seconds': 'BoundedIntText',
+                        'show_progress': 'Checkbox',
+                        'n_workers': 'BoundedIntText'}
         return widget_names
 
     @property
     def descriptions(self):
         descriptions = {'segmentations_to_use': 'continue with semantic or instance segmentations',
                         'overwrite': 'overwrite previously processed files',
-                        'autosave': 'autosave progress after each file',
-                        'show_progress': 'show progress bar and estimated computation time'}
+                        'autosave': 'autosave progress (incremental checkpoints)',
+                        'autosave_every_n_files': 'autosave after every n files',
+                        'autosave_every_n_seconds': 'autosave at the latest after n seconds (0 = off)',
+                        'show_progress': 'show progress bar and estimated computation time',
+                        'n_workers': 'number of files to process in parallel (1 = one file after another)'}
         return descriptions
     
     @property
@@ -59,14 +65,24 @@ class PostprocessingObject(ProcessingObject):
         default_values = {'segmentations_to_use': 'instance',
                           'overwrite': False,
                           'autosave': True,
-                          'show_progress': True}
+                          'autosave_every_n_files': 1,
+                          'autosave_every_n_seconds': 0,
+                          'show_progress': True,
+                          'n_workers': 1}
         valid_types = {'segmentations_to_use': [str],
                        'overwrite': [bool],
                        'autosave': [bool],
-                       'show_progress': [bool]}
+                       'autosave_every_n_files': [int],
+                       'autosave_every_n_seconds': [int],
+                       'show_progress': [bool],
+                       'n_workers': [int]}
+        valid_value_ranges = {'autosave_every_n_files': (1, 10000, 1),
+                              'autosave_every_n_seconds': (0, 86400, 1),
+                              'n_workers': (1, 128, 1)}
         valid_options = {'segmentations_to_use': ('semantic', 'instance')}
         default_configs = DefaultConfigs(default_values = default_values,
                                          valid_types = valid_types,
+                                         valid_value_ranges = valid_value_ranges,
                                          valid_value_options = valid_options)
         return default_configs
     
@@ -76,6 +92,7 @@ class PostprocessingObject(ProcessingObject):
         self.file_info = self.database.get_file_infos(file_id = self.file_id)
         self.rois_dict = self.database.area_rois_for_quantification[self.file_id]
         self.segmentations_per_area_roi_id = {}
+        self.polygon_cache = utils.PolygonCache()
         
         
     def load_segmentations_masks_for_postprocessing(self, segmentations_to_use: str) -> None:
@@ -84,18 +101,38 @@ class PostprocessingObject(ProcessingObject):
             masks_dir_path = self.database.project_configs.root_dir.joinpath(self.database.semantic_segmentations_dir)
         else:
             masks_dir_path = self.database.project_configs.root_dir.joinpath(self.database.instance_segmentations_dir)
-        self.postprocessed_segmentations = utils.load_zstack_as_array_from_single_planes(path = masks_dir_path, file_id = self.file_id)
+        stack_storage = get_stack_storage(project_configs = self.database.project_configs)
+        self.postprocessed_segmentations = stack_storage.load_stack(dir_path = masks_dir_path, file_id = self.file_id)
+        
+        
+    def run_all_strategies(self, strategies: List, strategy_configs: List[Dict]) -> None:
+        """
+        Extends the base method by ensuring that no strategy is run after the segmentations per area ROI 
+        were created (see `ApplyExclusionCriteriaStrat`). These are no copies, but refer to the postprocessed
+        segmentations (see `utils.MaskedLabelStacks`), and would therefore be changed by any later strategy.
+        Since strategies may change the segmentations, all cached polygons are invalidated after each strategy.
+        """
+        for strategy, configs in zip(strategies, strategy_configs):
+            if isinstance(self.segmentations_per_area_roi_id, utils.MaskedLabelStacks):
+                raise ValueError(f'"{strategy.__name__}" cannot be run after the segmentations per area ROI were created. '
+                                 'Please make sure to run "ApplyExclusionCriteriaStrat" as the last postprocessing strategy!')
+            super().run_all_strategies(strategies = [strategy], strategy_configs = [configs])
+            self.polygon_cache.invalidate(file_id = self.file_id)
             
     
     def save_postprocessed_segmentations(self) -> None:
+        if isinstance(self.segmentations_per_area_roi_id, utils.MaskedLabelStacks):
+            self.database.save_postprocessed_segmentations(file_id = self.file_id, masked_label_stacks = self.segmentations_per_area_roi_id)
+            return
+        stack_storage = get_stack_storage(project_configs = self.database.project_configs)
         for area_roi_id in self.segmentations_per_area_roi_id.keys():
-            for plane_index in range(self.segmentations_per_area_roi_id[area_roi_id].shape[0]):
-                image = self.segmentations_per_area_roi_id[area_roi_id][plane_index]
-                target_dir_path = self.database.project_configs.root_dir.joinpath(self.database.quantified_segmentations_dir, area_roi_id)
-                if target_dir_path.is_dir() == False:
-                    target_dir_path.mkdir()
-                filepath = target_dir_path.joinpath(f'{self.file_id}-{str(plane_index).zfill(3)}_postprocessed_segmentations.png')
-                io.imsave(filepath, image, check_contrast=False)
+            target_dir_path = self.database.project_configs.root_dir.joinpath(self.database.quantified_segmentations_dir, area_roi_id)
+            if target_dir_path.is_dir() == False:
+                target_dir_path.mkdir()
+            stack_storage.save_stack(dir_path = target_dir_path,
+                                     file_id = self.file_id,
+                                     stack = self.segmentations_per_area_roi_id[area_roi_id],
+                                     filename_suffix = '_postprocessed_segmentations')
 
 
     def _add_processing_specific_infos_to_updates(self, updates: Dict) -> Dict:
@@ -7,9 +7,11 @@ __all__ = ['ReconstructCellsIn3DFrom2DInstanceLabelsStrat', 'FillHolesStrat', 'A
 from typing import Tuple, List, Dict, Optional
 from pathlib import Path
 import numpy as np
+import shapely
 from shapely.geometry import Polygon
 from scipy import ndimage
 from tqdm.notebook import tqdm
+from concurrent.futures import ThreadPoolExecutor
 
 from .specs import PostprocessingObject, PostprocessingStrategy
 from ..database import Database
@@ -50,20 +52,30 @@ class ReconstructCellsIn3DFrom2DInstanceLabelsStrat(PostprocessingStrategy):
     
     def run(self, processing_object: PostprocessingObject, strategy_configs: Dict) -> PostprocessingObject:
         processing_object.postprocessed_segmentations, roi_matching_results = self._run_3d_instance_reconstruction(zstack = processing_object.postprocessed_segmentations,
-                                                                                                                   strategy_configs = strategy_configs)
+                                                                                                                   strategy_configs = strategy_configs,
+                                                                                                                   polygon_cache = processing_object.polygon_cache,
+                                                                                                                   file_id = processing_object.file_id)
         processing_object.database = self._save_multimatches_traceback_to_database(database = processing_object.database,
                                                                                       file_id = processing_object.file_id,
                                                                                       results = roi_matching_results)
         return processing_object
     
     
-    def _run_3d_instance_reconstruction(self, zstack: np.ndarray, strategy_configs: Dict) -> Tuple[np.ndarray, Dict]:
-        pad_width, lowest_final_label_id = 1, 2047 # lowest_final_label_id could be made adjustable via strategy_configs (might be usefull if more than 2048 features?)
-        zstack = np.pad(zstack, pad_width = pad_width, mode = 'constant', constant_values = 0)
-        zstack = zstack[pad_width : zstack.shape[0] - pad_width]
+    def _run_3d_instance_reconstruction(self, 
+                                        zstack: np.ndarray, 
+                                        strategy_configs: Dict, 
+                                        polygon_cache: Optional[utils.PolygonCache]=None, 
+                                        file_id: Optional[str]=None
+                                       ) -> Tuple[np.ndarray, Dict]:
+        lowest_final_label_id = 2047 # lowest_final_label_id could be made adjustable via strategy_configs (might be usefull if more than 2048 features?)
+        if polygon_cache == None:
+            polygon_cache = utils.PolygonCache()
         if strategy_configs['show_progress'] == True:
             print('Matching features across planes...')
-        roi_matching_results = self._get_plane_to_plane_roi_matching_results(zstack = zstack, verbose = strategy_configs['show_progress'])
+        roi_matching_results = self._get_plane_to_plane_roi_matching_results(zstack = zstack, 
+                                                                             verbose = strategy_configs['show_progress'],
+                                                                             polygon_cache = polygon_cache,
+                                                                             file_id = file_id)
         if strategy_configs['show_progress'] == True:
             print('Checking for best and multi matches for all labels per plane...')
         for plane_id in tqdm(range(zstack.shape[0]), display = strategy_configs['show_progress']):
@@ -75,37 +87,28 @@ class ReconstructCellsIn3DFrom2DInstanceLabelsStrat(PostprocessingStrategy):
             print('Applying changes and saving reconstructed results...')
         final_ids, roi_matching_results = self._get_final_id_assignments(results = roi_matching_results,
                                                                          lowest_final_label_id = lowest_final_label_id)
-        zstack = utils.unpad_x_y_dims_in_3d_array(padded_3d_array = zstack, pad_width = pad_width)
         postprocessed_zstack = self._set_new_label_ids(zstack_with_old_label_ids = zstack, new_ids_assignment = final_ids)
         return postprocessed_zstack, roi_matching_results
 
 
-    def _get_plane_to_plane_roi_matching_results(self, zstack: np.ndarray, verbose: bool) -> Dict:
+    def _get_plane_to_plane_roi_matching_results(self, zstack: np.ndarray, verbose: bool, polygon_cache: utils.PolygonCache, file_id: Optional[str]) -> Dict:
+        """
+        All pairs of overlapping labels in two adjacent planes are identified at once via a contingency table of 
+        their pixels (see `_get_overlapping_label_ids`). Each ROI is then converted into a polygon only once (and 
+        only within its bounding box), and the IoUs of all overlapping pairs are computed in a single vectorized call.
+        The polygons are computed on the zero-padded planes, such that the contours of ROIs that touch the image
+        border are closed along the border.
+        """
         z_dim, x_dim, y_dim = zstack.shape
-        results = {}       
-        for plane_idx in tqdm(range(z_dim), display = verbose):
+        rois_per_plane = [polygon_cache.get_polygons(file_id = file_id, plane_index = plane_idx, single_plane = zstack[plane_idx], pad_width = 1) 
+                          for plane_idx in range(z_dim)]
+        results = {}
+        for plane_idx in range(z_dim):
             results[plane_idx] = {}
-            if plane_idx == 0:
-                previous_plane_info = (None, 'previous')
-                next_plane_info = (plane_idx + 1, 'next')
-            elif plane_idx == z_dim - 1:
-                previous_plane_info = (plane_idx - 1, 'previous')
-                next_plane_info = (None, 'next')
-            else:
-                previous_plane_info = (plane_idx - 1, 'previous')
-                next_plane_info = (plane_idx + 1, 'next')
-            plane = zstack[plane_idx]
-            unique_label_ids = list(np.unique(plane))
-            if 0 in unique_label_ids:
-                unique_label_ids.remove(0)
-            elif 0.0 in unique_label_ids:
-                unique_label_ids.remove(0.0)
-            for label_id in unique_label_ids:
-                roi = utils.get_polygon_from_instance_segmentation(single_plane = zstack[plane_idx], label_id = label_id)
-                roi_area = roi.area
+            for label_id, roi in rois_per_plane[plane_idx].items():
                 results[plane_idx][label_id] = {'final_label_id_assigned': False,
                                                 'final_label_id': None,
-                                                'area': roi_area,
+                                                'area': roi.area,
                                                 'matching_ids_previous_plane': [],
                                                 'full_overlap_previous_plane': [],
                                                 'overlapping_area_previous_plane': [],
@@ -120,36 +123,62 @@ class ReconstructCellsIn3DFrom2DInstanceLabelsStrat(PostprocessingStrategy):
                                                 'best_match_next_plane': None,
                                                 'overlapping_area_best_match_next_plane': None,
                                                 'IoU_best_match_next_plane': None}
-                for plane_to_compare_info in [previous_plane_info, next_plane_info]:
-                    if plane_to_compare_info[0] != None:
-                        plane_to_compare_idx, plane_indicator = plane_to_compare_info[0], plane_to_compare_info[1]
-                        labels_of_pixels_in_plane_to_compare = zstack[plane_to_compare_idx][np.where(plane == label_id)]
-                        labels_of_pixels_in_plane_to_compare = list(np.unique(labels_of_pixels_in_plane_to_compare))
-                        if 0 in labels_of_pixels_in_plane_to_compare:
-                            labels_of_pixels_in_plane_to_compare.remove(0)
-                        elif 0.0 in labels_of_pixels_in_plane_to_compare:
-                            labels_of_pixels_in_plane_to_compare.remove(0.0)
-                        for label_id_in_plane_to_compare in labels_of_pixels_in_plane_to_compare:
-                            roi_to_compare = utils.get_polygon_from_instance_segmentation(single_plane = zstack[plane_to_compare_idx], label_id = label_id_in_plane_to_compare)
-                            results[plane_idx][label_id] = self._roi_matching(original_roi = roi, 
-                                                                              roi_to_compare = roi_to_compare, 
-                                                                              label_id_roi_to_compare =  label_id_in_plane_to_compare, 
-                                                                              results = results[plane_idx][label_id], 
-                                                                              plane_indicator = plane_indicator)
-        return results                 
+        for plane_idx in tqdm(range(z_dim - 1), display = verbose):
+            label_ids, label_ids_next_plane = self._get_overlapping_label_ids(single_plane = zstack[plane_idx], 
+                                                                              single_plane_to_compare = zstack[plane_idx + 1])
+            rois = [rois_per_plane[plane_idx][label_id] for label_id in label_ids]
+            rois_next_plane = [rois_per_plane[plane_idx + 1][label_id] for label_id in label_ids_next_plane]
+            results[plane_idx] = self._roi_matching(original_rois = rois, 
+                                                    original_label_ids = label_ids,
+                                                    rois_to_compare = rois_next_plane,
+                                                    label_ids_rois_to_compare = label_ids_next_plane,
+                                                    results = results[plane_idx],
+                                                    plane_indicator = 'next')
+            results[plane_idx + 1] = self._roi_matching(original_rois = rois_next_plane, 
+                                                        original_label_ids = label_ids_next_plane,
+                                                        rois_to_compare = rois,
+                                                        label_ids_rois_to_compare = label_ids,
+                                                        results = results[plane_idx + 1],
+                                                        plane_indicator = 'previous')
+        return results
+    
+    
+    def _get_overlapping_label_ids(self, single_plane: np.ndarray, single_plane_to_compare: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the sparse contingency table of all (label_id, label_id_to_compare) pixel pairs of the two planes 
+        (background excluded) and returns the label_ids of all overlapping pairs, sorted by label_id and then 
+        by label_id_to_compare.
+        """
+        foreground_in_both = (single_plane != 0) & (single_plane_to_compare != 0)
+        label_ids = single_plane[foreground_in_both].astype('int64')
+        label_ids_to_compare = single_plane_to_compare[foreground_in_both].astype('int64')
+        if label_ids.shape[0] == 0:
+            return single_plane[:0], single_plane_to_compare[:0]
+        multiplier = int(label_ids_to_compare.max()) + 1
+        unique_pair_codes = np.unique(label_ids * multiplier + label_ids_to_compare)
+        overlapping_label_ids = (unique_pair_codes // multiplier).astype(single_plane.dtype)
+        overlapping_label_ids_to_compare = (unique_pair_codes % multiplier).astype(single_plane_to_compare.dtype)
+        return overlapping_label_ids, overlapping_label_ids_to_compare
 
     
-    def _roi_matching(self, original_roi: Polygon, roi_to_compare: Polygon, label_id_roi_to_compare: int, results: Dict, plane_indicator: str) -> Dict:
-        iou = original_roi.intersection(roi_to_compare).area / original_roi.union(roi_to_compare).area
-        proportion = original_roi.intersection(roi_to_compare).area / original_roi.area
-        if original_roi.within(roi_to_compare): 
-            within = True
-        else: 
-            within = False
-        results[f'matching_ids_{plane_indicator}_plane'].append(label_id_roi_to_compare)
-        results[f'full_overlap_{plane_indicator}_plane'].append(within)
-        results[f'overlapping_area_{plane_indicator}_plane'].append(proportion)
-        results[f'IoUs_{plane_indicator}_plane'].append(iou)
+    def _roi_matching(self, 
+                      original_rois: List[Polygon], 
+                      original_label_ids: np.ndarray, 
+                      rois_to_compare: List[Polygon], 
+                      label_ids_rois_to_compare: np.ndarray, 
+                      results: Dict, 
+                      plane_indicator: str
+                     ) -> Dict:
+        intersection_areas = shapely.area(shapely.intersection(original_rois, rois_to_compare))
+        union_areas = shapely.area(shapely.union(original_rois, rois_to_compare))
+        original_areas = shapely.area(original_rois)
+        within = shapely.within(original_rois, rois_to_compare)
+        for idx in range(len(original_rois)):
+            label_id_results = results[original_label_ids[idx]]
+            label_id_results[f'matching_ids_{plane_indicator}_plane'].append(label_ids_rois_to_compare[idx])
+            label_id_results[f'full_overlap_{plane_indicator}_plane'].append(bool(within[idx]))
+            label_id_results[f'overlapping_area_{plane_indicator}_plane'].append(float(intersection_areas[idx] / original_areas[idx]))
+            label_id_results[f'IoUs_{plane_indicator}_plane'].append(float(intersection_areas[idx] / union_areas[idx]))
         return results
     
     
@@ -303,13 +332,17 @@ class ReconstructCellsIn3DFrom2DInstanceLabelsStrat(PostprocessingStrategy):
     
     
     def _set_new_label_ids(self, zstack_with_old_label_ids: np.ndarray, new_ids_assignment: Dict) -> np.ndarray:
-        zstack_with_new_label_ids = zstack_with_old_label_ids.copy()
-        zstack_with_new_label_ids = zstack_with_new_label_ids.astype('uint16') # needs to be adaptable if lowest_final_label_id becomes adaptable
+        zstack_with_new_label_ids = np.ascontiguousarray(zstack_with_old_label_ids, dtype = 'uint16') # needs to be adaptable if lowest_final_label_id becomes adaptable
+        label_id_mappings_per_plane = {}
         for new_label_id in new_ids_assignment.keys():
             for idx in range(len(new_ids_assignment[new_label_id]['plane_index'])):
                 plane_index = new_ids_assignment[new_label_id]['plane_index'][idx]
                 old_label_id = new_ids_assignment[new_label_id]['original_label_id'][idx]
-                zstack_with_new_label_ids[plane_index][np.where(zstack_with_new_label_ids[plane_index] == old_label_id)] = new_label_id
+                if plane_index not in label_id_mappings_per_plane.keys():
+                    label_id_mappings_per_plane[plane_index] = {}
+                label_id_mappings_per_plane[plane_index][old_label_id] = new_label_id
+        for plane_index, label_id_mapping in label_id_mappings_per_plane.items():
+            utils.relabel_instance_segmentation_in_place(segmentation = zstack_with_new_label_ids[plane_index], label_id_mapping = label_id_mapping)
         return zstack_with_new_label_ids    
     
 
@@ -344,6 +377,10 @@ class FillHolesStrat(PostprocessingStrategy):
     In other cases, however, these "holes" may be artefacts and require correction. 
     This strategy was designed for exactly this purpose: fill the "holes" in 
     your segmented features, if they should not be there.
+    Note: holes are filled within the bounding box of *all* pixels of a label in the respective
+    image plane. Previously, this box was derived from the bounds of the label´s first contour 
+    (cast to integers and used as exclusive upper indices), which often missed parts of the label 
+    - even of labels that consist of a single component. Such labels are now filled, too.
     """
     
     @property
@@ -352,50 +389,65 @@ class FillHolesStrat(PostprocessingStrategy):
     
     @property
     def default_configs(self):
-        default_values = {}
-        valid_types = {}
-        default_configs = DefaultConfigs(default_values = default_values, valid_types = valid_types)
+        default_values = {'n_threads': 1}
+        valid_types = {'n_threads': [int]}
+        valid_ranges = {'n_threads': (1, 128, 1)}
+        default_configs = DefaultConfigs(default_values = default_values, 
+                                         valid_types = valid_types,
+                                         valid_value_ranges = valid_ranges)
         return default_configs
         
     @property
     def widget_names(self):
-        return {}
+        return {'n_threads': 'BoundedIntText'}
 
     @property
     def descriptions(self):
-        return {}
+        return {'n_threads': 'Number of threads to process the image planes in parallel'}
     
     @property
     def tooltips(self):
         return {}
     
     def run(self, processing_object: PostprocessingObject, strategy_configs: Dict) -> PostprocessingObject:
-        processing_object.postprocessed_segmentations = self._fill_holes_in_all_planes_of_mask_stack(zstack = processing_object.postprocessed_segmentations)
+        processing_object.postprocessed_segmentations = self._fill_holes_in_all_planes_of_mask_stack(zstack = processing_object.postprocessed_segmentations,
+                                                                                                     n_threads = strategy_configs['n_threads'])
         return processing_object
     
     
-    def _fill_holes_in_all_planes_of_mask_stack(self, zstack: np.ndarray) -> np.ndarray:
-        for plane_index in range(zstack.shape[0]):
-            single_plane = zstack[plane_index]
-            unique_label_ids = list(np.unique(single_plane))
-            if 0 in unique_label_ids:
-                unique_label_ids.remove(0)
-            elif 0.0 in unique_label_ids:
-                unique_label_ids.remove(0.0)
-            for label_id in unique_label_ids:
-                # add additional check here, if the label_id is still present in the single plane
-                # Maybe it got overwritten by the filling process, if it was a small ROI within a ring-like bigger ROI
-                if label_id in np.unique(single_plane):
-                    roi = utils.get_polygon_from_instance_segmentation(single_plane = single_plane, label_id = label_id)
-                    bounding_box_coords = [int(elem) for elem in roi.bounds]
-                    cropped_mask = single_plane[bounding_box_coords[0]:bounding_box_coords[2], bounding_box_coords[1]:bounding_box_coords[3]]
-                    cropped_mask_copy = cropped_mask.copy()
-                    cropped_mask_copy[np.where(cropped_mask_copy != label_id)] = 0
-                    filled_holes = ndimage.binary_fill_holes(cropped_mask_copy)
-                    # since "cropped_mask" refers ultimately to the zstack (not a copy)
-                    # the changes are also made to the zstack itself:
-                    cropped_mask[np.where(filled_holes == True)] = label_id
+    def _fill_holes_in_all_planes_of_mask_stack(self, zstack: np.ndarray, n_threads: int=1) -> np.ndarray:
+        """
+        The planes are independent of each other and modified in place - they can therefore 
+        simply be distributed across a pool of threads (scipy releases the GIL).
+        """
+        with ThreadPoolExecutor(max_workers = n_threads) as executor:
+            list(executor.map(self._fill_holes_in_single_plane, [zstack[plane_index] for plane_index in range(zstack.shape[0])]))
         return zstack
+    
+    
+    def _fill_holes_in_single_plane(self, single_plane: np.ndarray) -> None:
+        # labels only lose pixels before they are processed themselves, so these bounding boxes always contain them:
+        if np.issubdtype(single_plane.dtype, np.integer):
+            bounding_boxes = ndimage.find_objects(single_plane)
+        else:
+            bounding_boxes = ndimage.find_objects(single_plane.astype('int64'))
+        overwritten_label_ids = set()
+        for label_index, bounding_box in enumerate(bounding_boxes):
+            label_id = label_index + 1
+            if bounding_box == None:
+                continue
+            # since "cropped_mask" is a view of the single plane (not a copy), all changes are also made to the zstack itself:
+            cropped_mask = single_plane[bounding_box]
+            label_mask = cropped_mask == label_id
+            if label_id in overwritten_label_ids:
+                # it may have been overwritten entirely while filling a ring-like bigger label:
+                if label_mask.any() == False:
+                    continue
+            filled_holes = ndimage.binary_fill_holes(label_mask)
+            filled_pixels = filled_holes & (label_mask == False)
+            if filled_pixels.any() == True:
+                overwritten_label_ids.update(int(elem) for elem in np.unique(cropped_mask[filled_pixels]) if elem != 0)
+                cropped_mask[filled_pixels] = label_id
 
     
     def _add_strategy_specific_infos_to_updates(self, updates: Dict) -> Dict:
@@ -487,92 +539,135 @@ class ApplyExclusionCriteriaStrat(PostprocessingStrategy):
     def tooltips(self) -> Dict:
         return {}
     
+    @property
+    def relative_positions_in_order_of_proximity(self) -> Tuple[str]:
+        return ('no_overlap', 'touches', 'intersects', 'within')
+    
     def run(self, processing_object: PostprocessingObject, strategy_configs: Dict) -> PostprocessingObject:
         self.exclusion_criteria = self._extract_exclusion_criteria(postprocessing_object = processing_object, strategy_configs = strategy_configs)
         instance_label_info = self._get_instance_label_info(postprocessing_object = processing_object)
         all_area_roi_ids = self._get_all_unique_area_roi_ids(rois_dict = processing_object.rois_dict)
-        segmentations_per_area_roi_id = {}
+        kept_label_ids_per_area_roi_id = {}
         for area_roi_id in all_area_roi_ids:
-            segmentations_per_area_roi_id[area_roi_id] = self._apply_exclusion_criteria(zstack_prior_to_exclusion = processing_object.postprocessed_segmentations,
-                                                                                        area_roi_id = area_roi_id,
-                                                                                        info = instance_label_info)
-        processing_object.segmentations_per_area_roi_id = segmentations_per_area_roi_id
+            kept_label_ids_per_area_roi_id[area_roi_id] = self._apply_exclusion_criteria(area_roi_id = area_roi_id, info = instance_label_info)
+        # instead of a copy of the stack for each area ROI, only the ids of the labels to keep are stored:
+        processing_object.segmentations_per_area_roi_id = utils.MaskedLabelStacks(label_stack = processing_object.postprocessed_segmentations,
+                                                                                  kept_label_ids_per_area_roi_id = kept_label_ids_per_area_roi_id)
         return processing_object
 
     
     def _get_instance_label_info(self, postprocessing_object: PostprocessingObject) -> Dict:
-        instance_label_ids = list(np.unique(postprocessing_object.postprocessed_segmentations))
-        for background_label in [0, 0.0]:
-            if background_label in instance_label_ids:
-                instance_label_ids.remove(background_label)
+        """
+        Collects everything that is required to evaluate the exclusion criteria in a single pass
+        over the stack: the planes covered by each label (from its pixel counts per plane), the 
+        resulting z-expansion, and - from the contours that are computed only once per plane - 
+        the max area and the relative positions to all area ROIs.
+        """
+        zstack = postprocessing_object.postprocessed_segmentations
+        rois_per_plane = {}
+        for plane_index in range(zstack.shape[0]):
+            rois_per_plane[plane_index] = postprocessing_object.polygon_cache.get_polygons(file_id = postprocessing_object.file_id,
+                                                                                           plane_index = plane_index,
+                                                                                           single_plane = zstack[plane_index])
+        plane_indices_per_label_id = self._get_plane_indices_per_label_id(zstack = zstack)
         instance_label_info = {}
-        for label_id in instance_label_ids:
+        for label_id, plane_indices_with_label_id in plane_indices_per_label_id.items():
             instance_label_info[label_id] = {}
-            plane_indices_with_label_id = list(set(np.where(postprocessing_object.postprocessed_segmentations == label_id)[0]))
             instance_label_info[label_id]['plane_indices_with_label_id'] = plane_indices_with_label_id
-            instance_label_info[label_id]['max_roi_area'] = self._get_max_roi_area(zstack = postprocessing_object.postprocessed_segmentations,
+            instance_label_info[label_id]['max_z_expansion'] = self._get_max_z_expansion(planes = plane_indices_with_label_id)
+            instance_label_info[label_id]['max_roi_area'] = self._get_max_roi_area(rois_per_plane = rois_per_plane,
                                                                                    label_id = label_id,
                                                                                    all_plane_indices = instance_label_info[label_id]['plane_indices_with_label_id'])
         instance_label_info = self._extend_info_with_relative_positions(info = instance_label_info, 
                                                                         rois_dict = postprocessing_object.rois_dict,
-                                                                        zstack = postprocessing_object.postprocessed_segmentations)
+                                                                        rois_per_plane = rois_per_plane)
         return instance_label_info
     
     
-    def _get_max_roi_area(self, zstack: np.ndarray, label_id: int, all_plane_indices: List) -> int:
+    def _get_plane_indices_per_label_id(self, zstack: np.ndarray) -> Dict[int, List[int]]:
+        if np.issubdtype(zstack.dtype, np.integer) == False:
+            zstack = zstack.astype('int64')
+        n_label_ids = int(zstack.max()) + 1
+        # pixel counts of each label id (columns) in each plane (rows):
+        pixel_counts_per_plane = np.zeros((zstack.shape[0], n_label_ids), dtype = 'int64')
+        for plane_index in range(zstack.shape[0]):
+            pixel_counts_per_plane[plane_index] = np.bincount(zstack[plane_index].ravel(), minlength = n_label_ids)
+        plane_covered_by_label_id = pixel_counts_per_plane[:, 1:] > 0
+        plane_indices_per_label_id = {}
+        for label_index in np.nonzero(plane_covered_by_label_id.any(axis = 0))[0]:
+            plane_indices_per_label_id[int(label_index) + 1] = [int(elem) for elem in np.nonzero(plane_covered_by_label_id[:, label_index])[0]]
+        return plane_indices_per_label_id
+    
+    
+    def _get_max_roi_area(self, rois_per_plane: Dict[int, Dict[int, Polygon]], label_id: int, all_plane_indices: List) -> int:
         all_area_sizes = []
         for plane_index in all_plane_indices:
-            roi = utils.get_polygon_from_instance_segmentation(single_plane = zstack[plane_index], label_id = label_id)
+            roi = rois_per_plane[plane_index][label_id]
             all_area_sizes.append(roi.area)
         return max(all_area_sizes)
 
     
-    def _extend_info_with_relative_positions(self, info: Dict, rois_dict: Dict, zstack: np.ndarray) -> Dict:
+    def _extend_info_with_relative_positions(self, info: Dict, rois_dict: Dict, rois_per_plane: Dict[int, Dict[int, Polygon]]) -> Dict:
+        """
+        The relative positions of all features in a plane are classified in bulk for each area ROI that 
+        applies to this plane (i.e. ROIs assigned to this plane or to "all_planes"). Across the planes,
+        only the nearest relative position of each feature is kept for each area ROI.
+        """
+        max_label_id = max(info.keys(), default = 0)
+        nearest_position_indices_per_area_roi_id = {}
+        for plane_index, rois in rois_per_plane.items():
+            area_rois = {}
+            # no elif, since there might be some ROIs assigned to single planes and others for the entire stack:
+            for plane_id in [plane_index, 'all_planes']:
+                if plane_id in rois_dict.keys():
+                    for area_roi_id, area_roi in rois_dict[plane_id].items():
+                        area_rois[(plane_id, area_roi_id)] = area_roi
+            if (len(rois) == 0) | (len(area_rois) == 0):
+                continue
+            label_ids = np.asarray([int(label_id) for label_id in rois.keys()])
+            position_indices_per_area_roi = self._get_relative_positions(rois = list(rois.values()), area_rois = area_rois)
+            for (plane_id, area_roi_id), position_indices in position_indices_per_area_roi.items():
+                if area_roi_id not in nearest_position_indices_per_area_roi_id.keys():
+                    # -1 = the feature is not present in any plane this area ROI applies to
+                    nearest_position_indices_per_area_roi_id[area_roi_id] = np.full(max_label_id + 1, -1, dtype = 'int8')
+                nearest_position_indices = nearest_position_indices_per_area_roi_id[area_roi_id]
+                # label ids are unique per plane:
+                nearest_position_indices[label_ids] = np.maximum(nearest_position_indices[label_ids], position_indices)
         for label_id in info.keys():
-            info[label_id]['area_roi_ids_with_matching_plane_index_and_id'] = []
             info[label_id]['relative_positions_per_area_roi_id'] = {}
-            for plane_index in info[label_id]['plane_indices_with_label_id']:
-                if plane_index in rois_dict.keys():
-                    for area_roi_id in rois_dict[plane_index]:
-                        if (area_roi_id, plane_index, plane_index) not in info[label_id]['area_roi_ids_with_matching_plane_index_and_id']:
-                            info[label_id]['area_roi_ids_with_matching_plane_index_and_id'].append((area_roi_id, plane_index, plane_index))
-                if 'all_planes' in rois_dict.keys(): # no elif, since there might be some ROIs assigned to single planes and others for the entire stack
-                    for area_roi_id in rois_dict['all_planes']:
-                        if (area_roi_id, plane_index, 'all_planes') not in info[label_id]['area_roi_ids_with_matching_plane_index_and_id']:
-                            info[label_id]['area_roi_ids_with_matching_plane_index_and_id'].append((area_roi_id, plane_index, 'all_planes'))
-            for area_roi_id, plane_index, plane_id in info[label_id]['area_roi_ids_with_matching_plane_index_and_id']:
-                roi = utils.get_polygon_from_instance_segmentation(single_plane = zstack[plane_index], label_id = label_id)
-                area_roi = rois_dict[plane_id][area_roi_id]
-                relative_position = self._get_relative_position(roi_to_check = roi, reference = area_roi)
-                if area_roi_id not in info[label_id]['relative_positions_per_area_roi_id'].keys():
-                    info[label_id]['relative_positions_per_area_roi_id'][area_roi_id] = {'relative_positions': [],
-                                                                                         'plane_indices': []}
-                info[label_id]['relative_positions_per_area_roi_id'][area_roi_id]['relative_positions'].append(relative_position)
-                info[label_id]['relative_positions_per_area_roi_id'][area_roi_id]['plane_indices'].append(plane_index)
-            for area_roi_id in info[label_id]['relative_positions_per_area_roi_id'].keys():
-                relative_positions = list(set(info[label_id]['relative_positions_per_area_roi_id'][area_roi_id]['relative_positions']))
-                if 'within' in relative_positions:
-                    final_relative_position_for_quantifications = 'within'
-                elif 'intersects' in relative_positions:
-                    final_relative_position_for_quantifications = 'intersects'
-                elif 'touches' in relative_positions:
-                    final_relative_position_for_quantifications = 'touches'
-                else:
-                    final_relative_position_for_quantifications = 'no_overlap'
-                info[label_id]['relative_positions_per_area_roi_id'][area_roi_id]['final_relative_position_for_quantifications'] = final_relative_position_for_quantifications
+            for area_roi_id, nearest_position_indices in nearest_position_indices_per_area_roi_id.items():
+                if nearest_position_indices[label_id] >= 0:
+                    final_relative_position = self.relative_positions_in_order_of_proximity[nearest_position_indices[label_id]]
+                    info[label_id]['relative_positions_per_area_roi_id'][area_roi_id] = {'final_relative_position_for_quantifications': final_relative_position}
         return info
-    
 
-    def _get_relative_position(self, roi_to_check: Polygon, reference: Polygon) -> str:
-        if roi_to_check.within(reference):
-            rel_position = 'within'
-        elif roi_to_check.intersects(reference):
-            rel_position = 'intersects'
-        elif roi_to_check.touches(reference):
-            rel_position = 'touches'
-        else:
-            rel_position = 'no_overlap'
-        return rel_position
+
+    def _get_relative_positions(self, rois: List[Polygon], area_rois: Dict) -> Dict:
+        """
+        Classifies all ROIs relative to each area ROI in bulk, following the precedence: 
+        within > intersects > touches > no_overlap. Only ROIs whose bounding box intersects with the 
+        one of the area ROI (queried from a STRtree) can be anything but "no_overlap" - only for these,
+        the predicates are evaluated (vectorized, against the prepared area ROI). 
+        Returns for each area ROI the indices of the relative positions of all ROIs in 
+        `relative_positions_in_order_of_proximity`.
+        """
+        geometries = np.empty(len(rois), dtype = object)
+        geometries[:] = rois
+        tree = shapely.STRtree(geometries)
+        position_indices_per_area_roi = {}
+        for area_roi_key, area_roi in area_rois.items():
+            position_indices = np.zeros(len(rois), dtype = 'int8')
+            candidate_indices = tree.query(area_roi)
+            if candidate_indices.shape[0] > 0:
+                shapely.prepare(area_roi)
+                candidates = geometries[candidate_indices]
+                position_indices[candidate_indices] = np.select([shapely.within(candidates, area_roi),
+                                                                 shapely.intersects(candidates, area_roi),
+                                                                 shapely.touches(candidates, area_roi)],
+                                                                [3, 2, 1],
+                                                                default = 0)
+            position_indices_per_area_roi[area_roi_key] = position_indices
+        return position_indices_per_area_roi
     
     
     def _extract_exclusion_criteria(self, postprocessing_object: PostprocessingObject, strategy_configs: Dict) -> Dict:
@@ -604,19 +699,23 @@ class ApplyExclusionCriteriaStrat(PostprocessingStrategy):
         return unique_area_roi_ids
 
 
-    def _apply_exclusion_criteria(self, zstack_prior_to_exclusion: np.ndarray, area_roi_id: str, info: Dict) -> np.ndarray:
-        zstack = zstack_prior_to_exclusion.copy()
+    def _apply_exclusion_criteria(self, area_roi_id: str, info: Dict) -> np.ndarray:
+        """
+        Returns the ids of all labels that are kept for the area ROI.
+        """
+        label_ids_to_keep = []
         for label_id in info.keys():
             relative_position = info[label_id]['relative_positions_per_area_roi_id'][area_roi_id]['final_relative_position_for_quantifications']
-            max_z_expansion = self._get_max_z_expansion(planes = info[label_id]['plane_indices_with_label_id'])
+            max_z_expansion = info[label_id]['max_z_expansion']
             max_roi_area = info[label_id]['max_roi_area']
             if relative_position not in self.exclusion_criteria['allowed_relative_positions']:
-                zstack[np.where(zstack == label_id)] = 0
-            if max_z_expansion < self.exclusion_criteria['min_planes_covered']:
-                zstack[np.where(zstack == label_id)] = 0
-            if max_roi_area < self.exclusion_criteria['min_roi_area_size']:
-                zstack[np.where(zstack == label_id)] = 0
-        return zstack      
+                continue
+            elif max_z_expansion < self.exclusion_criteria['min_planes_covered']:
+                continue
+            elif max_roi_area < self.exclusion_criteria['min_roi_area_size']:
+                continue
+            label_ids_to_keep.append(label_id)
+        return np.asarray(label_ids_to_keep, dtype = 'int64')
         
         
     def _get_max_z_expansion(self, planes: List) -> int:
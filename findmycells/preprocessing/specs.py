@@ -6,11 +6,11 @@ __all__ = ['PreprocessingStrategy', 'PreprocessingObject']
 # %% ../../nbs/api/05_preprocessing_00_specs.ipynb 2
 import numpy as np
 from shapely.geometry import Polygon
-from typing import List, Dict
-from skimage.io import imsave
+from typing import List, Dict, Any, Optional
 
 from ..core import ProcessingObject, ProcessingStrategy, DataLoader
 from ..configs import DefaultConfigs
+from ..storage import get_stack_storage
 from .. import readers
 
 # %% ../../nbs/api/05_preprocessing_00_specs.ipynb 4
@@ -23,6 +23,35 @@ class PreprocessingStrategy(ProcessingStrategy):
     @property
     def processing_type(self):
         return 'preprocessing'
+    
+    
+    def requires_project_wide_preparation(self, strategy_configs: Dict) -> bool:
+        """
+        Strategies that need information from all files of the project before any of them can be processed
+        (e.g. project-wide intensity limits) can return True here. For each file, `collect_file_specific_data()`
+        will then be called (after running all preceding strategies), and eventually `add_project_wide_data_to_configs()`
+        with the data collected from all files.
+        """
+        return False
+    
+    
+    def collect_file_specific_data(self, processing_object: 'PreprocessingObject', strategy_configs: Dict) -> Any:
+        return None
+    
+    
+    def add_project_wide_data_to_configs(self, file_specific_data: List[Any], strategy_configs: Dict) -> Dict:
+        return strategy_configs
+    
+    
+    def determine_region_to_read(self, processing_object: 'PreprocessingObject', strategy_configs: Dict) -> Optional[Dict[str, int]]:
+        """
+        Cropping strategies that can determine their cropping indices from the ROIs alone can return them here
+        (with the keys "lower_row_cropping_idx", "upper_row_cropping_idx", "lower_col_cropping_idx", and
+        "upper_col_cropping_idx"). If the strategy is the first one that is run, only this region of the image 
+        will then be read (the image itself is not loaded yet, only its ROIs). Their `run()` method has to check 
+        `processing_object.region_read` to not crop the image a second time.
+        """
+        return None
 
 # %% ../../nbs/api/05_preprocessing_00_specs.ipynb 5
 class PreprocessingObject(ProcessingObject):
@@ -46,14 +75,20 @@ class PreprocessingObject(ProcessingObject):
     def widget_names(self):
         widget_names = {'overwrite': 'Checkbox',
                         'autosave': 'Checkbox',
-                        'show_progress': 'Checkbox'}
+                        'autosave_every_n_files': 'BoundedIntText',
+                        'autosave_every_n_seconds': 'BoundedIntText',
+                        'show_progress': 'Checkbox',
+                        'n_workers': 'BoundedIntText'}
         return widget_names
 
     @property
     def descriptions(self):
         descriptions = {'overwrite': 'overwrite previously processed files',
-                        'autosave': 'autosave progress after each file',
-                        'show_progress': 'show progress bar and estimated computation time'}
+                        'autosave': 'autosave progress (incremental checkpoints)',
+                        'autosave_every_n_files': 'autosave after every n files',
+                        'autosave_every_n_seconds': 'autosave at the latest after n seconds (0 = off)',
+                        'show_progress': 'show progress bar and estimated computation time',
+                        'n_workers': 'number of files to process in parallel (1 = one file after another)'}
         return descriptions
     
     @property
@@ -65,11 +100,22 @@ class PreprocessingObject(ProcessingObject):
     def default_configs(self) -> DefaultConfigs:
         default_values = {'overwrite': False,
                           'autosave': True,
-                          'show_progress': True}
+                          'autosave_every_n_files': 1,
+                          'autosave_every_n_seconds': 0,
+                          'show_progress': True,
+                          'n_workers': 1}
         valid_types = {'overwrite': [bool],
                        'autosave': [bool],
-                       'show_progress': [bool]}
-        default_configs = DefaultConfigs(default_values = default_values, valid_types = valid_types)
+                       'autosave_every_n_files': [int],
+                       'autosave_every_n_seconds': [int],
+                       'show_progress': [bool],
+                       'n_workers': [int]}
+        valid_value_ranges = {'autosave_every_n_files': (1, 10000, 1),
+                              'autosave_every_n_seconds': (0, 86400, 1),
+                              'n_workers': (1, 128, 1)}
+        default_configs = DefaultConfigs(default_values = default_values,
+                                         valid_types = valid_types,
+                                         valid_value_ranges = valid_value_ranges)
         return default_configs
     
     
@@ -79,21 +125,54 @@ class PreprocessingObject(ProcessingObject):
         
 
 
-    def load_image_and_rois(self, microscopy_reader_configs: Dict, roi_reader_configs: Dict) -> None:
-        self.preprocessed_image = self._load_microscopy_image(microscopy_reader_configs = microscopy_reader_configs)
-        self.preprocessed_rois = self._load_rois(roi_reader_configs = roi_reader_configs)
+    def load_image_and_rois(self, 
+                            microscopy_reader_configs: Dict, 
+                            roi_reader_configs: Dict,
+                            strategies: Optional[List[PreprocessingStrategy]]=None,
+                            strategy_configs: Optional[List[Dict]]=None
+                           ) -> None:
+        """
+        If the first of the preprocessing strategies that will be run can already determine the region
+        to which the image will be cropped (see `PreprocessingStrategy.determine_region_to_read()`), only 
+        this region will be requested from the microscopy image reader (= crop-at-read).
+        """
+        self.region_read = None
+        if strategies == None:
+            strategies, strategy_configs = [], []
+        if (roi_reader_configs['create_rois'] == False) & (len(strategies) > 0):
+            self.preprocessed_rois = self._load_rois(roi_reader_configs = roi_reader_configs)
+            region_to_read = strategies[0]().determine_region_to_read(processing_object = self, strategy_configs = strategy_configs[0])
+            self.preprocessed_image = self._load_microscopy_image(microscopy_reader_configs = microscopy_reader_configs, region = region_to_read)
+            if region_to_read != None:
+                # readers clip the upper indices of the requested region to the actual image size:
+                self.region_read = {'lower_row_cropping_idx': region_to_read['lower_row_cropping_idx'],
+                                    'upper_row_cropping_idx': region_to_read['lower_row_cropping_idx'] + self.preprocessed_image.shape[1],
+                                    'lower_col_cropping_idx': region_to_read['lower_col_cropping_idx'],
+                                    'upper_col_cropping_idx': region_to_read['lower_col_cropping_idx'] + self.preprocessed_image.shape[2]}
+        else:
+            self.preprocessed_image = self._load_microscopy_image(microscopy_reader_configs = microscopy_reader_configs)
+            self.preprocessed_rois = self._load_rois(roi_reader_configs = roi_reader_configs)
+        self.microscopy_image_metadata = self._load_microscopy_image_metadata(microscopy_reader_configs = microscopy_reader_configs)
         
         
         
-    def _load_microscopy_image(self, microscopy_reader_configs: Dict) -> np.ndarray:
+    def _load_microscopy_image(self, microscopy_reader_configs: Dict, region: Optional[Dict[str, int]]=None) -> np.ndarray:
         microscopy_image_data_loader = DataLoader()
         microscopy_image_reader_class = microscopy_image_data_loader.determine_reader(file_extension = self.file_info['microscopy_filetype'],
                                                                                       data_reader_module = readers.microscopy_images)
         microscopy_image = microscopy_image_data_loader.load(data_reader_class = microscopy_image_reader_class,
                                                              filepath = self.file_info['microscopy_filepath'],
-                                                             reader_configs = microscopy_reader_configs)
+                                                             reader_configs = microscopy_reader_configs,
+                                                             region = region)
         return microscopy_image
     
+    
+    def _load_microscopy_image_metadata(self, microscopy_reader_configs: Dict) -> Dict:
+        microscopy_image_reader_class = DataLoader().determine_reader(file_extension = self.file_info['microscopy_filetype'],
+                                                                      data_reader_module = readers.microscopy_images)
+        return microscopy_image_reader_class().read_metadata(filepath = self.file_info['microscopy_filepath'],
+                                                             reader_configs = microscopy_reader_configs)
+    
 
     def _load_rois(self, roi_reader_configs: Dict) -> Dict[str, Dict[str, Polygon]]:
         if roi_reader_configs['create_rois'] == True:
@@ -159,11 +238,9 @@ class PreprocessingObject(ProcessingObject):
     
 
     def save_preprocessed_images_on_disk(self) -> None:
-        for plane_index in range(self.preprocessed_image.shape[0]):
-            image = self.preprocessed_image[plane_index].astype('uint8')
-            out_dir_path = self.database.project_configs.root_dir.joinpath(self.database.preprocessed_images_dir)
-            filename = f'{self.file_id}-{str(plane_index).zfill(3)}.png'
-            imsave(out_dir_path.joinpath(filename), image)
+        out_dir_path = self.database.project_configs.root_dir.joinpath(self.database.preprocessed_images_dir)
+        stack_storage = get_stack_storage(project_configs = self.database.project_configs)
+        stack_storage.save_stack(dir_path = out_dir_path, file_id = self.file_id, stack = self.preprocessed_image.astype('uint8', copy = False))
 
 
     def save_preprocessed_rois_in_database(self) -> None:
@@ -5,7 +5,7 @@ __all__ = ['CropStitchingArtefactsRGBStrat', 'CropToROIsBoundingBoxStrat', 'Conv
            'MaximumIntensityProjectionStrat', 'MinimumIntensityProjectionStrat', 'AdjustBrightnessAndContrastStrat']
 
 # %% ../../nbs/api/05_preprocessing_01_strategies.ipynb 2
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from shapely.geometry import Polygon
 import numpy as np
 from skimage import exposure
@@ -57,6 +57,10 @@ class CropStitchingArtefactsRGBStrat(PreprocessingStrategy):
     @property
     def tooltips(self):
         return {}
+    
+    @property
+    def max_elements_per_chunk(self) -> int:
+        return 2**22
 
     
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
@@ -78,23 +82,13 @@ class CropStitchingArtefactsRGBStrat(PreprocessingStrategy):
 
 
     def _determine_cropping_indices_for_entire_zstack(self, preprocessing_object: PreprocessingObject, color_of_artefact_pixels: str) -> Dict:
-        for plane_index in range(preprocessing_object.preprocessed_image.shape[0]):
-            rgb_image_plane = preprocessing_object.preprocessed_image[plane_index]
-            if color_of_artefact_pixels == "black":
-                rows_with_artefact_color_px, columns_with_artefact_color_px = np.where(np.all(rgb_image_plane == 0, axis = -1))
-            else: # color_of_artefact_pixels == "white"
-                max_value = rgb_image_plane.max()
-                if max_value <= 255: # 8-bit image
-                    white_value = 255
-                elif max_value <= 4095: # 16-bit image
-                    white_value = 4095
-                elif max_value <= 65535: # 32-bit image
-                    white_value = 65535
-                else:
-                    raise NotImplementedError("The supported bit-values are 8, 16 or 32!")
-                rows_with_artefact_color_px, columns_with_artefact_color_px = np.where(np.all(rgb_image_plane == white_value, axis = -1))
-            lower_row_idx, upper_row_idx = self._get_cropping_indices(rows_with_artefact_color_px)
-            lower_col_idx, upper_col_idx = self._get_cropping_indices(columns_with_artefact_color_px)  
+        zstack = preprocessing_object.preprocessed_image
+        artefact_values = self._get_artefact_value_per_plane(zstack = zstack, color_of_artefact_pixels = color_of_artefact_pixels)
+        artefact_px_counts_per_row, artefact_px_counts_per_col = self._count_artefact_pixels_per_row_and_column(zstack = zstack, 
+                                                                                                                artefact_values = artefact_values)
+        for plane_index in range(zstack.shape[0]):
+            lower_row_idx, upper_row_idx = self._get_cropping_indices(artefact_px_counts = artefact_px_counts_per_row[plane_index])
+            lower_col_idx, upper_col_idx = self._get_cropping_indices(artefact_px_counts = artefact_px_counts_per_col[plane_index])  
             if plane_index == 0:
                 min_lower_row_cropping_idx, max_upper_row_cropping_idx = lower_row_idx, upper_row_idx
                 min_lower_col_cropping_idx, max_upper_col_cropping_idx = lower_col_idx, upper_col_idx
@@ -114,9 +108,49 @@ class CropStitchingArtefactsRGBStrat(PreprocessingStrategy):
         return cropping_indices
     
     
-    def _get_cropping_indices(self, a, min_artefact_px_stretch: int=100) -> Tuple[int, int]:
-        unique, counts = np.unique(a, return_counts=True)
-        indices_with_artefact_pixels = unique[np.where(counts >= min_artefact_px_stretch)]
+    def _get_artefact_value_per_plane(self, zstack: np.ndarray, color_of_artefact_pixels: str) -> np.ndarray:
+        if color_of_artefact_pixels == "black":
+            return np.zeros(zstack.shape[0], dtype = zstack.dtype)
+        # color_of_artefact_pixels == "white":
+        if zstack.dtype.name == 'uint8':
+            return np.full(zstack.shape[0], 255, dtype = zstack.dtype)
+        white_values = []
+        for plane_index in range(zstack.shape[0]):
+            max_value = zstack[plane_index].max()
+            if max_value <= 255: # 8-bit image
+                white_values.append(255)
+            elif max_value <= 4095: # 16-bit image
+                white_values.append(4095)
+            elif max_value <= 65535: # 32-bit image
+                white_values.append(65535)
+            else:
+                raise NotImplementedError("The supported bit-values are 8, 16 or 32!")
+        return np.asarray(white_values)
+    
+    
+    def _count_artefact_pixels_per_row_and_column(self, zstack: np.ndarray, artefact_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Processes the zstack in chunks of rows, such that also huge images (or memory-mapped ones) 
+        don´t require a boolean mask of the entire zstack in memory.
+        """
+        n_planes, n_rows, n_cols = zstack.shape[:3]
+        artefact_px_counts_per_row = np.zeros((n_planes, n_rows), dtype = 'int64')
+        artefact_px_counts_per_col = np.zeros((n_planes, n_cols), dtype = 'int64')
+        rows_per_chunk = max(1, self.max_elements_per_chunk // max(1, zstack[0, 0].size))
+        for plane_index in range(n_planes):
+            for lower_row_idx in range(0, n_rows, rows_per_chunk):
+                row_slice = slice(lower_row_idx, lower_row_idx + rows_per_chunk)
+                chunk = zstack[plane_index, row_slice]
+                artefact_px_mask = chunk[..., 0] == artefact_values[plane_index]
+                for channel_index in range(1, chunk.shape[-1]):
+                    artefact_px_mask &= chunk[..., channel_index] == artefact_values[plane_index]
+                artefact_px_counts_per_row[plane_index, row_slice] = np.count_nonzero(artefact_px_mask, axis = 1)
+                artefact_px_counts_per_col[plane_index] += np.count_nonzero(artefact_px_mask, axis = 0)
+        return artefact_px_counts_per_row, artefact_px_counts_per_col
+    
+    
+    def _get_cropping_indices(self, artefact_px_counts: np.ndarray, min_artefact_px_stretch: int=100) -> Tuple[int, int]:
+        indices_with_artefact_pixels = np.nonzero(artefact_px_counts >= min_artefact_px_stretch)[0]
         if indices_with_artefact_pixels.shape[0] > 0: 
             if np.where(np.diff(indices_with_artefact_pixels) > 1)[0].shape[0] > 0:
                 lower_cropping_index = indices_with_artefact_pixels[np.where(np.diff(indices_with_artefact_pixels) > 1)[0]][0] + 1
@@ -174,20 +208,35 @@ class CropToROIsBoundingBoxStrat(PreprocessingStrategy):
     
     
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
-        self.cropping_indices = self._determine_bounding_box(preprocessing_object = processing_object,
-                                                             pad_size = strategy_configs['pad_size'])
-        processing_object.preprocessed_image = processing_object.crop_rgb_zstack(zstack = processing_object.preprocessed_image,
-                                                                                 cropping_indices = self.cropping_indices)
+        if getattr(processing_object, 'region_read', None) != None: 
+            # image was already cropped to the bounding box upon reading (see "determine_region_to_read()"):
+            self.cropping_indices = processing_object.region_read
+            processing_object.region_read = None
+        else:
+            self.cropping_indices = self._determine_bounding_box(rois_dict = processing_object.preprocessed_rois,
+                                                                 pad_size = strategy_configs['pad_size'],
+                                                                 max_row_idx = processing_object.preprocessed_image.shape[1],
+                                                                 max_col_idx = processing_object.preprocessed_image.shape[2])
+            processing_object.preprocessed_image = processing_object.crop_rgb_zstack(zstack = processing_object.preprocessed_image,
+                                                                                     cropping_indices = self.cropping_indices)
         processing_object.preprocessed_rois = processing_object.adjust_rois(rois_dict = processing_object.preprocessed_rois,
                                                                             lower_row_cropping_idx = self.cropping_indices['lower_row_cropping_idx'],
                                                                             lower_col_cropping_idx = self.cropping_indices['lower_col_cropping_idx'])
         return processing_object
                                                   
     
-    def _determine_bounding_box(self, preprocessing_object: PreprocessingObject, pad_size: int) -> Dict:
-        rois_dict = preprocessing_object.preprocessed_rois.copy()
-        max_row_idx = preprocessing_object.preprocessed_image.shape[1]
-        max_col_idx = preprocessing_object.preprocessed_image.shape[2]
+    def determine_region_to_read(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> Dict[str, int]:
+        # the image was not read yet - the upper indices will be clipped to the image size by the reader:
+        return self._determine_bounding_box(rois_dict = processing_object.preprocessed_rois, pad_size = strategy_configs['pad_size'])
+    
+                                                  
+    def _determine_bounding_box(self, 
+                                rois_dict: Dict[str, Dict[str, Polygon]], 
+                                pad_size: int, 
+                                max_row_idx: Optional[int]=None, # None: upper indices will not be clipped to the image size
+                                max_col_idx: Optional[int]=None
+                               ) -> Dict:
+        rois_dict = rois_dict.copy()
         min_lower_row_cropping_idx, min_lower_col_cropping_idx, max_upper_row_cropping_idx, max_upper_col_cropping_idx = None, None, None, None
         for plane_id in rois_dict.keys():
             for roi_id in rois_dict[plane_id].keys():
@@ -213,11 +262,11 @@ class CropToROIsBoundingBoxStrat(PreprocessingStrategy):
         else:
             min_lower_col_cropping_idx -= pad_size
         
-        if max_upper_row_cropping_idx + pad_size >= max_row_idx:
+        if (max_row_idx != None) and (max_upper_row_cropping_idx + pad_size >= max_row_idx):
             max_upper_row_cropping_idx = max_row_idx
         else:
             max_upper_row_cropping_idx += pad_size
-        if max_upper_col_cropping_idx + pad_size >= max_col_idx:
+        if (max_col_idx != None) and (max_upper_col_cropping_idx + pad_size >= max_col_idx):
             max_upper_col_cropping_idx = max_col_idx
         else:
             max_upper_col_cropping_idx += pad_size        
@@ -243,6 +292,11 @@ class ConvertTo8BitStrat(PreprocessingStrategy):
     This strategy converts your image to an 8-bit format. Adding this strategy is
     at the moment mandatory, as all implemented segmentation tools (deepflash2 & cellpose)
     require 8-bit as input format. So you actually don´t really have a choice but adding it! :-)
+    By default ("auto"), the bit depth of your images will be taken from the metadata of the 
+    microscopy image file (if the reader provides it), or else from the datatype of the image.
+    Only for images that are stored as 16-bit integers without such metadata, the maximal pixel
+    value is used to distinguish 12-bit from 16-bit images. You can also specify the bit depth
+    explicitly. Optionally, the conversion can use a bit shift instead of a rounded rescaling.
     """
     
     @property
@@ -251,42 +305,92 @@ class ConvertTo8BitStrat(PreprocessingStrategy):
     
     @property
     def default_configs(self):
-        default_values = {}
-        valid_types = {}
-        default_configs = DefaultConfigs(default_values = default_values, valid_types = valid_types)
+        default_values = {'bit_depth': 'auto',
+                          'use_bit_shift': False}
+        valid_types = {'bit_depth': [str],
+                       'use_bit_shift': [bool]}
+        valid_options = {'bit_depth': ('auto', '8', '10', '12', '14', '16')}
+        default_configs = DefaultConfigs(default_values = default_values, 
+                                         valid_types = valid_types,
+                                         valid_value_options = valid_options)
         return default_configs
         
     @property
     def widget_names(self):
-        return {}
+        return {'bit_depth': 'Dropdown',
+                'use_bit_shift': 'Checkbox'}
 
     @property
     def descriptions(self):
-        return {}
+        return {'bit_depth': 'Bit depth of your images ("auto" = from file metadata or datatype):',
+                'use_bit_shift': 'Use a bit shift instead of a rounded rescaling (slightly faster, rounds down)'}
     
     @property
     def tooltips(self):
         return {}
     
+    @property
+    def max_elements_per_chunk(self) -> int:
+        return 2**22
+    
     
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
-        processing_object.preprocessed_image = self._convert_to_8bit(zstack = processing_object.preprocessed_image)
+        bit_depth = self._determine_bit_depth(zstack = processing_object.preprocessed_image,
+                                              bit_depth_config = strategy_configs['bit_depth'],
+                                              metadata = getattr(processing_object, 'microscopy_image_metadata', {}))
+        processing_object.preprocessed_image = self._convert_to_8bit(zstack = processing_object.preprocessed_image,
+                                                                     bit_depth = bit_depth,
+                                                                     use_bit_shift = strategy_configs['use_bit_shift'])
         return processing_object
     
     
-    def _convert_to_8bit(self, zstack: np.ndarray) -> np.ndarray:
+    def _determine_bit_depth(self, zstack: np.ndarray, bit_depth_config: str, metadata: Dict) -> int:
+        if bit_depth_config != 'auto':
+            return int(bit_depth_config)
+        if 'bit_depth' in metadata.keys():
+            return int(metadata['bit_depth'])
+        if zstack.dtype.name in ['uint8', 'int8', 'bool']:
+            return 8
+        # e.g. 12-bit images are commonly stored as 16-bit integers, and floats don´t have a bit depth at all:
         max_value = zstack.max()
         if max_value <= 255:
-            pass
+            return 8
         elif max_value <= 4095:
-            for plane_index in range(zstack.shape[0]):
-                zstack[plane_index] = (zstack[plane_index] / 4095 * 255).round(0)
-        elif max_value <= 65535:
-            for plane_index in range(zstack.shape[0]):
-                zstack[plane_index] = (zstack[plane_index] / 65535 * 255).round(0)
-        if zstack.dtype.name != 'uint8':
-            zstack = zstack.astype('uint8')
-        return zstack
+            return 12
+        else:
+            return 16
+    
+    
+    def _convert_to_8bit(self, zstack: np.ndarray, bit_depth: int, use_bit_shift: bool=False) -> np.ndarray:
+        if (zstack.dtype.name == 'uint8') & (bit_depth == 8):
+            return zstack
+        converted_zstack = np.empty(zstack.shape, dtype = 'uint8')
+        rows_per_chunk = max(1, self.max_elements_per_chunk // max(1, zstack[0, 0].size))
+        for plane_index in range(zstack.shape[0]):
+            for lower_row_idx in range(0, zstack.shape[1], rows_per_chunk):
+                row_slice = slice(lower_row_idx, lower_row_idx + rows_per_chunk)
+                self._convert_chunk_to_8bit(chunk = zstack[plane_index, row_slice], 
+                                            out = converted_zstack[plane_index, row_slice], 
+                                            bit_depth = bit_depth, 
+                                            use_bit_shift = use_bit_shift)
+        return converted_zstack
+    
+    
+    def _convert_chunk_to_8bit(self, chunk: np.ndarray, out: np.ndarray, bit_depth: int, use_bit_shift: bool) -> None:
+        max_value = 2**bit_depth - 1
+        if np.issubdtype(chunk.dtype, np.integer) == False:
+            if bit_depth == 8:
+                np.copyto(out, chunk, casting = 'unsafe')
+            else:
+                np.copyto(out, np.clip(np.rint(chunk / max_value * 255), 0, 255), casting = 'unsafe')
+        elif bit_depth == 8:
+            np.copyto(out, np.clip(chunk, 0, max_value), casting = 'unsafe')
+        elif use_bit_shift == True:
+            np.copyto(out, np.clip(chunk, 0, max_value) >> (bit_depth - 8), casting = 'unsafe')
+        else:
+            # rounds exactly like (chunk / max_value * 255).round(0), since max_value is odd and the result can´t end with .5:
+            clipped_chunk = np.clip(chunk, 0, max_value).astype('uint32')
+            np.copyto(out, (clipped_chunk * 510 + max_value) // (2 * max_value), casting = 'unsafe')
     
 
     def _add_strategy_specific_infos_to_updates(self, updates: Dict) -> Dict:
@@ -428,6 +532,12 @@ class AdjustBrightnessAndContrastStrat(PreprocessingStrategy):
     if you are anyhow dealing with 2D images (either from the get-go, or since
     you applied a maximum or minimum intensity projection strategy prior to
     this one - both "globally" and "individually" will lead to the same result.
+    By default, the intensity limits are determined for each plane. Alternatively,
+    they can be determined once for the entire image stack, or even once for all
+    images of the project (which requires an additional pass over all images
+    before they are processed), to ensure a consistent normalization. Project-wide
+    limits are stored in the project configs and reused for all images that are
+    processed later on, until the configs of the preprocessing strategies change.
     """
     
     @property
@@ -437,11 +547,14 @@ class AdjustBrightnessAndContrastStrat(PreprocessingStrategy):
     @property
     def default_configs(self):
         default_values = {'percentage_saturated_pixels': 0.35,
-                          'channel_adjustment_method': 'globally'}
+                          'channel_adjustment_method': 'globally',
+                          'limits_computed_per': 'plane'}
         valid_types = {'percentage_saturated_pixels': [float],
-                       'channel_adjustment_method': [str]}
+                       'channel_adjustment_method': [str],
+                       'limits_computed_per': [str]}
         valid_ranges = {'percentage_saturated_pixels': (0.05, 49.95, 0.05)}
-        valid_options = {'channel_adjustment_method': ('globally', 'individually')}
+        valid_options = {'channel_adjustment_method': ('globally', 'individually'),
+                         'limits_computed_per': ('plane', 'stack', 'project')}
         default_configs = DefaultConfigs(default_values = default_values,
                                          valid_types = valid_types,
                                          valid_value_ranges = valid_ranges,
@@ -451,62 +564,167 @@ class AdjustBrightnessAndContrastStrat(PreprocessingStrategy):
     @property
     def widget_names(self):
         return {'percentage_saturated_pixels': 'FloatSlider',
-                'channel_adjustment_method': 'Dropdown'}
+                'channel_adjustment_method': 'Dropdown',
+                'limits_computed_per': 'Dropdown'}
 
     @property
     def descriptions(self):
         return {'percentage_saturated_pixels': 'Percentage of pixels that will be saturated:',
-                'channel_adjustment_method': 'Adjust on whole zstack level (= globally) or for each plane (= individually):'}
+                'channel_adjustment_method': 'Adjust on whole zstack level (= globally) or for each plane (= individually):',
+                'limits_computed_per': 'Compute the intensity limits for each plane, once per image stack, or once for the entire project:'}
     
     @property
     def tooltips(self):
         return {}
 
     def run(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> PreprocessingObject:
+        if strategy_configs['limits_computed_per'] == 'project':
+            project_wide_in_ranges = [tuple(in_range) for in_range in strategy_configs['project_wide_in_ranges']]
+        else:
+            project_wide_in_ranges = None
         processing_object.preprocessed_image = self._adjust_brightness_and_contrast(zstack = processing_object.preprocessed_image,
                                                                                     percentage_saturated_pixels = strategy_configs['percentage_saturated_pixels'], 
-                                                                                    channel_adjustment_method = strategy_configs['channel_adjustment_method'])
+                                                                                    channel_adjustment_method = strategy_configs['channel_adjustment_method'],
+                                                                                    limits_computed_per = strategy_configs['limits_computed_per'],
+                                                                                    project_wide_in_ranges = project_wide_in_ranges)
         return processing_object
     
     
-    def _adjust_brightness_and_contrast(self, zstack: np.ndarray, percentage_saturated_pixels: float, channel_adjustment_method: str) -> np.ndarray:
+    def requires_project_wide_preparation(self, strategy_configs: Dict) -> bool:
+        return strategy_configs['limits_computed_per'] == 'project'
+    
+    
+    def collect_file_specific_data(self, processing_object: PreprocessingObject, strategy_configs: Dict) -> List[np.ndarray]:
+        zstack = processing_object.preprocessed_image
+        assert self._uses_histograms(zstack = zstack), ('Project-wide limits are only supported for 8-bit or 16-bit images. '
+                                                        'Please add the "ConvertTo8BitStrat" before this strategy.')
+        channel_slices = self._get_channel_slices(zstack = zstack, channel_adjustment_method = strategy_configs['channel_adjustment_method'])
+        return [self._compute_histogram(values = zstack[..., channel_slice]) for channel_slice in channel_slices]
+    
+    
+    def add_project_wide_data_to_configs(self, file_specific_data: List[List[np.ndarray]], strategy_configs: Dict) -> Dict:
+        n_channel_slices = set([len(histograms) for histograms in file_specific_data])
+        assert len(n_channel_slices) == 1, 'Project-wide limits require that all images have the same number of color channels!'
+        strategy_configs = strategy_configs.copy()
+        project_wide_in_ranges = []
+        for channel_slice_idx in range(n_channel_slices.pop()):
+            histograms = [histograms[channel_slice_idx] for histograms in file_specific_data]
+            n_bins = max([histogram.shape[0] for histogram in histograms])
+            summed_histogram = np.zeros(n_bins, dtype = 'int64')
+            for histogram in histograms:
+                summed_histogram[:histogram.shape[0]] += histogram
+            project_wide_in_ranges.append(self._compute_in_range_from_histogram(histogram = summed_histogram,
+                                                                                percentage_saturated_pixels = strategy_configs['percentage_saturated_pixels']))
+        strategy_configs['project_wide_in_ranges'] = project_wide_in_ranges
+        return strategy_configs
+    
+    
+    def _adjust_brightness_and_contrast(self, 
+                                        zstack: np.ndarray, 
+                                        percentage_saturated_pixels: float, 
+                                        channel_adjustment_method: str,
+                                        limits_computed_per: str='plane',
+                                        project_wide_in_ranges: Optional[List[Tuple[int, int]]]=None
+                                       ) -> np.ndarray:
         """
         percentage_saturated_pixels: float, less than 50.0
         channel_adjustment_method: str, one of: 'individually', 'globally'
+        limits_computed_per: str, one of: 'plane', 'stack', 'project'
+        project_wide_in_ranges: list with one (min, max) tuple per channel (or a single one if 'globally'), only if limits_computed_per == 'project'
         """
-        adjusted_zstack = zstack.copy()
         if percentage_saturated_pixels >= 50:
             message_line0 = 'The percentage of saturated pixels cannot be set to values equal to or higher than 50.\n'
             message_line1 = 'Suggested default (also used by the ImageJ Auto Adjust method): 0.35'
             error_message = message_line0 + message_line1
             raise ValueError(error_message)
-        if channel_adjustment_method == 'individually':
-            self.min_max_ranges_per_plane_and_channel = []
-            for plane_index in range(adjusted_zstack.shape[0]):
-                min_max_ranges = []
-                for channel_index in range(adjusted_zstack.shape[3]):
-                    in_range_min = int(round(np.percentile(adjusted_zstack[plane_index, :, :, channel_index], percentage_saturated_pixels), 0))
-                    in_range_max = int(round(np.percentile(adjusted_zstack[plane_index, :, :, channel_index], 100 - percentage_saturated_pixels), 0))
-                    in_range = (in_range_min, in_range_max)
-                    adjusted_zstack[plane_index, :, :, channel_index] = exposure.rescale_intensity(image = adjusted_zstack[plane_index, :, :, channel_index], in_range = in_range)
-                    min_max_ranges.append(in_range)
-                self.min_max_ranges_per_plane_and_channel.append(min_max_ranges)
-        elif channel_adjustment_method == 'globally':
-            self.min_max_ranges_per_plane_and_channel = []
-            for plane_index in range(adjusted_zstack.shape[0]):
-                in_range_min = int(round(np.percentile(adjusted_zstack[plane_index], percentage_saturated_pixels), 0))
-                in_range_max = int(round(np.percentile(adjusted_zstack[plane_index], 100 - percentage_saturated_pixels), 0))
-                in_range = (in_range_min, in_range_max)
-                adjusted_zstack[plane_index] = exposure.rescale_intensity(image = adjusted_zstack[plane_index], in_range = in_range)
-                self.min_max_ranges_per_plane_and_channel.append(in_range)
-        else:
+        if channel_adjustment_method not in ['individually', 'globally']:
             raise NotImplementedError("The 'channel_adjustment_method' has to be one of: ['individually', 'globally'].\n",
                                       "-->'individually': the range of intensity values wil be calculated and scaled to the "
                                       "min and max values for each individual channel.\n"
                                       "-->'globally': the range of intensity values will be calculated from and scaled to the "
                                       "global min and max of all channels.\n"
                                       "Either way, min and max values will be determined for each image plane individually.")
-        return adjusted_zstack.copy()
+        if zstack.flags.writeable == False:
+            zstack = zstack.copy()
+        channel_slices = self._get_channel_slices(zstack = zstack, channel_adjustment_method = channel_adjustment_method)
+        if limits_computed_per == 'plane':
+            in_ranges_per_plane = [[self._compute_in_range(values = zstack[plane_index, ..., channel_slice], 
+                                                           percentage_saturated_pixels = percentage_saturated_pixels) 
+                                    for channel_slice in channel_slices] for plane_index in range(zstack.shape[0])]
+        elif limits_computed_per == 'stack':
+            in_ranges = [self._compute_in_range(values = zstack[..., channel_slice], percentage_saturated_pixels = percentage_saturated_pixels) 
+                         for channel_slice in channel_slices]
+            in_ranges_per_plane = [in_ranges for plane_index in range(zstack.shape[0])]
+        elif limits_computed_per == 'project':
+            assert len(project_wide_in_ranges) == len(channel_slices), 'The project-wide limits don´t match the color channels of this image!'
+            in_ranges_per_plane = [project_wide_in_ranges for plane_index in range(zstack.shape[0])]
+        else:
+            raise NotImplementedError("'limits_computed_per' has to be one of: ['plane', 'stack', 'project'].")
+        lookup_tables = {}
+        for plane_index, in_ranges in enumerate(in_ranges_per_plane):
+            for channel_slice, in_range in zip(channel_slices, in_ranges):
+                if self._uses_histograms(zstack = zstack):
+                    if in_range not in lookup_tables.keys():
+                        lookup_tables[in_range] = self._create_lookup_table(dtype = zstack.dtype, in_range = in_range)
+                    zstack[plane_index, ..., channel_slice] = lookup_tables[in_range][zstack[plane_index, ..., channel_slice]]
+                else:
+                    zstack[plane_index, ..., channel_slice] = exposure.rescale_intensity(image = zstack[plane_index, ..., channel_slice], in_range = in_range)
+        if channel_adjustment_method == 'individually':
+            self.min_max_ranges_per_plane_and_channel = in_ranges_per_plane
+        else:
+            self.min_max_ranges_per_plane_and_channel = [in_ranges[0] for in_ranges in in_ranges_per_plane]
+        return zstack
+    
+    
+    def _get_channel_slices(self, zstack: np.ndarray, channel_adjustment_method: str) -> List[slice]:
+        if channel_adjustment_method == 'individually':
+            return [slice(channel_index, channel_index + 1) for channel_index in range(zstack.shape[3])]
+        else:
+            return [slice(None)]
+    
+    
+    def _uses_histograms(self, zstack: np.ndarray) -> bool:
+        return zstack.dtype.name in ['uint8', 'uint16']
+    
+    
+    def _compute_in_range(self, values: np.ndarray, percentage_saturated_pixels: float) -> Tuple[int, int]:
+        if self._uses_histograms(zstack = values):
+            histogram = self._compute_histogram(values = values)
+            return self._compute_in_range_from_histogram(histogram = histogram, percentage_saturated_pixels = percentage_saturated_pixels)
+        else:
+            in_range_min = int(round(np.percentile(values, percentage_saturated_pixels), 0))
+            in_range_max = int(round(np.percentile(values, 100 - percentage_saturated_pixels), 0))
+            return (in_range_min, in_range_max)
+    
+    
+    def _compute_histogram(self, values: np.ndarray) -> np.ndarray:
+        return np.bincount(values.ravel(), minlength = np.iinfo(values.dtype).max + 1)
+    
+    
+    def _compute_in_range_from_histogram(self, histogram: np.ndarray, percentage_saturated_pixels: float) -> Tuple[int, int]:
+        cumulative_counts = np.cumsum(histogram)
+        in_range_min = self._compute_percentile_from_cumulative_counts(cumulative_counts = cumulative_counts, percentile = percentage_saturated_pixels)
+        in_range_max = self._compute_percentile_from_cumulative_counts(cumulative_counts = cumulative_counts, percentile = 100 - percentage_saturated_pixels)
+        return (int(round(in_range_min, 0)), int(round(in_range_max, 0)))
+    
+    
+    def _compute_percentile_from_cumulative_counts(self, cumulative_counts: np.ndarray, percentile: float) -> float:
+        # same linear interpolation between the two closest values as np.percentile (i.e. method = 'linear'):
+        n_values = int(cumulative_counts[-1])
+        virtual_index = (n_values - 1) * (percentile / 100)
+        lower_index = int(np.floor(virtual_index))
+        upper_index = min(lower_index + 1, n_values - 1)
+        lower_value, upper_value = [int(value) for value in np.searchsorted(cumulative_counts, [lower_index, upper_index], side = 'right')]
+        gamma = virtual_index - lower_index
+        if gamma >= 0.5:
+            return upper_value - (upper_value - lower_value) * (1 - gamma)
+        else:
+            return lower_value + (upper_value - lower_value) * gamma
+    
+    
+    def _create_lookup_table(self, dtype: np.dtype, in_range: Tuple[int, int]) -> np.ndarray:
+        all_possible_values = np.arange(np.iinfo(dtype).max + 1, dtype = dtype)
+        return exposure.rescale_intensity(image = all_possible_values, in_range = in_range)
 
 
     def _add_strategy_specific_infos_to_updates(self, updates: Dict) -> Dict:
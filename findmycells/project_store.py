@@ -0,0 +1,311 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/11_project_store.ipynb.
+
+# %% auto 0
+__all__ = ['LazyFileRecords', 'SQLiteProjectStore']
+
+# %% ../nbs/api/11_project_store.ipynb 2
+from typing import List, Dict, Tuple, Any, Iterator, Union
+from pathlib import Path, PosixPath, WindowsPath
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from datetime import datetime
+import copy
+import pickle
+import sqlite3
+
+import numpy as np
+import pandas as pd
+from shapely import wkb
+
+from .configs import ProjectConfigs
+from .database import Database, FileHistory, FileInfos
+
+# %% ../nbs/api/11_project_store.ipynb 4
+class LazyFileRecords(MutableMapping):
+    
+    """
+    Dictionary-like container for file-specific records (keys are the file_ids) of a `Database` that 
+    was loaded from a `SQLiteProjectStore`. The records of a file are only read from the project store 
+    once they are accessed for the first time. Records that are added or overwritten are simply kept 
+    in memory, until the project is saved again.
+    """
+    
+    def __init__(self, project_store: 'SQLiteProjectStore', loader_id: str, file_ids: List[str]) -> None:
+        self.project_store = project_store
+        self.loader_id = loader_id # name of the method of the project store that loads the records of a single file
+        self.file_ids = file_ids.copy()
+        self.loaded_records = {}
+        
+        
+    def __getitem__(self, file_id: str) -> Any:
+        if file_id not in self.loaded_records.keys():
+            if file_id not in self.file_ids:
+                raise KeyError(file_id)
+            self.loaded_records[file_id] = getattr(self.project_store, self.loader_id)(file_id = file_id)
+        return self.loaded_records[file_id]
+    
+    
+    def __setitem__(self, file_id: str, records: Any) -> None:
+        if file_id not in self.file_ids:
+            self.file_ids.append(file_id)
+        self.loaded_records[file_id] = records
+        
+        
+    def __delitem__(self, file_id: str) -> None:
+        if file_id not in self.file_ids:
+            raise KeyError(file_id)
+        self.file_ids.remove(file_id)
+        if file_id in self.loaded_records.keys():
+            self.loaded_records.pop(file_id)
+            
+            
+    def __contains__(self, file_id: object) -> bool:
+        return file_id in self.file_ids
+    
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.file_ids.copy())
+    
+    
+    def __len__(self) -> int:
+        return len(self.file_ids)
+    
+    
+    def is_loaded(self, file_id: str) -> bool:
+        return file_id in self.loaded_records.keys()
+
+# %% ../nbs/api/11_project_store.ipynb 5
+class SQLiteProjectStore:
+    
+    """
+    Transactional on-disk store of a *findmycells* project (i.e. of its `ProjectConfigs` and its `Database`), 
+    based on SQLite. All file-specific records are saved in individual tables (file infos, file histories & 
+    tracked settings, area ROIs as WKB, multi-match tracebacks, and quantification results), such that the 
+    records of single files can be updated without re-writing the entire project (see `save_file_records()`). 
+    Each save is a single transaction - if it gets interrupted, the previously saved status remains intact. 
+    When the project is loaded, file histories, area ROIs, and multi-match tracebacks of a file are only 
+    read from disk once they are accessed for the first time (see `LazyFileRecords`).
+    """
+    
+    def __init__(self, filepath: Union[PosixPath, WindowsPath]) -> None:
+        self.filepath = filepath
+        
+        
+    @property
+    def lazily_loaded_attr_ids(self) -> Dict[str, str]:
+        # Database attributes with file-specific records & the name of the method that loads them for a single file:
+        return {'file_histories': 'load_file_history',
+                'area_rois_for_quantification': 'load_area_rois',
+                'multi_matches_traceback': 'load_multi_matches_traceback'}
+    
+    
+    @property
+    def file_specific_table_names(self) -> List[str]:
+        return ['file_infos', 'file_histories', 'tracked_strategies', 'area_rois', 'multi_matches_traceback', 'quantification_results']
+    
+    
+    def exists(self) -> bool:
+        return self.filepath.is_file()
+    
+        
+    def save_project(self, project_configs: ProjectConfigs, database: Database) -> None:
+        """
+        Saves the entire project. Records of files that were loaded lazily and never accessed 
+        since then are unchanged and therefore not written again.
+        """
+        with self._transaction() as connection:
+            self._create_tables_if_needed(connection = connection)
+            self._write_project_level_records(connection = connection, project_configs = project_configs, database = database)
+            saved_file_ids = [row[0] for row in connection.execute('SELECT file_id FROM file_infos')]
+            for file_id in saved_file_ids:
+                if database.file_infos.contains_file_id(file_id = file_id) == False:
+                    self._delete_file_records(connection = connection, file_id = file_id, table_names = self.file_specific_table_names)
+            for file_id in database.file_infos['file_id']:
+                self._write_file_records(connection = connection, database = database, file_id = file_id)
+                
+                
+    def save_file_records(self, project_configs: ProjectConfigs, database: Database, file_ids: List[str]) -> None:
+        """
+        Updates only the records of the specified files (and the few project-level records, like 
+        the project configs), instead of saving the entire project.
+        """
+        with self._transaction() as connection:
+            self._create_tables_if_needed(connection = connection)
+            self._write_project_level_records(connection = connection, project_configs = project_configs, database = database)
+            for file_id in file_ids:
+                self._write_file_records(connection = connection, database = database, file_id = file_id)
+            
+            
+    def load_project(self) -> Tuple[ProjectConfigs, Database]:
+        with self._transaction() as connection:
+            project_configs = pickle.loads(connection.execute('SELECT data FROM project_configs').fetchone()[0])
+            database = Database.__new__(Database)
+            for attr_id, data in connection.execute('SELECT attr_id, data FROM database_attributes'):
+                setattr(database, attr_id, pickle.loads(data))
+            database.file_infos = self._load_file_infos(connection = connection)
+            for attr_id, loader_id in self.lazily_loaded_attr_ids.items():
+                table_name = 'area_rois' if attr_id == 'area_rois_for_quantification' else attr_id
+                file_ids = [row[0] for row in connection.execute(f'SELECT DISTINCT file_id FROM {table_name}')]
+                if (len(file_ids) > 0) | (attr_id == 'file_histories'):
+                    file_ids = set(file_ids)
+                    file_ids = [file_id for file_id in database.file_infos['file_id'] if file_id in file_ids]
+                    setattr(database, attr_id, LazyFileRecords(project_store = self, loader_id = loader_id, file_ids = file_ids))
+            quantification_results = self._load_quantification_results(connection = connection)
+            if len(quantification_results) > 0:
+                database.quantification_results = quantification_results
+        database.project_configs = project_configs
+        return project_configs, database
+    
+    
+    def load_file_history(self, file_id: str) -> FileHistory:
+        with self._transaction() as connection:
+            source_image_filepath, datetime_added, completed_processing_steps = connection.execute('SELECT source_image_filepath, datetime_added, completed_processing_steps '
+                                                                                                   'FROM file_histories WHERE file_id = ?', (file_id,)).fetchone()
+            tracked_strategies = connection.execute('SELECT strategy_idx, processing_step_id, processing_strategy, strategy_finished_at, settings '
+                                                    'FROM tracked_strategies WHERE file_id = ? ORDER BY strategy_idx', (file_id,)).fetchall()
+        file_history = FileHistory.__new__(FileHistory)
+        file_history.file_id = file_id
+        file_history.source_image_filepath = pickle.loads(source_image_filepath)
+        file_history.datetime_added = datetime.fromisoformat(datetime_added)
+        tracked_history = {'processing_step_id': [row[1] for row in tracked_strategies],
+                           'processing_strategy': [row[2] for row in tracked_strategies],
+                           'strategy_finished_at': [datetime.fromisoformat(row[3]) for row in tracked_strategies]}
+        file_history.tracked_history = pd.DataFrame(data = tracked_history, index = [row[0] for row in tracked_strategies])
+        file_history.tracked_settings = {row[0]: pickle.loads(row[4]) for row in tracked_strategies}
+        file_history.completed_processing_steps = pickle.loads(completed_processing_steps)
+        return file_history
+    
+    
+    def load_area_rois(self, file_id: str) -> Dict[str, Dict[str, Any]]:
+        area_rois = {}
+        with self._transaction() as connection:
+            for plane_id, area_roi_id, roi_as_wkb in connection.execute('SELECT plane_id, area_roi_id, roi_as_wkb FROM area_rois '
+                                                                        'WHERE file_id = ? ORDER BY rowid', (file_id,)):
+                if plane_id not in area_rois.keys():
+                    area_rois[plane_id] = {}
+                area_rois[plane_id][area_roi_id] = wkb.loads(roi_as_wkb)
+        return area_rois
+    
+    
+    def load_multi_matches_traceback(self, file_id: str) -> Dict[str, List]:
+        with self._transaction() as connection:
+            data = connection.execute('SELECT data FROM multi_matches_traceback WHERE file_id = ?', (file_id,)).fetchone()[0]
+        return pickle.loads(data)
+    
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(str(self.filepath))
+        try:
+            with connection: # commits if successful, otherwise rolls back all changes
+                yield connection
+        finally:
+            connection.close()
+            
+            
+    def _create_tables_if_needed(self, connection: sqlite3.Connection) -> None:
+        # columns without declared type keep the type of the inserted value (e.g. int or str plane_ids)
+        connection.execute('CREATE TABLE IF NOT EXISTS project_configs (data BLOB)')
+        connection.execute('CREATE TABLE IF NOT EXISTS database_attributes (attr_id TEXT PRIMARY KEY, data BLOB)')
+        connection.execute('CREATE TABLE IF NOT EXISTS file_info_keys (position INTEGER PRIMARY KEY, key TEXT)')
+        connection.execute('CREATE TABLE IF NOT EXISTS file_infos (file_id TEXT PRIMARY KEY, position INTEGER, data BLOB)')
+        connection.execute('CREATE TABLE IF NOT EXISTS file_histories (file_id TEXT PRIMARY KEY, source_image_filepath BLOB, '
+                           'datetime_added TEXT, completed_processing_steps BLOB)')
+        connection.execute('CREATE TABLE IF NOT EXISTS tracked_strategies (file_id TEXT, strategy_idx INTEGER, processing_step_id TEXT, '
+                           'processing_strategy TEXT, strategy_finished_at TEXT, settings BLOB, PRIMARY KEY (file_id, strategy_idx))')
+        connection.execute('CREATE TABLE IF NOT EXISTS area_rois (file_id TEXT, plane_id, area_roi_id, roi_as_wkb BLOB)')
+        connection.execute('CREATE INDEX IF NOT EXISTS area_rois_file_id ON area_rois (file_id)')
+        connection.execute('CREATE TABLE IF NOT EXISTS multi_matches_traceback (file_id TEXT PRIMARY KEY, data BLOB)')
+        connection.execute('CREATE TABLE IF NOT EXISTS quantification_results (strategy TEXT, file_id TEXT, area_roi_id, value)')
+        connection.execute('CREATE INDEX IF NOT EXISTS quantification_results_file_id ON quantification_results (file_id)')
+        
+        
+    def _write_project_level_records(self, connection: sqlite3.Connection, project_configs: ProjectConfigs, database: Database) -> None:
+        project_configs_to_save = copy.copy(project_configs)
+        if hasattr(project_configs_to_save, 'available_processing_modules'):
+            # modules can´t be pickled:
+            delattr(project_configs_to_save, 'available_processing_modules')
+        connection.execute('DELETE FROM project_configs')
+        connection.execute('INSERT INTO project_configs VALUES (?)', (pickle.dumps(project_configs_to_save),))
+        connection.execute('DELETE FROM database_attributes')
+        file_specific_attr_ids = ['project_configs', 'file_infos', 'quantification_results'] + list(self.lazily_loaded_attr_ids.keys())
+        for attr_id, value in vars(database).items():
+            if attr_id not in file_specific_attr_ids:
+                connection.execute('INSERT INTO database_attributes VALUES (?, ?)', (attr_id, pickle.dumps(value)))
+        connection.execute('DELETE FROM file_info_keys')
+        connection.executemany('INSERT INTO file_info_keys VALUES (?, ?)', enumerate(database.file_infos.keys()))
+        
+        
+    def _write_file_records(self, connection: sqlite3.Connection, database: Database, file_id: str) -> None:
+        index = database.file_infos.get_row_index(file_id = file_id)
+        file_infos = database.file_infos.get_row(file_id = file_id)
+        connection.execute('INSERT OR REPLACE INTO file_infos VALUES (?, ?, ?)', (file_id, index, pickle.dumps(file_infos)))
+        for attr_id in self.lazily_loaded_attr_ids.keys():
+            records = getattr(database, attr_id, {})
+            if type(records) == LazyFileRecords:
+                if (records.project_store.filepath == self.filepath) & (file_id in records) & (records.is_loaded(file_id) == False):
+                    # unchanged since the project was loaded from this store:
+                    continue
+            if attr_id == 'file_histories':
+                self._delete_file_records(connection = connection, file_id = file_id, table_names = ['file_histories', 'tracked_strategies'])
+                if file_id in records:
+                    self._insert_file_history(connection = connection, file_history = records[file_id])
+            elif attr_id == 'area_rois_for_quantification':
+                self._delete_file_records(connection = connection, file_id = file_id, table_names = ['area_rois'])
+                if file_id in records:
+                    for plane_id, rois_in_plane in records[file_id].items():
+                        for area_roi_id, roi in rois_in_plane.items():
+                            connection.execute('INSERT INTO area_rois VALUES (?, ?, ?, ?)', (file_id, plane_id, area_roi_id, wkb.dumps(roi)))
+            else:
+                self._delete_file_records(connection = connection, file_id = file_id, table_names = ['multi_matches_traceback'])
+                if file_id in records:
+                    connection.execute('INSERT INTO multi_matches_traceback VALUES (?, ?)', (file_id, pickle.dumps(records[file_id])))
+        self._delete_file_records(connection = connection, file_id = file_id, table_names = ['quantification_results'])
+        for strategy, results in getattr(database, 'quantification_results', {}).items():
+            if file_id in results.keys():
+                for area_roi_id, value in results[file_id].items():
+                    if isinstance(value, np.generic):
+                        value = value.item()
+                    connection.execute('INSERT INTO quantification_results VALUES (?, ?, ?, ?)', (strategy, file_id, area_roi_id, value))
+                    
+                    
+    def _insert_file_history(self, connection: sqlite3.Connection, file_history: FileHistory) -> None:
+        connection.execute('INSERT INTO file_histories VALUES (?, ?, ?, ?)', (file_history.file_id,
+                                                                             pickle.dumps(file_history.source_image_filepath),
+                                                                             file_history.datetime_added.isoformat(),
+                                                                             pickle.dumps(file_history.completed_processing_steps)))
+        for strategy_idx, row in file_history.tracked_history.iterrows():
+            connection.execute('INSERT INTO tracked_strategies VALUES (?, ?, ?, ?, ?, ?)', (file_history.file_id,
+                                                                                           int(strategy_idx),
+                                                                                           row['processing_step_id'],
+                                                                                           row['processing_strategy'],
+                                                                                           row['strategy_finished_at'].isoformat(),
+                                                                                           pickle.dumps(file_history.tracked_settings.get(strategy_idx))))
+            
+            
+    def _delete_file_records(self, connection: sqlite3.Connection, file_id: str, table_names: List[str]) -> None:
+        for table_name in table_names:
+            connection.execute(f'DELETE FROM {table_name} WHERE file_id = ?', (file_id,))
+            
+            
+    def _load_file_infos(self, connection: sqlite3.Connection) -> FileInfos:
+        keys = [row[0] for row in connection.execute('SELECT key FROM file_info_keys ORDER BY position')]
+        rows = [pickle.loads(row[0]) for row in connection.execute('SELECT data FROM file_infos ORDER BY position')]
+        file_infos = {}
+        for key in keys:
+            if all([key in row.keys() for row in rows]):
+                file_infos[key] = [row[key] for row in rows]
+            else:
+                file_infos[key] = []
+        return FileInfos(file_infos)
+    
+    
+    def _load_quantification_results(self, connection: sqlite3.Connection) -> Dict[str, Dict[str, Dict]]:
+        quantification_results = {}
+        for strategy, file_id, area_roi_id, value in connection.execute('SELECT strategy, file_id, area_roi_id, value FROM quantification_results ORDER BY rowid'):
+            if strategy not in quantification_results.keys():
+                quantification_results[strategy] = {}
+            if file_id not in quantification_results[strategy].keys():
+                quantification_results[strategy][file_id] = {}
+            quantification_results[strategy][file_id][area_roi_id] = value
+        return quantification_results
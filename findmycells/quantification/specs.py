@@ -9,6 +9,7 @@ from skimage import io
 
 from ..core import ProcessingObject, ProcessingStrategy
 from ..configs import DefaultConfigs
+from ..storage import get_stack_storage
 from .. import utils
 
 # %% ../../nbs/api/08_quantification_00_specs.ipynb 4
@@ -51,14 +52,20 @@ class QuantificationObject(ProcessingObject):
     def widget_names(self):
         widget_names = {'overwrite': 'Checkbox',
                         'autosave': 'Checkbox',
-                        'show_progress': 'Checkbox'}
+                        'autosave_every_n_files': 'BoundedIntText',
+                        'autosave_every_n_seconds': 'BoundedIntText',
+                        'show_progress': 'Checkbox',
+                        'n_workers': 'BoundedIntText'}
         return widget_names
 
     @property
     def descriptions(self):
         descriptions = {'overwrite': 'overwrite previously processed files',
-                        'autosave': 'autosave progress after each file',
-                        'show_progress': 'show progress bar and estimated computation time'}
+                        'autosave': 'autosave progress (incremental checkpoints)',
+                        'autosave_every_n_files': 'autosave after every n files',
+                        'autosave_every_n_seconds': 'autosave at the latest after n seconds (0 = off)',
+                        'show_progress': 'show progress bar and estimated computation time',
+                        'n_workers': 'number of files to process in parallel (1 = one file after another)'}
         return descriptions
     
     @property
@@ -69,30 +76,29 @@ class QuantificationObject(ProcessingObject):
     def default_configs(self) -> DefaultConfigs:
         default_values = {'overwrite': False,
                           'autosave': True,
-                          'show_progress': True}
+                          'autosave_every_n_files': 1,
+                          'autosave_every_n_seconds': 0,
+                          'show_progress': True,
+                          'n_workers': 1}
         valid_types = {'overwrite': [bool],
                        'autosave': [bool],
-                       'show_progress': [bool]}
+                       'autosave_every_n_files': [int],
+                       'autosave_every_n_seconds': [int],
+                       'show_progress': [bool],
+                       'n_workers': [int]}
+        valid_value_ranges = {'autosave_every_n_files': (1, 10000, 1),
+                              'autosave_every_n_seconds': (0, 86400, 1),
+                              'n_workers': (1, 128, 1)}
         default_configs = DefaultConfigs(default_values = default_values,
-                                         valid_types = valid_types)
+                                         valid_types = valid_types,
+                                         valid_value_ranges = valid_value_ranges)
         return default_configs
     
     
     def _processing_specific_preparations(self) -> None:
         self.file_id = self.file_ids[0]
-        self.segmentations_per_area_roi_id = self._load_postprocessed_segmentations()
-
-
-    def _load_postprocessed_segmentations(self) -> Dict:
-        segmentations_per_area_roi_id = {}
-        quantified_segmentations_dir_path = self.database.project_configs.root_dir.joinpath(self.database.quantified_segmentations_dir)
-        for elem in quantified_segmentations_dir_path.iterdir():
-            if elem.is_dir():
-                matching_filepaths = [filepath for filepath in utils.list_dir_no_hidden(elem) if filepath.name.startswith(self.file_id)]
-                if len(matching_filepaths) > 0:
-                    area_roi_id = elem.name
-                    segmentations_per_area_roi_id[area_roi_id] = utils.load_zstack_as_array_from_single_planes(path = elem, file_id = self.file_id)
-        return segmentations_per_area_roi_id
+        # masked stacks of the individual area ROIs are only created when they are accessed:
+        self.segmentations_per_area_roi_id = self.database.load_postprocessed_segmentations(file_id = self.file_id)
 
 
     def _add_processing_specific_infos_to_updates(self, updates: Dict) -> Dict:
@@ -1,14 +1,17 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/api/04_readers_01_microscopy_images.ipynb.
 
 # %% auto 0
-__all__ = ['MicroscopyImageReaders', 'CZIReader', 'RegularImageFiletypeReader', 'FromExcelReader']
+__all__ = ['MicroscopyImageReaders', 'CZIReader', 'RegularImageFiletypeReader', 'TIFFReader', 'FromExcelReader']
 
 # %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 2
 from abc import abstractmethod
 from typing import List, Tuple, Optional, Dict, Any, Union
 from pathlib import PosixPath, Path, WindowsPath
+import math
 import numpy as np
+import pandas as pd
 import czifile
+import tifffile
 from skimage.io import imread
 
 from ..core import DataReader, DataLoader
@@ -31,6 +34,39 @@ class MicroscopyImageReaders(DataReader):
         assert len(output.shape) == 4, 'The shape of the to-be-returned array does not match the expected shape!'
         
         
+    def read_metadata(self, 
+                      filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+                      reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                     ) -> Dict[str, Any]: # metadata of the image, e.g. {'bit_depth': 12} - empty if not available
+        """
+        Can be overwritten by subclasses to provide metadata of the microscopy image that can´t be 
+        inferred from the read numpy array itself (e.g. the bit depth of 12-bit images stored as uint16).
+        """
+        return {}
+    
+    
+    def read_region(self,
+                    filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+                    reader_configs: Dict, # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+                    region: Dict[str, int] # "lower_row_cropping_idx", "upper_row_cropping_idx", "lower_col_cropping_idx", and "upper_col_cropping_idx"
+                   ) -> np.ndarray: # numpy array with the structure: [imaging-planes, rows, columns, imaging-channel]
+        """
+        Reads only the requested region of the image. Upper indices that exceed the image size are clipped to it.
+        Subclasses that can decode parts of an image individually (e.g. subblocks of CZI files) should overwrite 
+        this method - by default, the entire image is read and cropped afterwards.
+        """
+        image = self.read(filepath = filepath, reader_configs = reader_configs)
+        return self._crop_to_region(image = image, region = region)
+    
+    
+    def _crop_to_region(self, image: np.ndarray, region: Dict[str, int]) -> np.ndarray:
+        # a copy, so that the full image can be released:
+        return np.ascontiguousarray(image[:, 
+                                          region['lower_row_cropping_idx']:region['upper_row_cropping_idx'], 
+                                          region['lower_col_cropping_idx']:region['upper_col_cropping_idx'], 
+                                          :])
+        
+        
     def _get_color_channel_slice(self, reader_configs: Dict[str, Any]) -> slice:
         if reader_configs['all_color_channels'] == True:
             color_channel_slice = slice(None)
@@ -63,6 +99,73 @@ class MicroscopyImageReaders(DataReader):
         return plane_idx_slice
 
 # %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 5
+class _LazyCZISubblockArray:
+    
+    """
+    Array-like representation of the image data of a CZI file, with the same shape & axes as the array that is 
+    returned by `czifile.CziFile.asarray()`. However, upon indexing (only integers and contiguous slices are 
+    supported) only those subblocks of the CZI file that overlap with the requested data are decoded. Optionally, 
+    the "Y" and "X" dimensions can be restricted to a region (see `MicroscopyImageReaders.read_region()`).
+    """
+    
+    def __init__(self, czi_file: czifile.CziFile, region: Optional[Dict[str, int]]=None) -> None:
+        self.czi_file = czi_file
+        self.dtype = czi_file.dtype
+        start, shape = list(czi_file.start), list(czi_file.shape)
+        if region != None:
+            for axis_id, lower_idx_key, upper_idx_key in [('Y', 'lower_row_cropping_idx', 'upper_row_cropping_idx'),
+                                                          ('X', 'lower_col_cropping_idx', 'upper_col_cropping_idx')]:
+                axis_idx = czi_file.axes.index(axis_id)
+                lower_idx = min(region[lower_idx_key], shape[axis_idx])
+                upper_idx = max(lower_idx, min(region[upper_idx_key], shape[axis_idx]))
+                start[axis_idx] += lower_idx
+                shape[axis_idx] = upper_idx - lower_idx
+        self.start, self.shape = tuple(start), tuple(shape)
+        
+        
+    def __getitem__(self, index: Union[int, slice, Tuple[Union[int, slice], ...]]) -> np.ndarray:
+        if type(index) != tuple:
+            index = (index, )
+        if len(index) > len(self.shape):
+            raise IndexError(f'Too many indices: the CZI image data has only {len(self.shape)} dimensions.')
+        index = index + (slice(None), ) * (len(self.shape) - len(index))
+        requested_start, requested_shape, integer_indexed_axes = [], [], []
+        for axis_idx, (axis_index, start, size) in enumerate(zip(index, self.start, self.shape)):
+            if type(axis_index) == slice:
+                lower_idx, upper_idx, step = axis_index.indices(size)
+                if step != 1:
+                    raise NotImplementedError('Only contiguous slices are supported to index the CZI image data.')
+                upper_idx = max(lower_idx, upper_idx)
+            else:
+                lower_idx = int(axis_index) + size if int(axis_index) < 0 else int(axis_index)
+                if (lower_idx < 0) | (lower_idx >= size):
+                    raise IndexError(f'Index {axis_index} is out of bounds for axis {axis_idx} with size {size}.')
+                upper_idx = lower_idx + 1
+                integer_indexed_axes.append(axis_idx)
+            requested_start.append(start + lower_idx)
+            requested_shape.append(upper_idx - lower_idx)
+        requested_data = self._decode_overlapping_subblocks(requested_start = requested_start, requested_shape = requested_shape)
+        return requested_data.squeeze(axis = tuple(integer_indexed_axes))
+    
+    
+    def _decode_overlapping_subblocks(self, requested_start: List[int], requested_shape: List[int]) -> np.ndarray:
+        requested_data = np.zeros(requested_shape, dtype = self.dtype)
+        for directory_entry in self.czi_file.filtered_subblock_directory:
+            overlaps = all([(subblock_start < start + size) & (subblock_start + subblock_size > start) 
+                            for subblock_start, subblock_size, start, size 
+                            in zip(directory_entry.start, directory_entry.shape, requested_start, requested_shape)])
+            if overlaps == False:
+                continue
+            tile = directory_entry.data_segment().data(resize = True, order = 0)
+            tile_index, requested_data_index = [], []
+            for subblock_start, tile_size, start, size in zip(directory_entry.start, tile.shape, requested_start, requested_shape):
+                lower_idx, upper_idx = max(subblock_start, start), min(subblock_start + tile_size, start + size)
+                tile_index.append(slice(lower_idx - subblock_start, upper_idx - subblock_start))
+                requested_data_index.append(slice(lower_idx - start, upper_idx - start))
+            requested_data[tuple(requested_data_index)] = tile[tuple(tile_index)]
+        return requested_data
+
+# %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 6
 class CZIReader(MicroscopyImageReaders):
     
     """
@@ -73,6 +176,8 @@ class CZIReader(MicroscopyImageReaders):
     are other format shapes, that are not taken into account in the if-elif-else loop in self.read(). 
     Please note, that the else condition in self.read() was not tested yet, as there was no matching test data at hand!
     If the CZIReader throws an error at your data, feel free to open up an issue or to add a solution in a pull request!
+    Only the subblocks of the CZI file that are actually required for the selected version, tile, planes, color channels
+    (and region, see `read_region()`) are decoded.
     """
     
     @property
@@ -84,46 +189,83 @@ class CZIReader(MicroscopyImageReaders):
              filepath: Path, # filepath to the microscopy image file
              reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
             ) -> np.ndarray: # numpy array with the structure: [imaging-planes, rows, columns, imaging-channel]
+        return self._read_image_using_configs(filepath = filepath, reader_configs = reader_configs)
+    
+    
+    def read_region(self, filepath: Path, reader_configs: Dict, region: Dict[str, int]) -> np.ndarray:
+        # only the subblocks that overlap with the region will be decoded:
+        return self._read_image_using_configs(filepath = filepath, reader_configs = reader_configs, region = region)
+    
+    
+    def _read_image_using_configs(self, filepath: Path, reader_configs: Dict, region: Optional[Dict[str, int]]=None) -> np.ndarray:
         color_channel_slice = self._get_color_channel_slice(reader_configs = reader_configs)
         plane_idx_slice = self._get_plane_idx_slice(reader_configs = reader_configs)
-        img = czifile.CziFile(filepath)
-        meta = img.metadata(raw=False)["ImageDocument"]["Metadata"]["Information"]["Image"]
-        if meta["SizeZ"] == 1: # single plane image, tested
-            single_plane_image=img.asarray()[reader_configs["tile_row_idx"],
-                                         reader_configs["tile_col_idx"], 
-                                         :, 
-                                         :, 
-                                         color_channel_slice]
-            read_image_using_configs = np.expand_dims(single_plane_image, axis=[0])
-        elif meta["SizeS"] == 1: # single version image, tested
-            read_image_using_configs=img.asarray()[reader_configs["tile_row_idx"],
-                                         reader_configs["tile_col_idx"], 
-                                         plane_idx_slice, 
-                                         :, 
-                                         :, 
-                                         color_channel_slice]
-        else: # not tested yet
-            read_image_using_configs=img.asarray()[reader_configs['version_idx'],
-                reader_configs['tile_row_idx'], 
-                reader_configs['tile_col_idx'], 
-                plane_idx_slice, 
-                :, 
-                :, 
-                color_channel_slice]
+        with czifile.CziFile(filepath) as img:
+            meta = img.metadata(raw=False)["ImageDocument"]["Metadata"]["Information"]["Image"]
+            # nothing is decoded until the lazy image data gets indexed:
+            image_data = _LazyCZISubblockArray(czi_file = img, region = region)
+            if meta["SizeZ"] == 1: # single plane image, tested
+                single_plane_image=image_data[reader_configs["tile_row_idx"],
+                                             reader_configs["tile_col_idx"], 
+                                             :, 
+                                             :, 
+                                             color_channel_slice]
+                read_image_using_configs = np.expand_dims(single_plane_image, axis=[0])
+            elif meta["SizeS"] == 1: # single version image, tested
+                read_image_using_configs=image_data[reader_configs["tile_row_idx"],
+                                             reader_configs["tile_col_idx"], 
+                                             plane_idx_slice, 
+                                             :, 
+                                             :, 
+                                             color_channel_slice]
+            else: # not tested yet
+                read_image_using_configs=image_data[reader_configs['version_idx'],
+                    reader_configs['tile_row_idx'], 
+                    reader_configs['tile_col_idx'], 
+                    plane_idx_slice, 
+                    :, 
+                    :, 
+                    color_channel_slice]
         return read_image_using_configs
+    
+    
+    def read_metadata(self, filepath: Path, reader_configs: Dict) -> Dict[str, Any]:
+        """
+        Reports the bit depth (e.g. 12 for 12-bit images that are stored as 16-bit integers) and, if 
+        available, the pixel size in µm for each spatial dimension (e.g. {'X': 0.3, 'Y': 0.3, 'Z': 1.0}).
+        """
+        metadata = {}
+        with czifile.CziFile(filepath) as img:
+            meta = img.metadata(raw=False)["ImageDocument"]["Metadata"]
+        if "ComponentBitCount" in meta["Information"]["Image"].keys():
+            metadata['bit_depth'] = int(meta["Information"]["Image"]["ComponentBitCount"])
+        try:
+            distances = meta["Scaling"]["Items"]["Distance"]
+        except (KeyError, TypeError):
+            distances = []
+        if type(distances) == dict: # only a single dimension
+            distances = [distances]
+        pixel_size_in_um = {}
+        for distance in distances:
+            if ("Id" in distance.keys()) & ("Value" in distance.keys()):
+                pixel_size_in_um[distance["Id"]] = float(distance["Value"]) * 1e6 # stored in m
+        if len(pixel_size_in_um) > 0:
+            metadata['pixel_size_in_um'] = pixel_size_in_um
+        return metadata
 
-# %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 6
+# %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 7
 class RegularImageFiletypeReader(MicroscopyImageReaders):
     
     """
     This reader enables loading of all regular image filetypes, that scikit-image can read, using the scikit-image.io.imread function.
     Note: So far only single plane images are supported (yet, both single-color & multi-color channel images are supported)!
+    TIFF files are handled by the `TIFFReader`.
     """
     
     @property
     def readable_filetype_extensions(self) -> List[str]:
         # ToDo: figure out which formats are possible, probably many many more.. 
-        return ['.png', '.tif', '.tiff', '.jpg']
+        return ['.png', '.jpg']
     
     
     def read(self,
@@ -152,7 +294,182 @@ class RegularImageFiletypeReader(MicroscopyImageReaders):
                                       f'was: {single_plane_image.shape}.')
         return image_with_correct_format
 
-# %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 7
+# %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 8
+class TIFFReader(MicroscopyImageReaders):
+    
+    """
+    This reader enables loading of (multi-page) TIFF and OME-TIFF files, using the tifffile package. All axes 
+    of the first image series of the file - except for the rows ("Y"), columns ("X"), and color channels ("C" 
+    or "S") - are mapped to the imaging planes (e.g. the "Z" axis, or the pages of a multi-page TIFF). 
+    Uncompressed images are memory-mapped, such that only the selected planes, color channels, and region (see
+    `read_region()`) are actually read from disk. For compressed images, only the pages and strips or tiles
+    that overlap with the selection are decoded.
+    Note: Images with both, a "C" and a "S" axis (e.g. multiple RGB channels) are not supported yet!
+    """
+    
+    @property
+    def readable_filetype_extensions(self) -> List[str]:
+        return ['.tif', '.tiff']
+    
+    
+    def read(self,
+             filepath: Union[PosixPath, WindowsPath], # filepath to the microscopy image file
+             reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
+            ) -> np.ndarray: # numpy array with the structure: [imaging-planes, rows, columns, imaging-channel]
+        return self._read_image_using_configs(filepath = filepath, reader_configs = reader_configs)
+    
+    
+    def read_region(self, filepath: Union[PosixPath, WindowsPath], reader_configs: Dict, region: Dict[str, int]) -> np.ndarray:
+        return self._read_image_using_configs(filepath = filepath, reader_configs = reader_configs, region = region)
+    
+    
+    def read_metadata(self, filepath: Union[PosixPath, WindowsPath], reader_configs: Dict) -> Dict[str, Any]:
+        """
+        For OME-TIFF files, the bit depth ("SignificantBits") and the pixel size in µm for each 
+        spatial dimension ("PhysicalSizeX", "PhysicalSizeY", and "PhysicalSizeZ") are reported.
+        """
+        metadata = {}
+        with tifffile.TiffFile(filepath) as tif:
+            if tif.is_ome == False:
+                return metadata
+            ome_metadata = tifffile.xml2dict(tif.ome_metadata)['OME']
+        image_metadata = ome_metadata['Image'][0] if type(ome_metadata['Image']) == list else ome_metadata['Image']
+        pixels_metadata = image_metadata['Pixels']
+        if 'SignificantBits' in pixels_metadata.keys():
+            metadata['bit_depth'] = int(pixels_metadata['SignificantBits'])
+        conversion_factors_to_um = {'nm': 1e-3, 'µm': 1.0, 'um': 1.0, 'mm': 1e3}
+        pixel_size_in_um = {}
+        for axis_id in ['X', 'Y', 'Z']:
+            if f'PhysicalSize{axis_id}' in pixels_metadata.keys():
+                unit = pixels_metadata.get(f'PhysicalSize{axis_id}Unit', 'µm') 
+                if unit in conversion_factors_to_um.keys():
+                    pixel_size_in_um[axis_id] = float(pixels_metadata[f'PhysicalSize{axis_id}']) * conversion_factors_to_um[unit]
+        if len(pixel_size_in_um) > 0:
+            metadata['pixel_size_in_um'] = pixel_size_in_um
+        return metadata
+    
+    
+    def _read_image_using_configs(self, 
+                                  filepath: Union[PosixPath, WindowsPath], 
+                                  reader_configs: Dict, 
+                                  region: Optional[Dict[str, int]]=None
+                                 ) -> np.ndarray:
+        color_channel_slice = self._get_color_channel_slice(reader_configs = reader_configs)
+        plane_idx_slice = self._get_plane_idx_slice(reader_configs = reader_configs)
+        if region == None:
+            row_slice, col_slice = slice(None), slice(None)
+        else:
+            row_slice = slice(region['lower_row_cropping_idx'], region['upper_row_cropping_idx'])
+            col_slice = slice(region['lower_col_cropping_idx'], region['upper_col_cropping_idx'])
+        with tifffile.TiffFile(filepath) as tif:
+            series = tif.series[0]
+            layout = self._get_layout(series = series)
+            if series.dataoffset != None: # uncompressed & contiguous
+                memory_mapped_image = self._memory_map_series(filepath = filepath, layout = layout)
+                return memory_mapped_image[plane_idx_slice, row_slice, col_slice, color_channel_slice]
+            n_planes, n_rows, n_cols, n_channels = layout['shape']
+            plane_idxs, row_idxs = range(n_planes)[plane_idx_slice], range(n_rows)[row_slice]
+            col_idxs, channel_idxs = range(n_cols)[col_slice], range(n_channels)[color_channel_slice]
+            read_image_using_configs = np.zeros((len(plane_idxs), len(row_idxs), len(col_idxs), len(channel_idxs)), dtype = series.dtype)
+            for plane_position, plane_idx in enumerate(plane_idxs):
+                decoded_pages = {}
+                for channel_position, channel_idx in enumerate(channel_idxs):
+                    page_idx, channel_idx_in_page = self._get_page_idx(layout = layout, plane_idx = plane_idx, channel_idx = channel_idx)
+                    if page_idx not in decoded_pages.keys():
+                        decoded_pages[page_idx] = self._decode_page_region(tif = tif, page = series.pages[page_idx], row_idxs = row_idxs, col_idxs = col_idxs)
+                    read_image_using_configs[plane_position, :, :, channel_position] = decoded_pages[page_idx][:, :, channel_idx_in_page]
+        return read_image_using_configs
+    
+    
+    def _get_layout(self, series: tifffile.TiffPageSeries) -> Dict[str, Any]:
+        axes, shape = series.axes, series.shape
+        channel_axes = [axis_id for axis_id in axes if axis_id in ['C', 'S']]
+        if len(channel_axes) > 1:
+            raise NotImplementedError('Images with both, a "C" and a "S" axis (e.g. multiple RGB channels), are not supported yet! '
+                                      f'The axes of the image are: "{axes}".')
+        channel_axis = channel_axes[0] if len(channel_axes) == 1 else None
+        plane_axes = [axis_id for axis_id in axes if axis_id not in ['Y', 'X', channel_axis]]
+        page_axes = series.keyframe.axes
+        if axes.endswith(page_axes) == False:
+            raise NotImplementedError(f'The layout of this TIFF file (axes: "{axes}", axes of each page: "{page_axes}") is not supported yet!')
+        page_level_axes = axes[:len(axes) - len(page_axes)]
+        layout = {'axes': axes,
+                  'plane_axes': plane_axes,
+                  'plane_axes_shape': [shape[axes.index(axis_id)] for axis_id in plane_axes],
+                  'channel_axis': channel_axis,
+                  'page_level_axes': page_level_axes,
+                  'page_level_shape': [shape[axes.index(axis_id)] for axis_id in page_level_axes],
+                  'shape': (int(np.prod([shape[axes.index(axis_id)] for axis_id in plane_axes])),
+                            shape[axes.index('Y')],
+                            shape[axes.index('X')],
+                            shape[axes.index(channel_axis)] if channel_axis != None else 1)}
+        return layout
+    
+    
+    def _memory_map_series(self, filepath: Union[PosixPath, WindowsPath], layout: Dict[str, Any]) -> np.ndarray:
+        memory_map = tifffile.memmap(filepath, series = 0, mode = 'r')
+        ordered_axes = layout['plane_axes'] + ['Y', 'X'] + ([layout['channel_axis']] if layout['channel_axis'] != None else [])
+        memory_map = memory_map.transpose([layout['axes'].index(axis_id) for axis_id in ordered_axes])
+        # strip the np.memmap subclass (no copy), since MicroscopyImageReaders have to return numpy arrays:
+        return np.asarray(memory_map).reshape(layout['shape'])
+    
+    
+    def _get_page_idx(self, layout: Dict[str, Any], plane_idx: int, channel_idx: int) -> Tuple[int, int]:
+        idx_per_axis = {}
+        if len(layout['plane_axes']) > 0:
+            idx_per_axis = dict(zip(layout['plane_axes'], np.unravel_index(plane_idx, layout['plane_axes_shape'])))
+        if layout['channel_axis'] in layout['page_level_axes']: # e.g. each channel of an OME-TIFF stored in a separate page
+            idx_per_axis[layout['channel_axis']] = channel_idx
+            channel_idx_in_page = 0
+        else:
+            channel_idx_in_page = channel_idx
+        if len(layout['page_level_axes']) > 0:
+            page_idx = int(np.ravel_multi_index([idx_per_axis[axis_id] for axis_id in layout['page_level_axes']], layout['page_level_shape']))
+        else:
+            page_idx = 0
+        return page_idx, channel_idx_in_page
+    
+    
+    def _decode_page_region(self, tif: tifffile.TiffFile, page: tifffile.TiffPage, row_idxs: range, col_idxs: range) -> np.ndarray:
+        """
+        Decodes only the strips or tiles of the page that overlap with the rows & columns and 
+        returns them as numpy array with the structure: [rows, columns, color-channels].
+        """
+        keyframe = page.keyframe
+        n_separate_samples, depth, length, width, n_contiguous_samples = keyframe.shaped
+        if depth > 1:
+            raise NotImplementedError('TIFF files with volumetric tiles are not supported yet!')
+        if keyframe.is_tiled == True:
+            segment_length, segment_width = keyframe.tilelength, keyframe.tilewidth
+        else:
+            segment_length, segment_width = min(keyframe.rowsperstrip, length), width
+        n_segment_rows, n_segment_cols = math.ceil(length / segment_length), math.ceil(width / segment_width)
+        segment_row_idxs = range(row_idxs.start // segment_length, math.ceil(row_idxs.stop / segment_length)) if len(row_idxs) > 0 else range(0)
+        segment_col_idxs = range(col_idxs.start // segment_width, math.ceil(col_idxs.stop / segment_width)) if len(col_idxs) > 0 else range(0)
+        segment_idxs = [sample_idx * n_segment_rows * n_segment_cols + segment_row_idx * n_segment_cols + segment_col_idx
+                        for sample_idx in range(n_separate_samples) for segment_row_idx in segment_row_idxs for segment_col_idx in segment_col_idxs]
+        decode_kwargs = {}
+        if keyframe.compression in [6, 7, 33007, 34892]: # JPEG
+            decode_kwargs = {'jpegtables': keyframe.jpegtables, 'jpegheader': keyframe.jpegheader}
+        region_data = np.zeros((n_separate_samples, len(row_idxs), len(col_idxs), n_contiguous_samples), dtype = keyframe.dtype)
+        for encoded_segment, segment_idx in tif.filehandle.read_segments([page.dataoffsets[idx] for idx in segment_idxs],
+                                                                         [page.databytecounts[idx] for idx in segment_idxs],
+                                                                         segment_idxs):
+            segment, (sample_idx, _, lower_row_idx, lower_col_idx, _), _ = keyframe.decode(encoded_segment, segment_idx, **decode_kwargs)
+            if segment is None: # empty segment
+                continue
+            segment = segment.reshape((-1, ) + segment.shape[-3:])[0]
+            lower_row, upper_row = max(lower_row_idx, row_idxs.start), min(lower_row_idx + segment.shape[0], row_idxs.stop)
+            lower_col, upper_col = max(lower_col_idx, col_idxs.start), min(lower_col_idx + segment.shape[1], col_idxs.stop)
+            if (lower_row >= upper_row) | (lower_col >= upper_col):
+                continue
+            region_data[sample_idx, 
+                        lower_row - row_idxs.start : upper_row - row_idxs.start, 
+                        lower_col - col_idxs.start : upper_col - col_idxs.start] = segment[lower_row - lower_row_idx : upper_row - lower_row_idx,
+                                                                                           lower_col - lower_col_idx : upper_col - lower_col_idx]
+        return region_data.transpose(1, 2, 0, 3).reshape(len(row_idxs), len(col_idxs), n_separate_samples * n_contiguous_samples)
+
+# %% ../../nbs/api/04_readers_01_microscopy_images.ipynb 9
 class FromExcelReader(MicroscopyImageReaders):
     
     """
@@ -171,6 +488,19 @@ class FromExcelReader(MicroscopyImageReaders):
              filepath: Union[PosixPath, WindowsPath], # filepath to the excel sheet that contains the filepaths to the corresponding image files
              reader_configs: Dict # a dictionary based on the DefaultConfigs specified in the MicroscopyReaderSpecs
             ) -> np.ndarray: # numpy array with the structure: [imaging-planes, rows, columns, imaging-channel]
+        return self._read_all_planes(filepath = filepath, reader_configs = reader_configs)
+    
+    
+    def read_region(self, filepath: Union[PosixPath, WindowsPath], reader_configs: Dict, region: Dict[str, int]) -> np.ndarray:
+        # passes the region on to the readers of the individual plane images:
+        return self._read_all_planes(filepath = filepath, reader_configs = reader_configs, region = region)
+    
+    
+    def _read_all_planes(self, 
+                         filepath: Union[PosixPath, WindowsPath], 
+                         reader_configs: Dict, 
+                         region: Optional[Dict[str, int]]=None
+                        ) -> np.ndarray:
 
         import findmycells.readers as readers
         
@@ -184,7 +514,8 @@ class FromExcelReader(MicroscopyImageReaders):
                                                                data_reader_module = readers.microscopy_images)
             loaded_image = image_loader.load(data_reader_class = image_reader_class,
                                              filepath = single_plane_image_filepath,
-                                             reader_configs = reader_configs)
+                                             reader_configs = reader_configs,
+                                             region = region)
             single_plane_images.append(loaded_image)
         read_image_using_configs = np.stack(single_plane_images)
         return read_image_using_configs
@@ -1,12 +1,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/api/06_segmentation_00_specs.ipynb.
 
 # %% auto 0
-__all__ = ['SegmentationStrategy', 'SegmentationObject']
+__all__ = ['SegmentationStrategy', 'SegmentationObject', 'SoftmaxStream']
 
 # %% ../../nbs/api/06_segmentation_00_specs.ipynb 2
 from abc import abstractmethod
-from typing import Dict
+from typing import Dict, List, Tuple, Callable, Iterator
 import shutil
+import queue
+import threading
+
+import numpy as np
 
 
 from ..core import ProcessingObject, ProcessingStrategy
@@ -29,6 +33,22 @@ class SegmentationStrategy(ProcessingStrategy):
     def segmentation_type(self):
         # Either "instance" or "semantic"
         pass
+    
+    
+    def streams_results(self, strategy_configs: Dict) -> bool:
+        """
+        Semantic segmentation strategies that stream their results directly to the subsequent instance 
+        segmentation strategy (see `SoftmaxStream`), instead of completing them first, return True here.
+        """
+        return False
+    
+    
+    def can_consume_streamed_results(self, strategy_configs: Dict) -> bool:
+        """
+        Instance segmentation strategies that can consume the streamed results of a preceding semantic
+        segmentation strategy (see `streams_results()`) with the given configs return True here.
+        """
+        return False
 
 # %% ../../nbs/api/06_segmentation_00_specs.ipynb 5
 class SegmentationObject(ProcessingObject):
@@ -50,6 +70,8 @@ class SegmentationObject(ProcessingObject):
                         'clear_tmp_data': 'Checkbox',
                         'overwrite': 'Checkbox',
                         'autosave': 'Checkbox',
+                        'autosave_every_n_files': 'BoundedIntText',
+                        'autosave_every_n_seconds': 'BoundedIntText',
                         'show_progress': 'Checkbox'}
         return widget_names
 
@@ -61,7 +83,9 @@ class SegmentationObject(ProcessingObject):
                         'clear_tmp_data': ('delete temp. files as soon as possible (recommended '
                                            'for low memory)'),
                         'overwrite': 'overwrite previously processed files',
-                        'autosave': 'autosave progress after each file',
+                        'autosave': 'autosave progress (incremental checkpoints)',
+                        'autosave_every_n_files': 'autosave after every n files',
+                        'autosave_every_n_seconds': 'autosave at the latest after n seconds (0 = off)',
                         'show_progress': 'show progress bar and estimated computation time'}
         return descriptions
     
@@ -76,14 +100,20 @@ class SegmentationObject(ProcessingObject):
                           'clear_tmp_data': True,
                           'overwrite': False,
                           'autosave': True,
+                          'autosave_every_n_files': 1,
+                          'autosave_every_n_seconds': 0,
                           'show_progress': True}
         valid_types = {'batch_size': [int],
                        'run_strategies_individually': [bool],
                        'clear_tmp_data': [bool],
                        'overwrite': [bool],
                        'autosave': [bool],
+                       'autosave_every_n_files': [int],
+                       'autosave_every_n_seconds': [int],
                        'show_progress': [bool]}
-        valid_value_ranges = {'batch_size': (0, 25, 1)}
+        valid_value_ranges = {'autosave_every_n_files': (1, 10000, 1),
+                              'autosave_every_n_seconds': (0, 86400, 1),
+                              'batch_size': (0, 25, 1)}
         default_configs = DefaultConfigs(default_values = default_values,
                                          valid_types = valid_types,
                                          valid_value_ranges = valid_value_ranges)
@@ -91,7 +121,39 @@ class SegmentationObject(ProcessingObject):
     
     
     def _processing_specific_preparations(self) -> None:
-        pass    
+        # can be set by a semantic segmentation strategy to pass its results directly to a subsequent instance segmentation strategy:
+        self.softmax_stream = None
+    
+    
+    def run_all_strategies(self, strategies: List, strategy_configs: List[Dict]) -> None:
+        """
+        Extends the base method, such that a strategy that streams its results (see `SoftmaxStream`) is only 
+        tracked in the file histories once all of its results were consumed by the subsequent strategy.
+        """
+        streaming_strategy, streaming_strategy_configs = None, None
+        try:
+            for strategy, configs in zip(strategies, strategy_configs):
+                stream_already_started = self.softmax_stream != None
+                processing_strategy = strategy()
+                self = processing_strategy.run(processing_object = self, strategy_configs = configs)
+                if (stream_already_started == False) & (self.softmax_stream != None):
+                    streaming_strategy, streaming_strategy_configs = processing_strategy, configs
+                    continue
+                if streaming_strategy != None:
+                    if self.softmax_stream.fully_consumed == True:
+                        self = streaming_strategy.update_tracking_histories(processing_object = self, strategy_configs = streaming_strategy_configs)
+                        streaming_strategy, streaming_strategy_configs = None, None
+                self = processing_strategy.update_tracking_histories(processing_object = self, strategy_configs = configs)
+                del processing_strategy
+        finally:
+            if self.softmax_stream != None:
+                self.softmax_stream.close()
+        if self.softmax_stream != None:
+            not_consumed_message = ('The semantic segmentation results were streamed, but no subsequent instance segmentation strategy '
+                                    'consumed them. Please run an instance segmentation strategy right after the semantic segmentation '
+                                    '(i.e. uncheck "run_strategies_individually"), or disable streaming.')
+            assert self.softmax_stream.fully_consumed == True, not_consumed_message
+            self.softmax_stream = None
 
 
     def _add_processing_specific_infos_to_updates(self, updates: Dict) -> Dict:
@@ -103,3 +165,75 @@ class SegmentationObject(ProcessingObject):
         for tmp_subdir_path in seg_tool_dir_path.iterdir():
             if tmp_subdir_path.is_dir() and tmp_subdir_path.name != 'trained_models':
                 shutil.rmtree(tmp_subdir_path)
+
+# %% ../../nbs/api/06_segmentation_00_specs.ipynb 6
+class SoftmaxStream:
+
+    """
+    Thread-safe, bounded handoff of the softmax predictions of individual image planes from a semantic 
+    segmentation strategy, which produces them in a background thread, to a subsequent instance segmentation 
+    strategy, which consumes them by iterating over the stream. Both strategies thus run concurrently, while
+    the producer is blocked as soon as "max_buffered_planes" planes are waiting to be consumed.
+    """
+    
+    def __init__(self, max_buffered_planes: int) -> None:
+        self._queue = queue.Queue(maxsize = max_buffered_planes)
+        self._end_of_stream = object()
+        self._cancelled = threading.Event()
+        self._producer_thread = None
+        self._producer_exception = None
+        self.fully_consumed = False
+        
+        
+    def start_producer(self, target: Callable, kwargs: Dict) -> None:
+        self._producer_thread = threading.Thread(target = self._run_producer, kwargs = {'target': target, 'kwargs': kwargs}, daemon = True)
+        self._producer_thread.start()
+        
+        
+    def _run_producer(self, target: Callable, kwargs: Dict) -> None:
+        try:
+            target(**kwargs)
+        except BaseException as e:
+            self._producer_exception = e
+        finally:
+            self._put(item = self._end_of_stream)
+            
+            
+    def put(self, image_filename: str, df2_softmax: np.ndarray) -> None:
+        """
+        Called by the producer. Blocks while the buffer is full.
+        """
+        self._put(item = (image_filename, df2_softmax))
+        
+        
+    def _put(self, item) -> None:
+        while self._cancelled.is_set() == False:
+            try:
+                self._queue.put(item, timeout = 0.5)
+                return
+            except queue.Full:
+                continue
+        if item is not self._end_of_stream:
+            raise InterruptedError('The softmax stream was closed before all image planes were consumed.')
+            
+            
+    def __iter__(self) -> Iterator[Tuple[str, np.ndarray]]:
+        while True:
+            item = self._queue.get()
+            if item is self._end_of_stream:
+                break
+            yield item
+        self._producer_thread.join()
+        self.fully_consumed = True
+        if self._producer_exception != None:
+            raise self._producer_exception
+            
+            
+    def close(self) -> None:
+        """
+        Stops the producer, if the stream was not consumed entirely, and waits until it finished.
+        """
+        if self.fully_consumed == False:
+            self._cancelled.set()
+        if self._producer_thread != None:
+            self._producer_thread.join()
@@ -4,19 +4,23 @@
 __all__ = ['Deepflash2SemanticSegmentationStrat', 'LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat']
 
 # %% ../../nbs/api/06_segmentation_01_strategies.ipynb 2
-from typing import Tuple, List, Dict, Union
+from typing import Tuple, List, Dict, Union, Optional, Iterator
 from pathlib import Path, PosixPath, WindowsPath
 
 import numpy as np
 import shutil
 import tempfile
+import hashlib
 import zarr
+from concurrent.futures import ThreadPoolExecutor
 import os
 from skimage import measure, segmentation, io
+from scipy import ndimage
 
-from .specs import SegmentationObject, SegmentationStrategy
+from .specs import SegmentationObject, SegmentationStrategy, SoftmaxStream
 from ..database import Database
 from ..configs import DefaultConfigs
+from ..storage import get_stack_storage
 from .. import utils
 
 # %% ../../nbs/api/06_segmentation_01_strategies.ipynb 4
@@ -29,6 +33,10 @@ class Deepflash2SemanticSegmentationStrat(SegmentationStrategy):
     project in smaller batches (which is highly recommended, due to a huge memory
     load), make sure to run the segmentations "strategy-wise" in the processing 
     configs below before launching the processing (i.e. keep the box checked).
+    Alternatively, you can stream the softmax predictions of each image plane 
+    directly to a subsequent instance segmentation strategy. Both strategies will
+    then run concurrently, which requires to uncheck "run strategies individually"
+    (and, for cellpose, to specify the diameter).
     """
     
     @property
@@ -43,39 +51,68 @@ class Deepflash2SemanticSegmentationStrat(SegmentationStrategy):
     def default_configs(self):
         default_values = {'path_to_models': Path(os.getcwd()),
                           'compute_stats': False,
-                          'clear_zarrs_in_sys_temp_dir': True}
+                          'stats_max_planes': 0,
+                          'clear_zarrs_in_sys_temp_dir': True,
+                          'stream_to_instance_segmentation': False,
+                          'stream_buffer_size': 4}
         valid_types = {'path_to_models': [PosixPath, str, WindowsPath],
                        'compute_stats': [bool],
-                       'clear_zarrs_in_sys_temp_dir': [bool]}
-        valid_options = {'path_to_models': ('')}
-        default_configs = DefaultConfigs(default_values = default_values, valid_types = valid_types)
+                       'stats_max_planes': [int],
+                       'clear_zarrs_in_sys_temp_dir': [bool],
+                       'stream_to_instance_segmentation': [bool],
+                       'stream_buffer_size': [int]}
+        valid_ranges = {'stats_max_planes': (0, 1_000_000, 1),
+                        'stream_buffer_size': (1, 256, 1)}
+        default_configs = DefaultConfigs(default_values = default_values, 
+                                         valid_types = valid_types,
+                                         valid_value_ranges = valid_ranges)
         return default_configs
         
     @property
     def widget_names(self):
         return {'path_to_models': 'FileChooser',
                 'compute_stats': 'Checkbox',
-                'clear_zarrs_in_sys_temp_dir': 'Checkbox'}
+                'stats_max_planes': 'BoundedIntText',
+                'clear_zarrs_in_sys_temp_dir': 'Checkbox',
+                'stream_to_instance_segmentation': 'Checkbox',
+                'stream_buffer_size': 'BoundedIntText'}
 
     @property
     def descriptions(self):
         return {'path_to_models': 'Please select the directory that contains your trained models:',
-                'compute_stats': '(Re-)compute inference stats (check only if you changed models)',
-                'clear_zarrs_in_sys_temp_dir': 'Attempt deleting temp. files from systems temp. dir as soon as possible'}
+                'compute_stats': 'Force re-computing the inference stats (done automatically if preprocessed images changed)',
+                'stats_max_planes': 'Max. number of randomly sampled image planes to compute the stats from (0 = all)',
+                'clear_zarrs_in_sys_temp_dir': 'Attempt deleting temp. files from systems temp. dir as soon as possible',
+                'stream_to_instance_segmentation': 'Stream results directly to the subsequent instance segmentation (runs both concurrently)',
+                'stream_buffer_size': ('Max. number of streamed image planes that wait for the instance segmentation (also the min. number '
+                                       'of planes per deepflash2 call - note: each call loads all models of the ensemble again)')}
     
     @property
     def tooltips(self):
         return {}
     
     
+    def streams_results(self, strategy_configs: Dict) -> bool:
+        return strategy_configs['stream_to_instance_segmentation']
+    
+    
     def run(self, processing_object: SegmentationObject, strategy_configs: Dict) -> SegmentationObject:
         processing_object.database = self._add_deepflash2_as_segmentation_tool(database = processing_object.database,
                                                                                strategy_configs = strategy_configs)
         self._copy_all_files_of_current_batch_to_temp_dir(database = processing_object.database, file_ids_in_batch = processing_object.file_ids)
-        self._run_semantic_segmentations(database = processing_object.database)
-        self._move_files(database = processing_object.database)
-        if strategy_configs['clear_zarrs_in_sys_temp_dir'] == True:
-            self._delete_temp_files_in_sys_tmp_dir(database = processing_object.database)
+        if strategy_configs['stream_to_instance_segmentation'] == True:
+            # the subsequent instance segmentation strategy consumes the stream, while the semantic segmentations are still running:
+            processing_object.softmax_stream = SoftmaxStream(max_buffered_planes = strategy_configs['stream_buffer_size'])
+            processing_object.softmax_stream.start_producer(target = self._run_streamed_semantic_segmentations,
+                                                            kwargs = {'database': processing_object.database,
+                                                                      'softmax_stream': processing_object.softmax_stream,
+                                                                      'min_planes_per_call': strategy_configs['stream_buffer_size'],
+                                                                      'clear_zarrs_in_sys_temp_dir': strategy_configs['clear_zarrs_in_sys_temp_dir']})
+        else:
+            self._run_semantic_segmentations(database = processing_object.database)
+            self._move_files(database = processing_object.database)
+            if strategy_configs['clear_zarrs_in_sys_temp_dir'] == True:
+                self._delete_temp_files_in_sys_tmp_dir(database = processing_object.database)
         return processing_object
 
 
@@ -92,39 +129,109 @@ class Deepflash2SemanticSegmentationStrat(SegmentationStrategy):
         database.segmentation_tool_configs['df2']['ensemble_path'] = path_to_models
         n_models_found = len([elem for elem in utils.list_dir_no_hidden(path_to_models) if elem.name.endswith('.pth')])
         database.segmentation_tool_configs['df2']['n_models'] = n_models_found
+        stats_fingerprint = self._get_stats_fingerprint(database = database, max_planes = strategy_configs['stats_max_planes'])
         if 'stats' not in database.segmentation_tool_configs['df2'].keys():
-            database.segmentation_tool_configs['df2']['stats'] = self._compute_stats(database = database)
-        elif strategy_configs['compute_stats'] == True:
-            database.segmentation_tool_configs['df2']['stats'] = self._compute_stats(database = database)
+            compute_stats = True
+        elif 'stats_fingerprint' not in database.segmentation_tool_configs['df2'].keys():
+            # stats were computed with an earlier version - keep them, unless re-computing is requested:
+            compute_stats = strategy_configs['compute_stats']
+        else:
+            compute_stats = ((strategy_configs['compute_stats'] == True) | 
+                             (database.segmentation_tool_configs['df2']['stats_fingerprint'] != stats_fingerprint))
+        if compute_stats == True:
+            database.segmentation_tool_configs['df2']['stats'] = self._compute_stats(database = database, max_planes = strategy_configs['stats_max_planes'])
+        database.segmentation_tool_configs['df2']['stats_fingerprint'] = stats_fingerprint
         return database
 
 
     def _copy_all_files_of_current_batch_to_temp_dir(self, database: Database, file_ids_in_batch: List[str]) -> None:
+        """
+        deepflash2 requires a directory with the images of the current batch as individual files. 
+        Already existing PNG files are therefore only linked into this directory (and just copied,
+        if the file system does not support links), such that deleting the directory afterwards 
+        does not affect the preprocessed images.
+        """
         root_dir_path = database.project_configs.root_dir
         segmentation_tool_dir = root_dir_path.joinpath(database.segmentation_tool_dir)
         temp_copies_path = segmentation_tool_dir.joinpath('copies_of_preprocessed_images')
+        preprocessed_images_dir = root_dir_path.joinpath(database.preprocessed_images_dir)
+        stack_storage = get_stack_storage(project_configs = database.project_configs)
         for file_id in file_ids_in_batch:
-            preprocessed_images_dir = root_dir_path.joinpath(database.preprocessed_images_dir)
-            files_to_segment = [filepath for filepath in utils.list_dir_no_hidden(preprocessed_images_dir) if filepath.name.startswith(file_id)]
-            if len(files_to_segment) > 0:
+            if stack_storage.has_stack(dir_path = preprocessed_images_dir, file_id = file_id) == True:
                 if temp_copies_path.is_dir() == False:
                     temp_copies_path.mkdir()
-                for filepath_source in files_to_segment:
-                    shutil.copy(filepath_source, temp_copies_path)
+                stack_storage.export_stack_as_png_files(dir_path = preprocessed_images_dir, 
+                                                        file_id = file_id, 
+                                                        target_dir_path = temp_copies_path,
+                                                        link_files = True)
                     
                     
-    def _compute_stats(self, database: Database) -> Tuple:
-        from deepflash2.learner import EnsembleLearner
+    def _get_file_ids_with_preprocessed_images(self, database: Database) -> List[str]:
         preprocessed_images_dir_path = database.project_configs.root_dir.joinpath(database.preprocessed_images_dir)
-        expected_file_count = sum(filter(None, database.file_infos["total_planes"]))
-        actual_file_count = len([filepath for filepath in utils.list_dir_no_hidden(preprocessed_images_dir_path) if filepath.name.endswith('.png')])
-        if actual_file_count != expected_file_count:
-            raise ValueError('Actual and expected counts of preprocessed images don´t match.')
-        ensemble_learner = EnsembleLearner(image_dir = preprocessed_images_dir_path, 
-                                           ensemble_path = database.segmentation_tool_configs['df2']['ensemble_path'])
-        stats = ensemble_learner.stats
-        del ensemble_learner
-        return stats
+        stack_storage = get_stack_storage(project_configs = database.project_configs)
+        return [file_id for file_id in database.file_infos['file_id'] if stack_storage.has_stack(dir_path = preprocessed_images_dir_path, file_id = file_id) == True]
+
+
+    def _get_stats_fingerprint(self, database: Database, max_planes: int) -> str:
+        """
+        Combines the fingerprints of all preprocessed image stacks (see `StackStorage.get_fingerprint()`), 
+        such that the stats only need to be re-computed if the set of preprocessed images changes.
+        """
+        preprocessed_images_dir_path = database.project_configs.root_dir.joinpath(database.preprocessed_images_dir)
+        stack_storage = get_stack_storage(project_configs = database.project_configs)
+        hash_object = hashlib.md5(f'max_planes:{max_planes};'.encode())
+        for file_id in self._get_file_ids_with_preprocessed_images(database = database):
+            stack_fingerprint = stack_storage.get_fingerprint(dir_path = preprocessed_images_dir_path, file_id = file_id)
+            hash_object.update(f'{file_id}:{stack_fingerprint};'.encode())
+        return hash_object.hexdigest()
+
+
+    def _compute_stats(self, database: Database, max_planes: int=0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the stats like deepflash2 does (i.e. the channel-wise mean of the mean and the
+        square root of the mean of the variance of all image planes, scaled to [0, 1]). However, 
+        only one stack is loaded at a time, each plane is only read once, and - if "max_planes" 
+        is > 0 - only a random subsample of the planes is used.
+        """
+        preprocessed_images_dir_path = database.project_configs.root_dir.joinpath(database.preprocessed_images_dir)
+        stack_storage = get_stack_storage(project_configs = database.project_configs)
+        file_ids = self._get_file_ids_with_preprocessed_images(database = database)
+        if len(file_ids) == 0:
+            raise ValueError('The stats for deepflash2 could not be computed, as there were no preprocessed images found.')
+        all_planes = [(file_id, plane_index) for file_id in file_ids 
+                      for plane_index in range(stack_storage.get_plane_count(dir_path = preprocessed_images_dir_path, file_id = file_id))]
+        if (max_planes > 0) & (max_planes < len(all_planes)):
+            rng = np.random.default_rng(seed = 42)
+            all_planes = [all_planes[idx] for idx in sorted(rng.choice(len(all_planes), size = max_planes, replace = False))]
+        plane_indices_per_file_id = {}
+        for file_id, plane_index in all_planes:
+            plane_indices_per_file_id.setdefault(file_id, []).append(plane_index)
+        sum_of_means, sum_of_variances = 0., 0.
+        for file_id, plane_indices in plane_indices_per_file_id.items():
+            zstack = stack_storage.load_stack(dir_path = preprocessed_images_dir_path, file_id = file_id)
+            for plane_index in plane_indices:
+                mean, variance = self._compute_mean_and_variance_of_plane(image_plane = zstack[plane_index])
+                sum_of_means += mean
+                sum_of_variances += variance
+            del zstack
+        return sum_of_means / len(all_planes), np.sqrt(sum_of_variances / len(all_planes))
+
+
+    def _compute_mean_and_variance_of_plane(self, image_plane: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if image_plane.ndim == 2:
+            image_plane = image_plane[..., np.newaxis]
+        # deepflash2 scales integer images to [0, 1] by the max value of their dtype:
+        if np.issubdtype(image_plane.dtype, np.integer):
+            scaling_factor = np.iinfo(image_plane.dtype).max
+        else:
+            scaling_factor = 1.
+        n_pixels = image_plane.shape[0] * image_plane.shape[1]
+        # single pass over the pixels:
+        pixel_sums = image_plane.sum(axis = (0, 1), dtype = 'float64')
+        squared_pixel_sums = np.einsum('ijk,ijk->k', image_plane, image_plane, dtype = 'float64')
+        mean = pixel_sums / n_pixels
+        variance = np.maximum(squared_pixel_sums / n_pixels - mean**2, 0)
+        return mean / scaling_factor, variance / scaling_factor**2
 
 
     def _run_semantic_segmentations(self, database: Database) -> None:
@@ -142,16 +249,81 @@ class Deepflash2SemanticSegmentationStrat(SegmentationStrategy):
         del ensemble_learner
 
 
+    def _run_streamed_semantic_segmentations(self, 
+                                             database: Database, 
+                                             softmax_stream: SoftmaxStream, 
+                                             clear_zarrs_in_sys_temp_dir: bool,
+                                             min_planes_per_call: int=1
+                                            ) -> None:
+        """
+        Runs the ensemble on groups of files (with at least "min_planes_per_call" image planes, since 
+        each call of deepflash2 loads all models of the ensemble again) and hands the softmax of each 
+        image plane over to the stream as soon as it is available. deepflash2 returns its results 
+        exclusively via a zarr store, which is therefore only used as scratch space, from which each 
+        plane is read exactly once. Runs in the producer thread of the stream.
+        """
+        from deepflash2.learner import EnsembleLearner
+        segmentation_tool_dir_path = database.project_configs.root_dir.joinpath(database.segmentation_tool_dir)
+        segmentation_tool_temp_dir_path = segmentation_tool_dir_path.joinpath(database.segmentation_tool_temp_dir)
+        image_dir = segmentation_tool_dir_path.joinpath('copies_of_preprocessed_images')
+        ensemble_learner = EnsembleLearner(image_dir = image_dir,
+                                           ensemble_path = database.segmentation_tool_configs['df2']['ensemble_path'],
+                                           stats = database.segmentation_tool_configs['df2']['stats'])
+        image_filepaths_per_file_id = {}
+        for image_filepath in ensemble_learner.files:
+            image_filepaths_per_file_id.setdefault(Path(image_filepath).name[:4], []).append(image_filepath)
+        for image_filepaths in image_filepaths_per_file_id.values():
+            image_filepaths.sort(key = lambda image_filepath: Path(image_filepath).name)
+        for file_ids_in_group in self._group_file_ids_by_plane_count(image_filepaths_per_file_id = image_filepaths_per_file_id, 
+                                                                     min_planes_per_group = min_planes_per_call):
+            ensemble_learner.get_ensemble_results([image_filepath for file_id in file_ids_in_group for image_filepath in image_filepaths_per_file_id[file_id]],
+                                                  zarr_store = segmentation_tool_temp_dir_path,
+                                                  export_dir = segmentation_tool_dir_path,
+                                                  use_tta = True)
+            zarr_group = zarr.open(segmentation_tool_temp_dir_path, mode='r')
+            for file_id in file_ids_in_group:
+                for image_filepath in image_filepaths_per_file_id[file_id]:
+                    image_filename = Path(image_filepath).name
+                    softmax_stream.put(image_filename = image_filename, df2_softmax = zarr_group[f'/smx/{image_filename}'][..., 1])
+                self._import_semantic_masks(database = database, file_ids = [file_id])
+        del ensemble_learner
+        shutil.rmtree(image_dir)
+        if clear_zarrs_in_sys_temp_dir == True:
+            self._delete_temp_files_in_sys_tmp_dir(database = database)
+
+
+    def _group_file_ids_by_plane_count(self, image_filepaths_per_file_id: Dict[str, List], min_planes_per_group: int) -> List[List[str]]:
+        # files are never split across groups, such that their semantic masks can be imported right after their group is done:
+        groups, current_group, planes_in_current_group = [], [], 0
+        for file_id in sorted(image_filepaths_per_file_id.keys()):
+            current_group.append(file_id)
+            planes_in_current_group += len(image_filepaths_per_file_id[file_id])
+            if planes_in_current_group >= min_planes_per_group:
+                groups.append(current_group)
+                current_group, planes_in_current_group = [], 0
+        if len(current_group) > 0:
+            groups.append(current_group)
+        return groups
+
+
     def _move_files(self, database: Database) -> None:
+        self._import_semantic_masks(database = database)
+        segmentation_tool_dir_path = database.project_configs.root_dir.joinpath(database.segmentation_tool_dir)
+        shutil.rmtree(segmentation_tool_dir_path.joinpath('copies_of_preprocessed_images'))
+
+
+    def _import_semantic_masks(self, database: Database, file_ids: Optional[List[str]]=None) -> None:
         semantic_segmentations_target_dir_path = database.project_configs.root_dir.joinpath(database.semantic_segmentations_dir)
         segmentation_tool_dir_path = database.project_configs.root_dir.joinpath(database.segmentation_tool_dir)      
         current_semantic_masks_dir_path = segmentation_tool_dir_path.joinpath('masks')
-        for mask_filepath in utils.list_dir_no_hidden(current_semantic_masks_dir_path):
-            target_filepath = semantic_segmentations_target_dir_path.joinpath(mask_filepath.name)
-            if target_filepath.is_file() == True:
-                target_filepath.delete()
-            shutil.move(mask_filepath, semantic_segmentations_target_dir_path)
-        shutil.rmtree(segmentation_tool_dir_path.joinpath('copies_of_preprocessed_images'))
+        stack_storage = get_stack_storage(project_configs = database.project_configs)
+        all_mask_filepaths = utils.list_dir_no_hidden(current_semantic_masks_dir_path)
+        if file_ids == None:
+            file_ids = sorted(set([mask_filepath.name[:4] for mask_filepath in all_mask_filepaths]))
+        for file_id in file_ids:
+            stack_storage.import_png_files(png_filepaths = [mask_filepath for mask_filepath in all_mask_filepaths if mask_filepath.name.startswith(file_id)],
+                                           dir_path = semantic_segmentations_target_dir_path,
+                                           file_id = file_id)
 
 
     def _delete_temp_files_in_sys_tmp_dir(self, database: Database) -> None:
@@ -179,11 +351,19 @@ class LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat(SegmentationStr
     def default_configs(self):
         default_values = {'net_avg': True,
                           'model_type': 'nuclei',
-                          'diameter': 0.0}
+                          'diameter': 0.0,
+                          'gpu': True,
+                          'batch_size': 1,
+                          'n_threads_diameter_estimation': 4}
         valid_types = {'net_avg': [bool],
                        'model_type': [str],
-                       'diameter': [float]}
-        valid_ranges = {'diameter': (0.0, 999_999.9, 0.1)}
+                       'diameter': [float],
+                       'gpu': [bool],
+                       'batch_size': [int],
+                       'n_threads_diameter_estimation': [int]}
+        valid_ranges = {'diameter': (0.0, 999_999.9, 0.1),
+                        'batch_size': (1, 256, 1),
+                        'n_threads_diameter_estimation': (1, 128, 1)}
         valid_options = {'model_type': ('nuclei', 'cyto')}
         default_configs = DefaultConfigs(default_values = default_values,
                                          valid_types = valid_types,
@@ -195,20 +375,35 @@ class LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat(SegmentationStr
     def widget_names(self):
         return {'net_avg': 'Checkbox',
                 'model_type': 'Dropdown',
-                'diameter': 'BoundedFloatText'}
+                'diameter': 'BoundedFloatText',
+                'gpu': 'Checkbox',
+                'batch_size': 'BoundedIntText',
+                'n_threads_diameter_estimation': 'BoundedIntText'}
 
     @property
     def descriptions(self):
         return {'net_avg': 'Use average result of multiple attempts (recommended)',
                 'model_type': 'Select the cellpose model type to use',
-                'diameter': 'Diameter of a single feature [px] (select 0 to compute automatically)'}
+                'diameter': 'Diameter of a single feature [px] (select 0 to compute automatically)',
+                'gpu': 'Use the GPU (uncheck to run cellpose on the CPU only)',
+                'batch_size': 'Number of image planes that are passed to cellpose at once',
+                'n_threads_diameter_estimation': 'Number of threads used to compute the diameter (if set to 0)'}
     
     @property
     def tooltips(self):
         return {}
     
     
+    def can_consume_streamed_results(self, strategy_configs: Dict) -> bool:
+        # the diameter cannot be computed automatically while the semantic segmentations are still running:
+        return strategy_configs['diameter'] > 0
+    
+    
     def run(self, processing_object: SegmentationObject, strategy_configs: Dict) -> SegmentationObject:
+        if getattr(processing_object, 'softmax_stream', None) != None:
+            streaming_requires_diameter_message = ('The semantic segmentations are streamed and, thus, not completed yet. Therefore, '
+                                                   'the diameter cannot be computed automatically. Please specify it (i.e. diameter > 0).')
+            assert strategy_configs['diameter'] > 0, streaming_requires_diameter_message
         processing_object.database = self._add_cellpose_as_segmentation_tool(database = processing_object.database,
                                                                              strategy_configs = strategy_configs)        
         self._run_instance_segmentations(segmentation_object = processing_object)
@@ -241,28 +436,50 @@ class LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat(SegmentationStr
 
     
     def _add_cellpose_as_segmentation_tool(self, database: Database, strategy_configs: Dict) -> Database:
-        semantic_masks_dir = database.project_configs.root_dir.joinpath(database.semantic_segmentations_dir)
         if hasattr(database, 'segmentation_tool_configs') == False:
             database.segmentation_tool_configs = {'cp': {}}
         elif 'cp' not in database.segmentation_tool_configs.keys():
             database.segmentation_tool_configs['cp'] = {}
         database.segmentation_tool_configs['cp']['net_avg'] = strategy_configs['net_avg']
         database.segmentation_tool_configs['cp']['model_type'] = strategy_configs['model_type']
+        database.segmentation_tool_configs['cp']['gpu'] = strategy_configs['gpu']
+        database.segmentation_tool_configs['cp']['batch_size'] = strategy_configs['batch_size']
         if strategy_configs['diameter'] == 0:
             self._assert_all_semantic_segmentations_are_done(database = database)
-            database.segmentation_tool_configs['cp']['diameter'] = self._compute_cellpose_diameter(semantic_masks_dir = semantic_masks_dir)
+            database.segmentation_tool_configs['cp']['diameter'] = self._compute_cellpose_diameter(database = database,
+                                                                                                   n_threads = strategy_configs['n_threads_diameter_estimation'])
         else:
             database.segmentation_tool_configs['cp']['diameter'] = strategy_configs['diameter']
         return database
 
 
-    def _compute_cellpose_diameter(self, semantic_masks_dir: Union[PosixPath, WindowsPath]) -> float:
-        all_median_equivalent_diameters = []
-        for mask_filepath in semantic_masks_dir.iterdir():
-            if mask_filepath.name.endswith('.png'):
-                mask = io.imread(mask_filepath)
-                median_equivalent_diameter = self._calculate_median_equivalent_diameter_of_features_in_mask(segmentation_mask = mask)
-                all_median_equivalent_diameters.append(median_equivalent_diameter)
+    def _compute_cellpose_diameter(self, database: Database, n_threads: int=1) -> float:
+        """
+        The median equivalent diameters of all planes of a file are cached in the segmentation tool configs 
+        of the database, together with the fingerprint of its semantic segmentation masks. Only files with 
+        new or changed masks are therefore processed - distributed across a pool of "n_threads" threads.
+        """
+        semantic_masks_dir = database.project_configs.root_dir.joinpath(database.semantic_segmentations_dir)
+        stack_storage = get_stack_storage(project_configs = database.project_configs)
+        cached_diameters = database.segmentation_tool_configs['cp'].get('median_equivalent_diameters_per_file_id', {})
+        current_diameters = {}
+        file_ids_to_process = []
+        for file_id in database.file_infos['file_id']:
+            if stack_storage.has_stack(dir_path = semantic_masks_dir, file_id = file_id) == True:
+                masks_fingerprint = stack_storage.get_fingerprint(dir_path = semantic_masks_dir, file_id = file_id)
+                if cached_diameters.get(file_id, (None, []))[0] == masks_fingerprint:
+                    current_diameters[file_id] = cached_diameters[file_id]
+                else:
+                    file_ids_to_process.append((file_id, masks_fingerprint))
+        with ThreadPoolExecutor(max_workers = n_threads) as executor:
+            futures = [executor.submit(self._calculate_median_equivalent_diameters_of_all_planes, stack_storage, semantic_masks_dir, file_id) 
+                       for file_id, _ in file_ids_to_process]
+            for (file_id, masks_fingerprint), future in zip(file_ids_to_process, futures):
+                current_diameters[file_id] = (masks_fingerprint, future.result())
+        # files that were removed from the project (or whose masks were deleted) are dropped from the cache:
+        database.segmentation_tool_configs['cp']['median_equivalent_diameters_per_file_id'] = current_diameters
+        all_median_equivalent_diameters = [median_equivalent_diameter for file_id in database.file_infos['file_id'] if file_id in current_diameters.keys()
+                                           for median_equivalent_diameter in current_diameters[file_id][1]]
         if len(all_median_equivalent_diameters) > 0:
             cellpose_diameter = np.nanmedian(all_median_equivalent_diameters)
             if np.isnan(cellpose_diameter):
@@ -274,18 +491,18 @@ class LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat(SegmentationStr
         return cellpose_diameter
             
 
+    def _calculate_median_equivalent_diameters_of_all_planes(self, stack_storage, semantic_masks_dir: Path, file_id: str) -> List[float]:
+        return [self._calculate_median_equivalent_diameter_of_features_in_mask(segmentation_mask = mask) 
+                for mask in stack_storage.load_stack(dir_path = semantic_masks_dir, file_id = file_id)]
+
+
     def _calculate_median_equivalent_diameter_of_features_in_mask(self, segmentation_mask: np.ndarray) -> float:
-        labeled_mask = measure.label(segmentation_mask)
-        unique_label_ids, pixel_counts_per_label_id = np.unique(labeled_mask, return_counts=True)
-        unique_label_ids = list(unique_label_ids)
-        if 0 in unique_label_ids:
-            background_label_index = unique_label_ids.index(0)
-            pixel_counts_per_label_id = np.delete(pixel_counts_per_label_id, background_label_index)
-        if pixel_counts_per_label_id.shape[0] > 0:
-            equivalent_diameters = []
-            for area_in_pixels in pixel_counts_per_label_id:
-                equivalent_diameters.append(((area_in_pixels / np.pi)**0.5) * 2)
-            median_equivalent_diameter = np.median(equivalent_diameters)
+        labeled_mask, n_features = measure.label(segmentation_mask, return_num = True)
+        if n_features > 0:
+            # label ids are consecutive, hence every feature has a pixel count > 0 (index 0 = background):
+            pixel_counts_per_label_id = np.bincount(labeled_mask.ravel(), minlength = n_features + 1)[1:]
+            equivalent_diameters = np.sqrt(pixel_counts_per_label_id / np.pi) * 2
+            median_equivalent_diameter = float(np.median(equivalent_diameters))
         else:
             median_equivalent_diameter = np.nan
         return median_equivalent_diameter
@@ -293,95 +510,160 @@ class LosslessConversionOfDF2SemanticSegToInstanceSegWithCPStrat(SegmentationStr
 
     def _run_instance_segmentations(self, segmentation_object: SegmentationObject):
         database = segmentation_object.database
-        segmentation_tool_dir_path = database.project_configs.root_dir.joinpath(database.segmentation_tool_dir)
-        segmentation_tool_temp_dir_path = segmentation_tool_dir_path.joinpath(database.segmentation_tool_temp_dir)
-        print(segmentation_tool_temp_dir_path)
-        zarr_group = zarr.open(segmentation_tool_temp_dir_path, mode='r')
-        for image_filename in zarr_group['/smx'].__iter__():
-            file_id = image_filename[:4]
-            if file_id in segmentation_object.file_ids:
-                df2_softmax = zarr_group[f'/smx/{image_filename}'][..., 1]
-                df2_pred = np.zeros_like(df2_softmax)
-                df2_pred[np.where(df2_softmax >= 0.5)] = 1
-                # check if there was any feature predicted - if not, there is no need to run cellpose
-                if df2_pred.max() == 1:
-                    cp_mask = self._compute_cellpose_mask(df2_softmax = df2_softmax, 
-                                                         model_type = database.segmentation_tool_configs['cp']['model_type'],
-                                                         net_avg = database.segmentation_tool_configs['cp']['net_avg'],
-                                                         diameter = database.segmentation_tool_configs['cp']['diameter'])            
-                    instance_mask = self._lossless_conversion_of_df2_semantic_to_instance_seg_using_cp(df2_pred = df2_pred, cp_mask = cp_mask)
-                else: 
-                    instance_mask = df2_pred.copy()
-                instance_mask = instance_mask.astype('uint16')
-                filepath = database.project_configs.root_dir.joinpath(database.instance_segmentations_dir, image_filename)
-                io.imsave(filepath, instance_mask, check_contrast=False)
-
-
-    def _compute_cellpose_mask(self, df2_softmax: np.ndarray, model_type: str, net_avg: bool, diameter: int) -> np.ndarray:
-        from torch.cuda import empty_cache
-        from cellpose import models
-        empty_cache()
-        model = models.Cellpose(gpu = True, model_type = model_type)
-        cp_mask, _, _, _ = model.eval(df2_softmax, net_avg = net_avg, augment = True, normalize = False, diameter = diameter, channels = [0,0])
-        empty_cache()
-        return cp_mask
+        cp_configs = database.segmentation_tool_configs['cp']
+        instance_masks_per_file_id = {}
+        planes_to_segment = []
+        try:
+            for image_filename, df2_softmax in self._iterate_over_df2_softmaxes(segmentation_object = segmentation_object):
+                file_id = image_filename[:4]
+                if file_id in segmentation_object.file_ids:
+                    if file_id not in instance_masks_per_file_id.keys():
+                        instance_masks_per_file_id[file_id] = {}
+                    df2_pred = np.zeros_like(df2_softmax)
+                    df2_pred[np.where(df2_softmax >= 0.5)] = 1
+                    # check if there was any feature predicted - if not, there is no need to run cellpose
+                    if df2_pred.max() == 1:
+                        planes_to_segment.append((file_id, image_filename, df2_softmax, df2_pred))
+                        if len(planes_to_segment) >= cp_configs['batch_size']:
+                            self._segment_batch_of_planes(planes_to_segment = planes_to_segment, cp_configs = cp_configs, instance_masks_per_file_id = instance_masks_per_file_id)
+                            planes_to_segment = []
+                    else: 
+                        instance_masks_per_file_id[file_id][image_filename] = df2_pred.astype('uint16')
+            if len(planes_to_segment) > 0:
+                self._segment_batch_of_planes(planes_to_segment = planes_to_segment, cp_configs = cp_configs, instance_masks_per_file_id = instance_masks_per_file_id)
+        finally:
+            # also if cellpose or the conversion fails - otherwise the model (and its GPU memory) would be kept alive by the traceback
+            self._release_cellpose_model()
+        instance_segmentations_dir_path = database.project_configs.root_dir.joinpath(database.instance_segmentations_dir)
+        stack_storage = get_stack_storage(project_configs = database.project_configs)
+        for file_id, instance_masks_per_image_filename in instance_masks_per_file_id.items():
+            instance_masks = [instance_masks_per_image_filename[image_filename] for image_filename in sorted(instance_masks_per_image_filename.keys())]
+            stack_storage.save_stack(dir_path = instance_segmentations_dir_path, file_id = file_id, stack = np.asarray(instance_masks))
+
+
+    def _iterate_over_df2_softmaxes(self, segmentation_object: SegmentationObject) -> Iterator[Tuple[str, np.ndarray]]:
+        """
+        Yields the softmax predictions per image plane either directly from a running 
+        semantic segmentation (if it streams its results), or from its zarr store.
+        """
+        if getattr(segmentation_object, 'softmax_stream', None) != None:
+            yield from segmentation_object.softmax_stream
+        else:
+            database = segmentation_object.database
+            segmentation_tool_dir_path = database.project_configs.root_dir.joinpath(database.segmentation_tool_dir)
+            segmentation_tool_temp_dir_path = segmentation_tool_dir_path.joinpath(database.segmentation_tool_temp_dir)
+            zarr_group = zarr.open(segmentation_tool_temp_dir_path, mode='r')
+            for image_filename in zarr_group['/smx'].__iter__():
+                if image_filename[:4] in segmentation_object.file_ids:
+                    yield image_filename, zarr_group[f'/smx/{image_filename}'][..., 1]
+    
+    
+    def _segment_batch_of_planes(self, planes_to_segment: List[Tuple[str, str, np.ndarray, np.ndarray]], cp_configs: Dict, instance_masks_per_file_id: Dict) -> None:
+        cp_masks = self._compute_cellpose_masks(df2_softmaxes = [df2_softmax for _, _, df2_softmax, _ in planes_to_segment],
+                                                model_type = cp_configs['model_type'],
+                                                net_avg = cp_configs['net_avg'],
+                                                diameter = cp_configs['diameter'],
+                                                gpu = cp_configs['gpu'])
+        for (file_id, image_filename, _, df2_pred), cp_mask in zip(planes_to_segment, cp_masks):
+            instance_mask = self._lossless_conversion_of_df2_semantic_to_instance_seg_using_cp(df2_pred = df2_pred, cp_mask = cp_mask)
+            instance_masks_per_file_id[file_id][image_filename] = instance_mask.astype('uint16')
+    
+    
+    def _get_cellpose_model(self, model_type: str, gpu: bool):
+        """
+        The cellpose model is only loaded once and then kept in memory for all image planes 
+        that are processed during this run of the strategy.
+        """
+        if getattr(self, '_cellpose_model_specs', None) != (model_type, gpu):
+            from cellpose import models
+            self._release_cellpose_model()
+            self._cellpose_model = models.Cellpose(gpu = gpu, model_type = model_type)
+            self._cellpose_model_specs = (model_type, gpu)
+        return self._cellpose_model
+    
+    
+    def _release_cellpose_model(self) -> None:
+        if hasattr(self, '_cellpose_model'):
+            gpu = self._cellpose_model_specs[1]
+            del self._cellpose_model, self._cellpose_model_specs
+            if gpu == True:
+                from torch.cuda import empty_cache
+                empty_cache()
+
+
+    def _compute_cellpose_masks(self, df2_softmaxes: List[np.ndarray], model_type: str, net_avg: bool, diameter: int, gpu: bool) -> List[np.ndarray]:
+        model = self._get_cellpose_model(model_type = model_type, gpu = gpu)
+        if len(df2_softmaxes) == 1:
+            cp_mask, _, _, _ = model.eval(df2_softmaxes[0], net_avg = net_avg, augment = True, normalize = False, diameter = diameter, channels = [0,0])
+            cp_masks = [cp_mask]
+        else:
+            cp_masks, _, _, _ = model.eval(df2_softmaxes, net_avg = net_avg, augment = True, normalize = False, diameter = diameter, channels = [0,0])
+        return cp_masks
 
 
     def _lossless_conversion_of_df2_semantic_to_instance_seg_using_cp(self, df2_pred: np.ndarray, cp_mask: np.ndarray) -> np.ndarray:
+        """
+        Each connected feature of the deepflash2 prediction is converted individually, but only within its 
+        bounding box. The new instance label ids are taken from a running counter and are assigned in the 
+        order of the deepflash2 features and, within each feature, in the order of the cellpose label ids.
+        """
         lossless_converted_mask = np.zeros_like(df2_pred)
         labeled_df2_pred = measure.label(df2_pred)
-        unique_df2_labels = list(np.unique(labeled_df2_pred))
-        unique_df2_labels.remove(0)
-        for original_df2_label in unique_df2_labels:
-            black_pixels_present = self._check_if_df2_label_is_fully_covered_in_cp_mask(df2_pred = labeled_df2_pred,
-                                                                                       df2_label_id = original_df2_label,
-                                                                                       cp_mask = cp_mask)                                                        
+        bounding_boxes = ndimage.find_objects(labeled_df2_pred)
+        last_assigned_label_id = 0
+        for original_df2_label, bounding_box in enumerate(bounding_boxes, start = 1):
+            if bounding_box == None:
+                continue
+            df2_label_area = labeled_df2_pred[bounding_box] == original_df2_label
+            cp_labels_in_df2_label_area = cp_mask[bounding_box][df2_label_area]
+            black_pixels_present = self._check_if_df2_label_is_fully_covered_in_cp_mask(cp_labels_in_df2_label_area = cp_labels_in_df2_label_area)
             if black_pixels_present:
-                lossless_converted_mask = self._fill_entire_df2_label_area_with_instance_label(df2_pred = labeled_df2_pred, 
-                                                                                              df2_label_id = original_df2_label, 
-                                                                                              cp_mask = cp_mask,
-                                                                                              converted_mask = lossless_converted_mask)
-            else:
-                cp_labels_within_df2_label = np.unique(cp_mask[np.where(labeled_df2_pred == original_df2_label)])
-                tmp_cp_mask = cp_mask.copy()
-                tmp_cp_mask[np.where(labeled_df2_pred != original_df2_label)] = 0
-                for cp_label_id in cp_labels_within_df2_label:
-                    next_label_id = lossless_converted_mask.max() + 1
-                    lossless_converted_mask[np.where(tmp_cp_mask == cp_label_id)] = next_label_id
+                cp_labels_in_df2_label_area = self._fill_entire_df2_label_area_with_instance_label(df2_pred = labeled_df2_pred,
+                                                                                                  df2_label_id = original_df2_label,
+                                                                                                  cp_mask = cp_mask,
+                                                                                                  bounding_box = bounding_box)
+            unique_cp_labels, new_label_id_indices = np.unique(cp_labels_in_df2_label_area, return_inverse = True)
+            lossless_converted_mask[bounding_box][df2_label_area] = last_assigned_label_id + 1 + new_label_id_indices.reshape(-1)
+            last_assigned_label_id += unique_cp_labels.shape[0]
         return lossless_converted_mask
 
 
-    def _check_if_df2_label_is_fully_covered_in_cp_mask(self, df2_pred: np.ndarray, df2_label_id: int, cp_mask: np.ndarray) -> bool:
-        cp_labels_within_df2_label = np.unique(cp_mask[np.where(df2_pred == df2_label_id)])
-        if 0 in cp_labels_within_df2_label:
+    def _check_if_df2_label_is_fully_covered_in_cp_mask(self, cp_labels_in_df2_label_area: np.ndarray) -> bool:
+        if (cp_labels_in_df2_label_area == 0).any():
             black_pixels_present = True
         else:
             black_pixels_present = False
         return black_pixels_present
 
 
-    def _fill_entire_df2_label_area_with_instance_label(self, df2_pred: np.ndarray, df2_label_id: int, cp_mask: np.ndarray, converted_mask: np.ndarray) -> np.ndarray:
-        cp_labels_within_df2_label = list(np.unique(cp_mask[np.where(df2_pred == df2_label_id)]))
-        cp_labels_within_df2_label.remove(0)
-        if len(cp_labels_within_df2_label) > 0:
-            expanded_cp_mask = cp_mask.copy()
-            expanded_cp_mask[np.where(df2_pred != df2_label_id)] = 0
-            black_pixels_present, expansion_distance = True, 0
-            while black_pixels_present:
-                expansion_distance += 500
-                expanded_cp_mask = segmentation.expand_labels(expanded_cp_mask, distance = expansion_distance)
-                black_pixels_present = self._check_if_df2_label_is_fully_covered_in_cp_mask(df2_pred = df2_pred,
-                                                                                           df2_label_id = df2_label_id,
-                                                                                           cp_mask = expanded_cp_mask)
-            # remove all overflow pixels
-            expanded_cp_mask[np.where(df2_pred != df2_label_id)] = 0
-            for cp_label_id in cp_labels_within_df2_label:
-                next_label_id = converted_mask.max() + 1
-                converted_mask[np.where(expanded_cp_mask == cp_label_id)] = next_label_id
-        else:
-            next_label_id = converted_mask.max() + 1
-            converted_mask[np.where(df2_pred == df2_label_id)] = next_label_id        
-        return converted_mask
+    def _fill_entire_df2_label_area_with_instance_label(self, df2_pred: np.ndarray, df2_label_id: int, cp_mask: np.ndarray, bounding_box: Tuple[slice, slice]) -> np.ndarray:
+        """
+        Expands the cellpose labels within the deepflash2 feature until they cover its entire area and returns 
+        the expanded cellpose label ids of all pixels of the feature. If there are no cellpose labels within the 
+        feature, all its pixels are returned as background (i.e. it will become a single instance label).
+        """
+        df2_label_area = df2_pred[bounding_box] == df2_label_id
+        expanded_cp_mask = cp_mask[bounding_box].copy()
+        expanded_cp_mask[~df2_label_area] = 0
+        if expanded_cp_mask.max() > 0:
+            # all cellpose labels lie within the bounding box, so no pixel outside of it can be closer to any of them:
+            expanded_cp_mask = segmentation.expand_labels(expanded_cp_mask, distance = 500)
+            if self._check_if_df2_label_is_fully_covered_in_cp_mask(cp_labels_in_df2_label_area = expanded_cp_mask[df2_label_area]):
+                # some pixels are more than 500 px away from all cellpose labels - this requires the stepwise expansion on the entire mask:
+                expanded_cp_mask = self._expand_cp_labels_stepwise_in_entire_mask(df2_pred = df2_pred, df2_label_id = df2_label_id, cp_mask = cp_mask)[bounding_box]
+        return expanded_cp_mask[df2_label_area]
+
+
+    def _expand_cp_labels_stepwise_in_entire_mask(self, df2_pred: np.ndarray, df2_label_id: int, cp_mask: np.ndarray) -> np.ndarray:
+        expanded_cp_mask = cp_mask.copy()
+        expanded_cp_mask[np.where(df2_pred != df2_label_id)] = 0
+        black_pixels_present, expansion_distance = True, 0
+        while black_pixels_present:
+            expansion_distance += 500
+            expanded_cp_mask = segmentation.expand_labels(expanded_cp_mask, distance = expansion_distance)
+            black_pixels_present = self._check_if_df2_label_is_fully_covered_in_cp_mask(cp_labels_in_df2_label_area = expanded_cp_mask[np.where(df2_pred == df2_label_id)])
+        expanded_cp_mask[np.where(df2_pred != df2_label_id)] = 0
+        return expanded_cp_mask
 
     def _add_strategy_specific_infos_to_updates(self, updates: Dict) -> Dict:
         updates['instance_segmentations_done'] = True
@@ -0,0 +1,346 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/10_storage.ipynb.
+
+# %% auto 0
+__all__ = ['StackStorage', 'PNGStackStorage', 'ZarrStackStorage', 'StackStorageSpecs', 'get_stack_storage']
+
+# %% ../nbs/api/10_storage.ipynb 2
+from abc import ABC, abstractmethod
+from typing import List, Optional, Dict, Union
+from pathlib import Path, PosixPath, WindowsPath
+import shutil
+import os
+import hashlib
+
+import numpy as np
+import zarr
+from skimage import io
+
+from .configs import DefaultConfigs
+from . import utils
+
+# %% ../nbs/api/10_storage.ipynb 4
+class StackStorage(ABC):
+    
+    """
+    Defines how the image and segmentation mask stacks of a file (i.e. arrays with the planes 
+    as first dimension) are saved to and loaded from the processing subdirectories of a 
+    *findmycells* project (e.g. preprocessed images, semantic or instance segmentations, 
+    quantified segmentations). All processing steps access these stacks via the storage 
+    backend that is selected in the project configs (see `get_stack_storage()`).
+    """
+    
+    @abstractmethod
+    def save_stack(self,
+                   dir_path: Union[PosixPath, WindowsPath], # processing subdirectory to save the stack in
+                   file_id: str,
+                   stack: np.ndarray, # planes have to be the first dimension
+                   filename_suffix: str='' # only relevant if single plane image files are written
+                  ) -> None:
+        pass
+    
+    
+    @abstractmethod
+    def load_stack(self,
+                   dir_path: Union[PosixPath, WindowsPath], # processing subdirectory to load the stack from
+                   file_id: str,
+                   minx: Optional[int]=None, # like in `utils.load_zstack_as_array_from_single_planes`: row indices ..
+                   maxx: Optional[int]=None,
+                   miny: Optional[int]=None, # .. and column indices to crop each plane to
+                   maxy: Optional[int]=None
+                  ) -> np.ndarray:
+        pass
+    
+    
+    @abstractmethod
+    def has_stack(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> bool:
+        pass
+    
+    
+    @abstractmethod
+    def get_plane_count(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> int:
+        pass
+    
+    
+    @abstractmethod
+    def delete_stack(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> None:
+        pass
+    
+    
+    @abstractmethod
+    def get_fingerprint(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> str:
+        """
+        Returns a hash of the names, sizes and modification times of all files that make up the 
+        stack. It will therefore change whenever the stack is (re-)saved or deleted, without 
+        having to read its content.
+        """
+        pass
+    
+    
+    def _compute_fingerprint_of_filepaths(self, 
+                                          filepaths: List[Union[PosixPath, WindowsPath]],
+                                          root_dir_path: Optional[Union[PosixPath, WindowsPath]]=None # identify files by their path relative to it (default: filename)
+                                         ) -> str:
+        hash_object = hashlib.md5()
+        for filepath in sorted(filepaths):
+            file_stats = filepath.stat()
+            file_identifier = filepath.name if root_dir_path == None else filepath.relative_to(root_dir_path).as_posix()
+            hash_object.update(f'{file_identifier}:{file_stats.st_size}:{file_stats.st_mtime_ns};'.encode())
+        return hash_object.hexdigest()
+    
+    
+    def export_stack_as_png_files(self,
+                                  dir_path: Union[PosixPath, WindowsPath],
+                                  file_id: str,
+                                  target_dir_path: Union[PosixPath, WindowsPath],
+                                  link_files: bool=False # link instead of copy already existing PNG files, if possible (e.g. as read-only input)
+                                 ) -> None:
+        """
+        Writes each plane of the stack as individual PNG file ("{file_id}-{plane_idx:03d}.png") 
+        to the target directory, for instance as input for external segmentation tools.
+        """
+        stack = self.load_stack(dir_path = dir_path, file_id = file_id)
+        PNGStackStorage().save_stack(dir_path = target_dir_path, file_id = file_id, stack = stack)
+        
+        
+    def import_png_files(self,
+                         png_filepaths: List[Union[PosixPath, WindowsPath]], # single plane images of one file, e.g. created by external segmentation tools
+                         dir_path: Union[PosixPath, WindowsPath],
+                         file_id: str
+                        ) -> None:
+        """
+        Counterpart of `export_stack_as_png_files()`. The single plane PNG files will be removed 
+        once their content was saved.
+        """
+        stack = np.asarray([io.imread(filepath) for filepath in sorted(png_filepaths)])
+        self.save_stack(dir_path = dir_path, file_id = file_id, stack = stack)
+        for filepath in png_filepaths:
+            filepath.unlink()
+
+# %% ../nbs/api/10_storage.ipynb 5
+class PNGStackStorage(StackStorage):
+    
+    """
+    Saves each plane of a stack as individual PNG file ("{file_id}-{plane_idx:03d}{filename_suffix}.png").
+    This is the default storage backend of *findmycells*.
+    """
+    
+    def save_stack(self,
+                   dir_path: Union[PosixPath, WindowsPath],
+                   file_id: str,
+                   stack: np.ndarray,
+                   filename_suffix: str=''
+                  ) -> None:
+        for plane_index in range(stack.shape[0]):
+            filepath = dir_path.joinpath(f'{file_id}-{str(plane_index).zfill(3)}{filename_suffix}.png')
+            io.imsave(filepath, stack[plane_index], check_contrast = False)
+            
+            
+    def load_stack(self,
+                   dir_path: Union[PosixPath, WindowsPath],
+                   file_id: str,
+                   minx: Optional[int]=None,
+                   maxx: Optional[int]=None,
+                   miny: Optional[int]=None,
+                   maxy: Optional[int]=None
+                  ) -> np.ndarray:
+        return utils.load_zstack_as_array_from_single_planes(path = dir_path, file_id = file_id, minx = minx, maxx = maxx, miny = miny, maxy = maxy)
+    
+    
+    def has_stack(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> bool:
+        return len(self._get_matching_png_filepaths(dir_path = dir_path, file_id = file_id)) > 0
+    
+    
+    def get_plane_count(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> int:
+        return len(self._get_matching_png_filepaths(dir_path = dir_path, file_id = file_id))
+    
+    
+    def delete_stack(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> None:
+        for filepath in self._get_matching_png_filepaths(dir_path = dir_path, file_id = file_id):
+            filepath.unlink()
+            
+            
+    def get_fingerprint(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> str:
+        return self._compute_fingerprint_of_filepaths(filepaths = self._get_matching_png_filepaths(dir_path = dir_path, file_id = file_id))
+            
+            
+    def export_stack_as_png_files(self,
+                                  dir_path: Union[PosixPath, WindowsPath],
+                                  file_id: str,
+                                  target_dir_path: Union[PosixPath, WindowsPath],
+                                  link_files: bool=False
+                                 ) -> None:
+        # no need to decode & re-encode the images, simply link or copy the files:
+        for filepath in self._get_matching_png_filepaths(dir_path = dir_path, file_id = file_id):
+            if link_files == True:
+                self._link_or_copy_file(source_filepath = filepath, target_filepath = target_dir_path.joinpath(filepath.name))
+            else:
+                shutil.copy(filepath, target_dir_path)
+
+
+    def _link_or_copy_file(self, source_filepath: Union[PosixPath, WindowsPath], target_filepath: Union[PosixPath, WindowsPath]) -> None:
+        """
+        Creates a hardlink, or - if not supported (e.g. across file systems) - a symlink. 
+        The file will only be copied if neither of both is possible.
+        """
+        if target_filepath.exists() | target_filepath.is_symlink():
+            target_filepath.unlink()
+        try:
+            os.link(source_filepath, target_filepath)
+            return
+        except OSError:
+            pass
+        try:
+            os.symlink(source_filepath.resolve(), target_filepath)
+            return
+        except OSError:
+            pass
+        shutil.copy(source_filepath, target_filepath)
+            
+            
+    def import_png_files(self,
+                         png_filepaths: List[Union[PosixPath, WindowsPath]],
+                         dir_path: Union[PosixPath, WindowsPath],
+                         file_id: str
+                        ) -> None:
+        for filepath in png_filepaths:
+            target_filepath = dir_path.joinpath(filepath.name)
+            if target_filepath.is_file() == True:
+                target_filepath.unlink()
+            shutil.move(filepath, dir_path)
+            
+            
+    def _get_matching_png_filepaths(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> List[Union[PosixPath, WindowsPath]]:
+        if dir_path.is_dir() == False:
+            return []
+        return [filepath for filepath in utils.list_dir_no_hidden(path = dir_path, only_files = True) 
+                if filepath.name.startswith(file_id) & (filepath.suffix == '.png')]
+
+# %% ../nbs/api/10_storage.ipynb 6
+class ZarrStackStorage(StackStorage):
+    
+    """
+    Saves the entire stack of a file as chunked & compressed Zarr array ("{file_id}.zarr"), with 
+    each chunk covering (at most) "chunk_size" x "chunk_size" pixels of a single plane. Hence, 
+    stacks can be looked up directly by their file_id and cropped regions can be loaded without 
+    reading the entire stack. If "export_png" is True, all planes are in addition saved as 
+    individual PNG files (see `PNGStackStorage`), e.g. to look at them with any image viewer.
+    """
+    
+    def __init__(self, chunk_size: int=512, export_png: bool=False) -> None:
+        self.chunk_size = chunk_size
+        self.export_png = export_png
+        
+        
+    def save_stack(self,
+                   dir_path: Union[PosixPath, WindowsPath],
+                   file_id: str,
+                   stack: np.ndarray,
+                   filename_suffix: str=''
+                  ) -> None:
+        chunks = (1, min(self.chunk_size, stack.shape[1]), min(self.chunk_size, stack.shape[2])) + stack.shape[3:]
+        zarr_array = zarr.open_array(store = str(self._get_zarr_path(dir_path = dir_path, file_id = file_id)),
+                                     mode = 'w',
+                                     shape = stack.shape,
+                                     chunks = chunks,
+                                     dtype = stack.dtype)
+        zarr_array[:] = stack
+        if self.export_png == True:
+            PNGStackStorage().save_stack(dir_path = dir_path, file_id = file_id, stack = stack, filename_suffix = filename_suffix)
+            
+            
+    def load_stack(self,
+                   dir_path: Union[PosixPath, WindowsPath],
+                   file_id: str,
+                   minx: Optional[int]=None,
+                   maxx: Optional[int]=None,
+                   miny: Optional[int]=None,
+                   maxy: Optional[int]=None
+                  ) -> np.ndarray:
+        zarr_array = zarr.open_array(store = str(self._get_zarr_path(dir_path = dir_path, file_id = file_id)), mode = 'r')
+        return zarr_array[:, minx:maxx, miny:maxy]
+    
+    
+    def has_stack(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> bool:
+        return self._get_zarr_path(dir_path = dir_path, file_id = file_id).is_dir()
+    
+    
+    def get_plane_count(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> int:
+        if self.has_stack(dir_path = dir_path, file_id = file_id) == False:
+            return 0
+        zarr_array = zarr.open_array(store = str(self._get_zarr_path(dir_path = dir_path, file_id = file_id)), mode = 'r')
+        return zarr_array.shape[0]
+    
+    
+    def delete_stack(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> None:
+        if self.has_stack(dir_path = dir_path, file_id = file_id) == True:
+            shutil.rmtree(self._get_zarr_path(dir_path = dir_path, file_id = file_id))
+        PNGStackStorage().delete_stack(dir_path = dir_path, file_id = file_id)
+        
+        
+    def get_fingerprint(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> str:
+        zarr_path = self._get_zarr_path(dir_path = dir_path, file_id = file_id)
+        if zarr_path.is_dir() == False:
+            return self._compute_fingerprint_of_filepaths(filepaths = [])
+        # chunk files are only identified by their path in the zarr dir (e.g. "c/0/1/0"):
+        return self._compute_fingerprint_of_filepaths(filepaths = [filepath for filepath in zarr_path.rglob('*') if filepath.is_file()],
+                                                      root_dir_path = zarr_path)
+        
+        
+    def export_stack_as_png_files(self,
+                                  dir_path: Union[PosixPath, WindowsPath],
+                                  file_id: str,
+                                  target_dir_path: Union[PosixPath, WindowsPath],
+                                  link_files: bool=False
+                                 ) -> None:
+        png_stack_storage = PNGStackStorage()
+        if png_stack_storage.get_plane_count(dir_path = dir_path, file_id = file_id) == self.get_plane_count(dir_path = dir_path, file_id = file_id):
+            # PNG files were exported already upon saving (i.e. "export_png" was True):
+            png_stack_storage.export_stack_as_png_files(dir_path = dir_path, file_id = file_id, target_dir_path = target_dir_path, link_files = link_files)
+        else:
+            super().export_stack_as_png_files(dir_path = dir_path, file_id = file_id, target_dir_path = target_dir_path, link_files = link_files)
+        
+        
+    def _get_zarr_path(self, dir_path: Union[PosixPath, WindowsPath], file_id: str) -> Union[PosixPath, WindowsPath]:
+        return dir_path.joinpath(f'{file_id}.zarr')
+
+# %% ../nbs/api/10_storage.ipynb 7
+class StackStorageSpecs:
+    
+    """
+    Specifies the configuration options for the storage backend of a project. 
+    Use `API.set_stack_storage_configs()` to change them - preferably before 
+    any processing was done, as stacks that were already saved using another 
+    backend will not be converted.
+    """
+    
+    @property
+    def default_configs(self) -> DefaultConfigs:
+        default_values = {'backend': 'png',
+                          'chunk_size': 512,
+                          'export_png': False}
+        valid_types = {'backend': [str],
+                       'chunk_size': [int],
+                       'export_png': [bool]}
+        valid_value_ranges = {'chunk_size': (16, 8192, 1)}
+        valid_value_options = {'backend': ('png', 'zarr')}
+        default_configs = DefaultConfigs(default_values = default_values,
+                                         valid_types = valid_types,
+                                         valid_value_ranges = valid_value_ranges,
+                                         valid_value_options = valid_value_options)
+        return default_configs
+
+# %% ../nbs/api/10_storage.ipynb 8
+def get_stack_storage(project_configs: 'ProjectConfigs') -> StackStorage:
+    """
+    Returns the storage backend specified in the "stack_storage" configs of the project.
+    Projects that don´t specify any (e.g. as they were created with an earlier version of 
+    *findmycells*) use the default, which is to save each plane as individual PNG file.
+    """
+    if hasattr(project_configs, 'stack_storage') == True:
+        stack_storage_configs = project_configs.stack_storage
+    else:
+        stack_storage_configs = StackStorageSpecs().default_configs.fill_user_input_with_defaults_where_needed(user_input = {})
+    if stack_storage_configs['backend'] == 'zarr':
+        return ZarrStackStorage(chunk_size = stack_storage_configs['chunk_size'], export_png = stack_storage_configs['export_png'])
+    else:
+        return PNGStackStorage()
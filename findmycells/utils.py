@@ -2,15 +2,17 @@
 
 # %% auto 0
 __all__ = ['list_dir_no_hidden', 'load_zstack_as_array_from_single_planes', 'unpad_x_y_dims_in_3d_array',
-           'get_polygon_from_instance_segmentation', 'download_sample_data']
+           'get_polygon_from_instance_segmentation', 'get_polygons_from_instance_segmentation', 'PolygonCache',
+           'relabel_instance_segmentation_in_place', 'MaskedLabelStacks', 'download_sample_data']
 
 # %% ../nbs/api/99_utils.ipynb 2
-from typing import List, Optional, Union
+from typing import List, Dict, Optional, Tuple, Union, Mapping, Iterator
 from pathlib import Path, PosixPath, WindowsPath
 
 import numpy as np
 from skimage import io
 from skimage import measure
+from scipy import ndimage
 from shapely.geometry import Polygon
 from shapely.validation import make_valid
 
@@ -40,7 +42,7 @@ def load_zstack_as_array_from_single_planes(path: Union[PosixPath, WindowsPath],
             raise TypeError("'minx', 'maxx', 'miny', and 'maxy' all have to be integers - or None if no cropping has to be done")
     else:
         cropping = False
-    matching_filepaths = [filepath for filepath in list_dir_no_hidden(path) if filepath.name.startswith(file_id)]
+    matching_filepaths = sorted([filepath for filepath in list_dir_no_hidden(path, only_files = True) if filepath.name.startswith(file_id)])
     cropped_zstack = []
     for single_plane_filepath in matching_filepaths:
         tmp_image = io.imread(single_plane_filepath)
@@ -55,17 +57,161 @@ def unpad_x_y_dims_in_3d_array(padded_3d_array: np.ndarray, pad_width: int) -> n
     return padded_3d_array[:, pad_width:padded_3d_array.shape[1]-pad_width, pad_width:padded_3d_array.shape[2]-pad_width]
 
 # %% ../nbs/api/99_utils.ipynb 7
-def get_polygon_from_instance_segmentation(single_plane: np.ndarray, label_id: int) -> Polygon:
+def get_polygon_from_instance_segmentation(single_plane: np.ndarray, 
+                                           label_id: int, 
+                                           bounding_box: Optional[Tuple[slice, slice]]=None # e.g. as returned by scipy.ndimage.find_objects
+                                          ) -> Polygon:
+    """
+    If the bounding box of the label is passed, only the area around the label is analyzed, 
+    which yields the exact same polygon as if the entire plane would be used.
+    """
+    if bounding_box == None:
+        row_offset, col_offset = 0, 0
+    else:
+        margin = 2
+        row_offset, col_offset = max(bounding_box[0].start - margin, 0), max(bounding_box[1].start - margin, 0)
+        single_plane = single_plane[row_offset : bounding_box[0].stop + margin, col_offset : bounding_box[1].stop + margin]
     x_dim, y_dim = single_plane.shape
     tmp_array = np.zeros((x_dim, y_dim), dtype='uint8')
     tmp_array[np.where(single_plane == label_id)] = 1
     tmp_contours = measure.find_contours(tmp_array, level = 0)[0]
+    if (row_offset > 0) | (col_offset > 0):
+        tmp_contours = tmp_contours + np.asarray([row_offset, col_offset])
     roi = Polygon(tmp_contours)
     if roi.is_valid == False:
         roi = make_valid(roi)
     return roi
 
 # %% ../nbs/api/99_utils.ipynb 8
+def get_polygons_from_instance_segmentation(single_plane: np.ndarray, label_ids: Optional[List[int]]=None) -> Dict[int, Polygon]:
+    """
+    Returns the polygons of all label ids in the plane (or only of the specified ones) as dictionary.
+    The bounding boxes of all labels are determined in a single pass, such that each contour is computed 
+    only within the bounding box of the respective label.
+    """
+    if label_ids == None:
+        label_ids = np.unique(single_plane)
+        label_ids = label_ids[label_ids != 0]
+    if np.issubdtype(single_plane.dtype, np.integer):
+        bounding_boxes = ndimage.find_objects(single_plane)
+    else:
+        bounding_boxes = ndimage.find_objects(single_plane.astype('int64'))
+    polygons = {}
+    for label_id in label_ids:
+        polygons[label_id] = get_polygon_from_instance_segmentation(single_plane = single_plane,
+                                                                    label_id = label_id,
+                                                                    bounding_box = bounding_boxes[int(label_id) - 1])
+    return polygons
+
+# %% ../nbs/api/99_utils.ipynb 9
+class PolygonCache:
+    """
+    Caches the polygons of instance labels per (file_id, plane_index, label_id, pad_width), such that they need 
+    to be computed only once, for instance during an entire postprocessing run. Whenever the segmentations of a 
+    file are changed, the corresponding entries have to be invalidated (see `invalidate()`) - for postprocessing,
+    this is done by `PostprocessingObject.run_all_strategies()` after each strategy.
+    """
+    
+    def __init__(self) -> None:
+        self.polygons = {}
+        
+        
+    def get_polygons(self, 
+                     file_id: str, 
+                     plane_index: int, 
+                     single_plane: np.ndarray, 
+                     label_ids: Optional[List[int]]=None, 
+                     pad_width: int=0 # if > 0: polygons are computed on the zero-padded plane (i.e. also in its coordinates)
+                    ) -> Dict[int, Polygon]:
+        if label_ids == None:
+            label_ids = np.unique(single_plane)
+            label_ids = label_ids[label_ids != 0]
+        missing_label_ids = [label_id for label_id in label_ids if self.is_cached(file_id, plane_index, label_id, pad_width) == False]
+        if len(missing_label_ids) > 0:
+            if pad_width > 0:
+                single_plane = np.pad(single_plane, pad_width = pad_width, mode = 'constant', constant_values = 0)
+            new_polygons = get_polygons_from_instance_segmentation(single_plane = single_plane, label_ids = missing_label_ids)
+            for label_id, polygon in new_polygons.items():
+                self.polygons[(file_id, plane_index, label_id, pad_width)] = polygon
+        return {label_id: self.polygons[(file_id, plane_index, label_id, pad_width)] for label_id in label_ids}
+    
+    
+    def is_cached(self, file_id: str, plane_index: int, label_id: int, pad_width: int=0) -> bool:
+        return (file_id, plane_index, label_id, pad_width) in self.polygons.keys()
+    
+    
+    def invalidate(self, file_id: str, plane_index: Optional[int]=None) -> None:
+        keys_to_remove = [key for key in self.polygons.keys() if (key[0] == file_id) & ((plane_index == None) or (key[1] == plane_index))]
+        for key in keys_to_remove:
+            self.polygons.pop(key)
+
+# %% ../nbs/api/99_utils.ipynb 10
+def relabel_instance_segmentation_in_place(segmentation: np.ndarray, label_id_mapping: Dict[int, int]) -> np.ndarray:
+    """
+    Replaces all label ids that are keys in "label_id_mapping" with their corresponding values (e.g. with 0 to
+    remove a label), while all other label ids remain unchanged. All replacements are applied simultaneously 
+    using a lookup table, i.e. in a single vectorized pass over the data. The segmentation (a single plane or 
+    an entire stack) is modified in place - plane by plane, such that no copy of the entire stack is created.
+    """
+    if len(label_id_mapping) == 0:
+        return segmentation
+    old_label_ids = np.asarray([int(label_id) for label_id in label_id_mapping.keys()], dtype = 'int64')
+    new_label_ids = np.asarray([int(label_id) for label_id in label_id_mapping.values()], dtype = 'int64')
+    assert (old_label_ids.min() >= 0) & (new_label_ids.min() >= 0), 'Label ids have to be non-negative integers!'
+    highest_label_id = max(int(segmentation.max()), int(old_label_ids.max()))
+    lookup_table = np.arange(highest_label_id + 1, dtype = 'int64')
+    lookup_table[old_label_ids] = new_label_ids
+    lookup_table = lookup_table.astype(segmentation.dtype)
+    planes = [segmentation] if segmentation.ndim == 2 else segmentation
+    for single_plane in planes:
+        if np.issubdtype(single_plane.dtype, np.integer):
+            single_plane[:] = lookup_table[single_plane]
+        else:
+            single_plane[:] = lookup_table[single_plane.astype('int64')]
+    return segmentation
+
+# %% ../nbs/api/99_utils.ipynb 11
+class MaskedLabelStacks(Mapping):
+    """
+    Read-only mapping of area ROI ids to the segmentations of a file in which only the label ids that are kept 
+    for the respective area ROI remain (all others are set to 0). Only a single label stack is held in memory 
+    (and saved), while the masked stacks are created lazily with a lookup table whenever they are accessed.
+    Note: the label stack is not copied - any later in-place change of it also changes the masked stacks 
+    (which is why `PostprocessingObject.run_all_strategies()` does not allow to run strategies afterwards).
+    """
+    
+    def __init__(self, label_stack: np.ndarray, kept_label_ids_per_area_roi_id: Dict[str, np.ndarray]) -> None:
+        self.label_stack = label_stack
+        self.kept_label_ids_per_area_roi_id = {area_roi_id: np.asarray(kept_label_ids, dtype = 'int64') 
+                                               for area_roi_id, kept_label_ids in kept_label_ids_per_area_roi_id.items()}
+        
+        
+    def __getitem__(self, area_roi_id: str) -> np.ndarray:
+        kept_label_ids = self.kept_label_ids_per_area_roi_id[area_roi_id]
+        # determined upon each access, since the label ids in the label stack may have changed in the meantime:
+        highest_label_id = int(self.label_stack.max()) if self.label_stack.size > 0 else 0
+        if kept_label_ids.size > 0:
+            highest_label_id = max(highest_label_id, int(kept_label_ids.max()))
+        lookup_table = np.zeros(highest_label_id + 1, dtype = self.label_stack.dtype)
+        lookup_table[kept_label_ids] = kept_label_ids
+        masked_stack = np.empty_like(self.label_stack)
+        for plane_index in range(self.label_stack.shape[0]):
+            single_plane = self.label_stack[plane_index]
+            if np.issubdtype(single_plane.dtype, np.integer):
+                masked_stack[plane_index] = lookup_table[single_plane]
+            else:
+                masked_stack[plane_index] = lookup_table[single_plane.astype('int64')]
+        return masked_stack
+    
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.kept_label_ids_per_area_roi_id)
+    
+    
+    def __len__(self) -> int:
+        return len(self.kept_label_ids_per_area_roi_id)
+
+# %% ../nbs/api/99_utils.ipynb 12
 def download_sample_data(destination_dir_path: Union[PosixPath, WindowsPath]) -> None:
     """
     Test data for findmycells can be found here: https://zenodo.org/record/7655292#.Y_LI1R-ZNhE